@@ -0,0 +1,171 @@
+"""Frame capture for recording videos of training without slowing down the simulation."""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from collections.abc import Callable
+from fractions import Fraction
+from typing import TYPE_CHECKING, BinaryIO, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Pygame is imported on use so headless training without frame capture does not need a display
+if TYPE_CHECKING:
+    import pygame
+
+# BT.601 studio swing coefficients for converting RGB to Y'CbCr, one row per output plane
+RGB_TO_YCBCR = np.array(
+    [
+        [65.481, 128.553, 24.966],
+        [-37.797, -74.203, 112.0],
+        [112.0, -93.786, -18.214],
+    ]
+)
+YCBCR_OFFSETS = np.array([16, 128, 128])
+# Bits of the fixed point coefficients, so the conversion runs in integer arithmetic
+FIXED_POINT_BITS = 16
+# Seconds to wait for space in a full queue before checking the writer thread is still running
+CLOSE_POLL_SECONDS = 0.1
+
+
+def rgb_to_ycbcr(frame: NDArray) -> NDArray:
+    """Convert an RGB frame to planar 4:4:4 Y'CbCr as used by uncompressed Y4M video.
+
+    The conversion uses fixed point integer arithmetic, which is several times faster than floating point and within
+    one level of the exact result.
+
+    :param NDArray frame: RGB frame with shape (height, width, 3)
+    :return NDArray: Y, Cb and Cr planes with shape (3, height, width)
+    """
+    _coefficients = np.rint(RGB_TO_YCBCR / 255 * (1 << FIXED_POINT_BITS)).astype(np.int32)
+    _channels = frame.transpose(2, 0, 1).astype(np.int32)
+    _ycbcr = np.empty(_channels.shape, dtype=np.uint8)
+    for _plane, (_weights, _offset) in enumerate(zip(_coefficients, YCBCR_OFFSETS, strict=True)):
+        _sum = _weights[0] * _channels[0]
+        _sum += _weights[1] * _channels[1]
+        _sum += _weights[2] * _channels[2]
+        _sum += (int(_offset) << FIXED_POINT_BITS) + (1 << (FIXED_POINT_BITS - 1))
+        _sum >>= FIXED_POINT_BITS
+        _ycbcr[_plane] = _sum
+    return _ycbcr
+
+
+class FrameRecorder:
+    """This class copies rendered frames into a bounded queue and encodes them on a writer thread.
+
+    Capturing a frame only copies the surface, so the simulation keeps its pace while the writer thread converts the
+    pixels and saves an image sequence or an uncompressed Y4M video. If the writer falls behind and the queue is full,
+    new frames are dropped instead of stalling the simulation.
+    """
+
+    def __init__(self, path: str, width: int, height: int, fps: float, output_format: str, queue_size: int) -> None:
+        """Initialise FrameRecorder.
+
+        :param str path: Directory for a PNG image sequence, or file for a Y4M video
+        :param int width: Frame width
+        :param int height: Frame height
+        :param float fps: Frame rate of the video
+        :param str output_format: Output format, either "png" or "y4m"
+        :param int queue_size: Maximum number of frames waiting to be written
+        """
+        self._path = path
+        self._width = width
+        self._height = height
+        self._fps = fps
+        self._output_format = output_format
+        self._write_frame: Callable[[pygame.Surface], None] = {
+            "png": self._write_png_frame,
+            "y4m": self._write_y4m_frame,
+        }[output_format]
+        self._video: BinaryIO | None = None
+        self._queue: queue.Queue[pygame.Surface | None] = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._write_frames, name="frame-writer", daemon=True)
+        self._written = 0
+        self._dropped = 0
+        self._error: Exception | None = None
+
+    @property
+    def written(self) -> int:
+        """Get number of frames written."""
+        return self._written
+
+    @property
+    def dropped(self) -> int:
+        """Get number of frames dropped because the queue was full."""
+        return self._dropped
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._output_format == "png":
+            os.makedirs(self._path, exist_ok=True)
+        else:
+            self._video = open(self._path, "wb")
+            # Y4M stores the frame rate as a ratio, so rates such as 60 / 7 are written exactly instead of rounded
+            _rate = Fraction(self._fps).limit_denominator()
+            _header = f"YUV4MPEG2 W{self._width} H{self._height} F{_rate.numerator}:{_rate.denominator} Ip A1:1 C444\n"
+            self._video.write(_header.encode())
+        self._thread.start()
+
+    def capture(self, surface: pygame.Surface) -> bool:
+        """Copy a rendered surface into the queue, dropping it if the queue is full.
+
+        :param pygame.Surface surface: Surface to capture
+        :return bool: Whether the frame was queued
+        """
+        try:
+            self._queue.put_nowait(surface.copy())
+        except queue.Full:
+            self._dropped += 1
+            return False
+        return True
+
+    def close(self) -> None:
+        """Write the frames left in the queue, stop the writer thread and close the video file.
+
+        :raises Exception: The error that stopped the writer thread, if it failed to write a frame
+        """
+        # A writer thread that has stopped no longer empties the queue, so only wait for space while it runs
+        while self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=CLOSE_POLL_SECONDS)
+                break
+            except queue.Full:
+                continue
+        self._thread.join()
+        if self._video:
+            self._video.close()
+        if self._error is not None:
+            raise self._error
+
+    def _write_frames(self) -> None:
+        """Write frames from the queue until the recorder is closed, keeping any error for `close` to raise."""
+        try:
+            while (_frame := self._queue.get()) is not None:
+                self._write_frame(_frame)
+                self._written += 1
+        except Exception as error:
+            self._error = error
+
+    def _write_y4m_frame(self, frame: pygame.Surface) -> None:
+        """Append a frame to the Y4M video.
+
+        :param pygame.Surface frame: Captured frame
+        """
+        import pygame  # noqa: PLC0415
+
+        _video = cast(BinaryIO, self._video)
+        _rgb = np.frombuffer(pygame.image.tobytes(frame, "RGB"), dtype=np.uint8).reshape(self._height, self._width, 3)
+        _video.write(b"FRAME\n")
+        _video.write(rgb_to_ycbcr(_rgb).tobytes())
+
+    def _write_png_frame(self, frame: pygame.Surface) -> None:
+        """Save a frame as the next PNG image of the sequence.
+
+        :param pygame.Surface frame: Captured frame
+        """
+        import pygame  # noqa: PLC0415
+
+        pygame.image.save(frame, os.path.join(self._path, f"frame_{self._written:06d}.png"))
@@ -0,0 +1,399 @@
+"""Distributed evaluation of Birds over TCP, with a coordinator handing batches of networks to worker processes."""
+
+from __future__ import annotations
+
+import selectors
+import socket
+import struct
+import time
+from collections import deque
+from itertools import pairwise
+
+import numpy as np
+from numpy.typing import NDArray
+
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork, PopulationNetwork
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.objects.world import World
+
+# Every message starts with its type and the length of its payload, in network byte order
+FRAME_HEADER = struct.Struct("!BI")
+TASK = 1
+RESULT = 2
+# Game settings sent with each task, one int32 per field
+GAME_SETTINGS = ["x_lim", "y_lim", "fps", "num_frames", "bird_x", "bird_y", "bird_size", "timestep"]
+# Task payload: task ID, number of Birds, Courses and layers, precision and game settings. The Course seeds, layer
+# sizes, activations and the parameters of each layer follow as little-endian arrays
+TASK_HEADER = struct.Struct(f"!IIHHB{len(GAME_SETTINGS)}i")
+PRECISIONS = ["float64", "float32"]
+ACTIVATIONS = list(PolicyNetwork.ACTIVATIONS)
+# Result payload: task ID, number of Birds and Courses and the reason the game ended, followed by the int32 scores
+RESULT_HEADER = struct.Struct("!IIHB")
+ENDS = ["lifetime", "extinct"]
+# Seconds to wait for results before checking for slow workers
+POLL_SECONDS = 0.1
+
+
+def receive_exactly(sock: socket.socket, num_bytes: int) -> bytes:
+    """Receive a number of bytes from a socket.
+
+    :param socket.socket sock: Socket to receive from
+    :param int num_bytes: Number of bytes to receive
+    :return bytes: Received bytes
+    :raises ConnectionError: If the socket is closed before every byte is received
+    """
+    _buffer = bytearray(num_bytes)
+    _view = memoryview(_buffer)
+    _received = 0
+    while _received < num_bytes:
+        if not (_count := sock.recv_into(_view[_received:])):
+            msg = "Connection closed mid-message"
+            raise ConnectionError(msg)
+        _received += _count
+    return bytes(_buffer)
+
+
+def send_message(sock: socket.socket, message_type: int, payload: bytes) -> None:
+    """Send a framed message.
+
+    :param socket.socket sock: Socket to send to
+    :param int message_type: Type of message
+    :param bytes payload: Message payload
+    """
+    sock.sendall(FRAME_HEADER.pack(message_type, len(payload)) + payload)
+
+
+def receive_message(sock: socket.socket) -> tuple[int, bytes]:
+    """Receive a framed message.
+
+    :param socket.socket sock: Socket to receive from
+    :return tuple[int, bytes]: Type of message and payload
+    """
+    _message_type, _length = FRAME_HEADER.unpack(receive_exactly(sock, FRAME_HEADER.size))
+    return _message_type, receive_exactly(sock, _length)
+
+
+def read_array(payload: bytes, offset: int, dtype: str, shape: tuple[int, ...]) -> tuple[NDArray, int]:
+    """Read an array from a payload without copying.
+
+    :param bytes payload: Message payload
+    :param int offset: Byte offset of the array
+    :param str dtype: Data type of the array
+    :param tuple[int, ...] shape: Shape of the array
+    :return tuple[NDArray, int]: Read-only array and the byte offset after it
+    """
+    _array = np.frombuffer(payload, dtype=dtype, count=int(np.prod(shape)), offset=offset).reshape(shape)
+    return _array, offset + _array.nbytes
+
+
+def encode_task(task_id: int, seeds: list[int], network: PopulationNetwork, settings: dict[str, int]) -> bytes:
+    """Encode a batch of networks to play on a set of Courses.
+
+    :param int task_id: ID of the task
+    :param list[int] seeds: Seed of each Course
+    :param PopulationNetwork network: Stacked neural networks of the Birds in the batch
+    :param dict[str, int] settings: Game settings, with a value for each field of `GAME_SETTINGS`
+    :return bytes: Task payload
+    """
+    _dtype = np.dtype(network.precision).newbyteorder("<")
+    _layer_sizes = [network._weights[0].shape[2], *[_weights.shape[1] for _weights in network._weights]]
+    _parts = [
+        TASK_HEADER.pack(
+            task_id,
+            network._weights[0].shape[0],
+            len(seeds),
+            len(network._weights),
+            PRECISIONS.index(network.precision),
+            *[settings[_field] for _field in GAME_SETTINGS],
+        ),
+        np.array(seeds, dtype="<u4").tobytes(),
+        np.array(_layer_sizes, dtype="<u2").tobytes(),
+        np.array([ACTIVATIONS.index(_activation) for _activation in network._activations], dtype="u1").tobytes(),
+    ]
+    for _weights, _biases in zip(network._weights, network._biases, strict=True):
+        _parts.extend([_weights.astype(_dtype).tobytes(), _biases.astype(_dtype).tobytes()])
+    return b"".join(_parts)
+
+
+def decode_task(payload: bytes) -> tuple[int, list[int], PopulationNetwork, dict[str, int]]:
+    """Decode a batch of networks to play on a set of Courses.
+
+    :param bytes payload: Task payload
+    :return tuple[int, list[int], PopulationNetwork, dict[str, int]]: ID of the task, seed of each Course, stacked
+        neural networks of the Birds and game settings
+    """
+    _task_id, _num_birds, _num_courses, _num_layers, _precision, *_settings = TASK_HEADER.unpack_from(payload)
+    _dtype = np.dtype(PRECISIONS[_precision]).newbyteorder("<").str
+    _seeds, _offset = read_array(payload, TASK_HEADER.size, "<u4", (_num_courses,))
+    _layer_sizes, _offset = read_array(payload, _offset, "<u2", (_num_layers + 1,))
+    _activations, _offset = read_array(payload, _offset, "u1", (_num_layers,))
+
+    _weights = []
+    _biases = []
+    for _inputs, _outputs in pairwise(_layer_sizes):
+        _layer_weights, _offset = read_array(payload, _offset, _dtype, (_num_birds, int(_outputs), int(_inputs)))
+        _layer_biases, _offset = read_array(payload, _offset, _dtype, (_num_birds, int(_outputs)))
+        _weights.append(_layer_weights)
+        _biases.append(_layer_biases)
+
+    _network = PopulationNetwork(_weights, _biases, [ACTIVATIONS[_code] for _code in _activations])
+    return _task_id, _seeds.tolist(), _network, dict(zip(GAME_SETTINGS, _settings, strict=True))
+
+
+def encode_result(task_id: int, scores: NDArray, end: str) -> bytes:
+    """Encode the scores of a batch of Birds.
+
+    :param int task_id: ID of the task
+    :param NDArray scores: Score of each Bird on each Course, with shape (num_courses, num_birds)
+    :param str end: Reason the game ended, either "lifetime" or "extinct"
+    :return bytes: Result payload
+    """
+    _num_courses, _num_birds = scores.shape
+    return RESULT_HEADER.pack(task_id, _num_birds, _num_courses, ENDS.index(end)) + scores.astype("<i4").tobytes()
+
+
+def decode_result(payload: bytes) -> tuple[int, NDArray, str]:
+    """Decode the scores of a batch of Birds.
+
+    :param bytes payload: Result payload
+    :return tuple[int, NDArray, str]: ID of the task, score of each Bird on each Course and the reason the game ended
+    """
+    _task_id, _num_birds, _num_courses, _end = RESULT_HEADER.unpack_from(payload)
+    _scores, _ = read_array(payload, RESULT_HEADER.size, "<i4", (_num_courses, _num_birds))
+    return _task_id, _scores, ENDS[_end]
+
+
+def play_task(seeds: list[int], network: PopulationNetwork, settings: dict[str, int]) -> tuple[NDArray, str]:
+    """Play a batch of Birds on every Course until they have all died or the lifetime has run out.
+
+    :param list[int] seeds: Seed of each Course
+    :param PopulationNetwork network: Stacked neural networks of the Birds
+    :param dict[str, int] settings: Game settings, with a value for each field of `GAME_SETTINGS`
+    :return tuple[NDArray, str]: Score of each Bird on each Course and the reason the game ended
+    """
+    world = World(
+        [Course.generate(_seed, settings["y_lim"], settings["fps"], settings["num_frames"]) for _seed in seeds],
+        network._weights[0].shape[0],
+        settings["x_lim"],
+        settings["y_lim"],
+        settings["num_frames"],
+        settings["bird_x"],
+        settings["bird_y"],
+        settings["bird_size"],
+        settings["timestep"],
+        network.precision,
+    )
+    while not world.done:
+        world.step_policy(network.jumps)
+    return world._score, "lifetime" if world._frame >= world._num_frames else "extinct"
+
+
+def run_worker(host: str, port: int) -> int:
+    """Connect to a coordinator and play the batches of Birds it sends until it closes the connection.
+
+    :param str host: Host of the coordinator
+    :param int port: Port of the coordinator
+    :return int: Number of batches played
+    :raises ValueError: If the coordinator sends a message other than a task
+    """
+    _num_tasks = 0
+    with socket.create_connection((host, port)) as _sock:
+        _sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        while True:
+            try:
+                _message_type, _payload = receive_message(_sock)
+            except ConnectionError:
+                return _num_tasks
+            if _message_type != TASK:
+                msg = f"Expected a task message, got message type {_message_type}"
+                raise ValueError(msg)
+            _task_id, _seeds, _network, _settings = decode_task(_payload)
+            _scores, _end = play_task(_seeds, _network, _settings)
+            send_message(_sock, RESULT, encode_result(_task_id, _scores, _end))
+            _num_tasks += 1
+
+
+class Coordinator:
+    """This class hands batches of Birds to worker processes connected over TCP and gathers their scores.
+
+    Workers pull work: each idle worker is sent the next batch, so fast workers play more batches than slow ones. A
+    batch is sent to another worker once it has been out for longer than the timeout, and the first result to arrive is
+    kept. Batches held by a worker that disconnects or sends a malformed result are sent again, and batches are played
+    on the coordinator while no workers are connected or every worker has been busy for longer than the timeout.
+
+    Workers can connect or disconnect at any time. Everything runs on the calling thread, with new connections
+    accepted while waiting for results.
+    """
+
+    def __init__(self, port: int, host: str = "127.0.0.1", batch_size: int = 64, timeout: float = 30.0) -> None:
+        """Initialise Coordinator and listen for workers.
+
+        :param int port: Port to listen on, or 0 to pick a free port
+        :param str host: Host to bind to
+        :param int batch_size: Number of Birds sent to a worker at once
+        :param float timeout: Seconds a batch can be out before it is sent to another worker
+        """
+        self._batch_size = batch_size
+        self._timeout = timeout
+        self._server = socket.create_server((host, port))
+        self._server.settimeout(0)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._server, selectors.EVENT_READ)
+        self._workers: list[socket.socket] = []
+        # Task each worker is playing and when it was sent, kept across evaluations so late results from slow workers
+        # are recognised
+        self._busy: dict[socket.socket, tuple[int, float]] = {}
+        self._next_task_id = 0
+
+    @property
+    def port(self) -> int:
+        """Get the port the coordinator is listening on."""
+        return int(self._server.getsockname()[1])
+
+    @property
+    def num_workers(self) -> int:
+        """Get number of connected workers."""
+        return len(self._workers)
+
+    def _accept(self) -> None:
+        """Accept a worker connecting to the coordinator."""
+        _worker, _ = self._server.accept()
+        _worker.settimeout(self._timeout)
+        _worker.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._workers.append(_worker)
+        self._selector.register(_worker, selectors.EVENT_READ)
+
+    def _drop(self, worker: socket.socket) -> None:
+        """Disconnect a worker.
+
+        :param socket.socket worker: Worker to disconnect
+        """
+        self._selector.unregister(worker)
+        self._workers.remove(worker)
+        self._busy.pop(worker, None)
+        worker.close()
+
+    def _poll(self, timeout: float) -> list[tuple[socket.socket, tuple[int, NDArray, str]]]:
+        """Accept new workers and receive the results that have arrived.
+
+        :param float timeout: Seconds to wait for a connection or result
+        :return list[tuple[socket.socket, tuple[int, NDArray, str]]]: Worker and decoded result of each arrival
+        """
+        _results = []
+        for _key, _ in self._selector.select(timeout):
+            if _key.fileobj is self._server:
+                self._accept()
+                continue
+            _worker: socket.socket = _key.fileobj  # type: ignore[assignment]
+            try:
+                _message_type, _payload = receive_message(_worker)
+                if _message_type != RESULT:
+                    msg = f"Expected a result message, got message type {_message_type}"
+                    raise ConnectionError(msg)
+                _result = decode_result(_payload)
+            except (OSError, struct.error, ValueError, IndexError):
+                self._drop(_worker)
+                continue
+            self._busy.pop(_worker, None)
+            _results.append((_worker, _result))
+        return _results
+
+    def _stalled(self, now: float) -> bool:
+        """Check if no connected worker can take a batch soon, as each has held its task for longer than the timeout.
+
+        :param float now: Current monotonic time
+        :return bool: Whether every connected worker is stalled, which is also the case with no workers
+        """
+        return all(_worker in self._busy and now - self._busy[_worker][1] > self._timeout for _worker in self._workers)
+
+    def wait_for_workers(self, num_workers: int, timeout: float | None = None) -> int:
+        """Wait until a number of workers have connected.
+
+        :param int num_workers: Number of workers to wait for
+        :param float | None timeout: Seconds to wait, or None to wait until they connect
+        :return int: Number of connected workers
+        """
+        _deadline = None if timeout is None else time.monotonic() + timeout
+        while self.num_workers < num_workers:
+            _remaining = POLL_SECONDS if _deadline is None else min(POLL_SECONDS, _deadline - time.monotonic())
+            if _remaining <= 0:
+                break
+            self._poll(_remaining)
+        return self.num_workers
+
+    def evaluate(self, seeds: list[int], network: PopulationNetwork, settings: dict[str, int]) -> tuple[NDArray, str]:
+        """Play every Bird on every Course, split into batches across the workers.
+
+        :param list[int] seeds: Seed of each Course
+        :param PopulationNetwork network: Stacked neural networks of the Birds
+        :param dict[str, int] settings: Game settings, with a value for each field of `GAME_SETTINGS`
+        :return tuple[NDArray, str]: Score of each Bird on each Course and the reason the game ended, which is
+            "lifetime" if any Bird lasted the whole lifetime
+        """
+        _num_birds = network._weights[0].shape[0]
+        _batches = [
+            slice(_start, min(_start + self._batch_size, _num_birds))
+            for _start in range(0, _num_birds, self._batch_size)
+        ]
+        _scores = np.zeros((len(seeds), _num_birds), dtype=int)
+        _ends: dict[int, str] = {}
+        _pending = deque(range(len(_batches)))
+        # Batch and send time of each task sent during this evaluation
+        _tasks: dict[int, tuple[int, float]] = {}
+
+        while len(_ends) < len(_batches):
+            for _worker in [_worker for _worker in self._workers if _worker not in self._busy]:
+                if not _pending:
+                    break
+                _batch = _pending.popleft()
+                try:
+                    send_message(
+                        _worker,
+                        TASK,
+                        encode_task(self._next_task_id, seeds, network.select(_batches[_batch]), settings),
+                    )
+                except OSError:
+                    self._drop(_worker)
+                    _pending.appendleft(_batch)
+                    continue
+                _sent = time.monotonic()
+                self._busy[_worker] = (self._next_task_id, _sent)
+                _tasks[self._next_task_id] = (_batch, _sent)
+                self._next_task_id += 1
+
+            # With no worker able to take a batch, such as a connected worker that never answers, play one here
+            if _pending and self._stalled(time.monotonic()):
+                _batch = _pending.popleft()
+                _scores[:, _batches[_batch]], _ends[_batch] = play_task(
+                    seeds, network.select(_batches[_batch]), settings
+                )
+                continue
+
+            for _worker, (_task_id, _batch_scores, _end) in self._poll(POLL_SECONDS):
+                if _task_id not in _tasks or (_batch := _tasks[_task_id][0]) in _ends:
+                    continue
+                if _batch_scores.shape != _scores[:, _batches[_batch]].shape:
+                    self._drop(_worker)
+                    continue
+                _scores[:, _batches[_batch]] = _batch_scores
+                _ends[_batch] = _end
+
+            # Batches whose workers were lost or are slow go back in the queue, unless they are already in it
+            _out = {_tasks[_task_id] for _task_id, _ in self._busy.values() if _task_id in _tasks}
+            _now = time.monotonic()
+            for _batch in range(len(_batches)):
+                if _batch in _ends or _batch in _pending:
+                    continue
+                _sent_times = [_sent for _out_batch, _sent in _out if _out_batch == _batch]
+                if not _sent_times or _now - max(_sent_times) > self._timeout:
+                    _pending.append(_batch)
+
+        return _scores, "lifetime" if "lifetime" in _ends.values() else "extinct"
+
+    def close(self) -> None:
+        """Disconnect every worker and stop listening."""
+        for _worker in list(self._workers):
+            self._drop(_worker)
+        self._selector.unregister(self._server)
+        self._server.close()
+        self._selector.close()
@@ -0,0 +1,130 @@
+"""Vectorised Flappy Bird environment with a Gymnasium style API for external training loops."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.objects.world import World
+
+rng = np.random.default_rng()
+
+
+class VectorEnv:
+    """This class runs a batch of Birds on one Course headless, stepped by an action array rather than networks.
+
+    Observations are the neural network inputs of `Bird.nn_input` and Pipes follow the spawn and speed rules of
+    `Course`, so a policy trained here plays `FlappyBirdApp` in the same way. As in the game, each observation is taken
+    after the Pipes move and the action chosen from it moves the Bird.
+
+    Every Bird plays the same Course and the episode ends for all of them at once, when every Bird has died or the
+    lifetime has run out. Dead Birds are not respawned, so `reset` has to be called to start the next episode.
+    """
+
+    def __init__(
+        self,
+        num_birds: int,
+        x_lim: int,
+        y_lim: int,
+        fps: int,
+        lifetime: int,
+        bird_x: int,
+        bird_y: int,
+        bird_size: int,
+        timestep: int = 1,
+        precision: str = "float64",
+    ) -> None:
+        """Initialise VectorEnv.
+
+        :param int num_birds: Number of Birds stepped at once
+        :param int x_lim: Screen width
+        :param int y_lim: Screen height
+        :param int fps: Game FPS, which sets the Pipe spawn schedule
+        :param int lifetime: Number of seconds in an episode
+        :param int bird_x: x coordinate of Birds' start position
+        :param int bird_y: y coordinate of Birds' start position
+        :param int bird_size: Size of Birds
+        :param int timestep: Number of frames simulated per step, repeating each action
+        :param str precision: Floating point precision of observations, either "float32" or "float64"
+        """
+        self._num_birds = num_birds
+        self._x_lim = x_lim
+        self._y_lim = y_lim
+        self._fps = fps
+        self._num_frames = lifetime * fps
+        self._bird_x = bird_x
+        self._bird_y = bird_y
+        self._bird_size = bird_size
+        self._timestep = timestep
+        self._precision = precision
+        self._world: World
+        self._pending_timestep = 0
+
+    @property
+    def num_birds(self) -> int:
+        """Get number of Birds stepped at once."""
+        return self._num_birds
+
+    def _info(self) -> dict[str, Any]:
+        """Get information about the current episode.
+
+        :return dict[str, Any]: Frame of the episode, Course seed and score of each Bird
+        """
+        return {
+            "frame": self._world._frame,
+            "course_seed": self._world._schedule.seed,
+            "score": self._world._score[0].copy(),
+        }
+
+    def _advance_pipes(self) -> NDArray:
+        """Move the Pipes for the next step and observe the Birds, unless the episode has run out of frames.
+
+        :return NDArray: Observation of each Bird
+        """
+        if self._world._frame < self._num_frames:
+            self._pending_timestep = self._world.update_pipes()
+        _observations: NDArray = self._world.observe()[0]
+        return _observations
+
+    def reset(self, seed: int | None = None) -> tuple[NDArray, dict[str, Any]]:
+        """Start a new episode on a new Course with every Bird at its start position.
+
+        :param int | None seed: Seed of the Course, or None for a random Course
+        :return tuple[NDArray, dict[str, Any]]: Observation of each Bird with shape (num_birds, 5), and episode info
+        """
+        _seed = int(rng.integers(np.iinfo(np.int32).max)) if seed is None else seed
+        self._world = World(
+            [Course.generate(_seed, self._y_lim, self._fps, self._num_frames)],
+            self._num_birds,
+            self._x_lim,
+            self._y_lim,
+            self._num_frames,
+            self._bird_x,
+            self._bird_y,
+            self._bird_size,
+            self._timestep,
+            self._precision,
+        )
+        return self._advance_pipes(), self._info()
+
+    def step(self, actions: ArrayLike) -> tuple[NDArray, NDArray, NDArray, NDArray, dict[str, Any]]:
+        """Apply an action to every Bird and advance the episode by one step.
+
+        Each reward is the number of frames the Bird survived in the step, so the return of an episode is the Bird's
+        score in the game. Birds that died earlier get no reward.
+
+        :param ArrayLike actions: Whether each Bird jumps, with shape (num_birds,)
+        :return tuple[NDArray, NDArray, NDArray, NDArray, dict[str, Any]]: Observation of each Bird, reward of each
+            Bird, whether each Bird has died, whether each Bird is alive at the end of the lifetime, and episode info
+        """
+        _scores = self._world._score[0].copy()
+        self._world.update_birds(np.asarray(actions, dtype=bool).reshape(1, self._num_birds), self._pending_timestep)
+        _observations = self._advance_pipes()
+
+        _alive = self._world._alive[0]
+        _rewards = (self._world._score[0] - _scores).astype(self._precision)
+        _truncated = _alive & (self._world._frame >= self._num_frames)
+        return _observations, _rewards, ~_alive, _truncated, self._info()
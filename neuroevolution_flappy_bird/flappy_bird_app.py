@@ -2,11 +2,78 @@
 
 from __future__ import annotations
 
-from typing import cast
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, cast
 
+import numpy as np
+from numpy.typing import NDArray
+
+from neuroevolution_flappy_bird.capture import FrameRecorder
+from neuroevolution_flappy_bird.distributed import Coordinator
 from neuroevolution_flappy_bird.ga.bird_ga import FlappyBirdGA
+from neuroevolution_flappy_bird.ga.diversity import population_diversity
+from neuroevolution_flappy_bird.ga.fitness_cache import FitnessCache
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork, PopulationNetwork
+from neuroevolution_flappy_bird.objects.course import Course
 from neuroevolution_flappy_bird.objects.pipe import Pipe
+from neuroevolution_flappy_bird.objects.world import World
+from neuroevolution_flappy_bird.parallel import ChunkedStepper, chunk_slices
 from neuroevolution_flappy_bird.pg.app import App
+from neuroevolution_flappy_bird.replay import ReplayRecorder
+from neuroevolution_flappy_bird.shared_state import SharedStateWriter
+from neuroevolution_flappy_bird.status import PhaseTimer, StatusServer, TrainingStatus, peak_memory
+
+if TYPE_CHECKING:
+    import pygame
+
+rng = np.random.default_rng()
+
+# Minimum number of seconds between status updates, so publishing adds no measurable cost to each step
+STATUS_INTERVAL = 0.5
+
+
+def add_ga_kwargs(ga_config: dict[str, Any]) -> dict[str, Any]:
+    """Get the keyword arguments of `FlappyBirdApp.add_ga` from a genetic algorithm configuration.
+
+    Optional settings missing from the configuration take the same defaults as `add_ga`, and a seed network is loaded
+    from its file.
+
+    :param dict[str, Any] ga_config: Genetic algorithm configuration
+    :return dict[str, Any]: Keyword arguments for `add_ga`
+    """
+    return {
+        "population_size": ga_config["population_size"],
+        "mutation_rate": ga_config["mutation_rate"],
+        "lifetime": ga_config["lifetime"],
+        "bird_x": ga_config["bird_x"],
+        "bird_y": ga_config["bird_y"],
+        "bird_size": ga_config["bird_size"],
+        "hidden_layer_sizes": ga_config["hidden_layer_sizes"],
+        "weights_range": ga_config["weights_range"],
+        "bias_range": ga_config["bias_range"],
+        "course_seed": ga_config.get("course_seed"),
+        "timestep": ga_config.get("timestep", 1),
+        "num_courses": ga_config.get("num_courses", 1),
+        "fitness_aggregation": ga_config.get("fitness_aggregation", "mean"),
+        "elite_count": ga_config.get("elite_count", 0),
+        "cutoff_policy": ga_config.get("cutoff_policy"),
+        "selection": ga_config.get("selection", "roulette"),
+        "tournament_size": ga_config.get("tournament_size", 2),
+        "precision": ga_config.get("precision", "float64"),
+        "seed_network": PolicyNetwork.load(_filepath) if (_filepath := ga_config.get("seed_network")) else None,
+        "crossover_rate": ga_config.get("crossover_rate", 1.0),
+        "fitness_cache_size": ga_config.get("fitness_cache_size", 0),
+        "diversity_sample_size": ga_config.get("diversity_sample_size", 256),
+        "optimiser": ga_config.get("optimiser", "ga"),
+        "es_sigma": ga_config.get("es_sigma", 0.1),
+        "es_learning_rate": ga_config.get("es_learning_rate", 0.03),
+        "num_threads": ga_config.get("num_threads", 1),
+        "pipelined_breeding": ga_config.get("pipelined_breeding", False),
+        "fixed_course": ga_config.get("fixed_course", False),
+        "steady_state": ga_config.get("steady_state", False),
+    }
 
 
 class FlappyBirdApp(App):
@@ -27,14 +94,94 @@ class FlappyBirdApp(App):
         self._game_counter = 0
         self._pipes: list[Pipe] = []
         self._current_pipes = 0
-        self._pipe_counter = 0
+        self._course: Course
+        self._course_seed: int
+        self._next_spawn_frame = 0
+        self._timestep = 1
+        self._num_courses = 1
+        self._fitness_aggregation = "mean"
+        self._elite_count = 0
+        self._cutoff_policy: str | None = None
+        self._precision = "float64"
+        self._breeding_executor: ThreadPoolExecutor | None = None
+        self._breeding: Future[NDArray] | None = None
+        self._fixed_course = False
+        self._steady_state = False
+        self._finished_scores: list[int] = []
+        self._fitness_cache: FitnessCache | None = None
+        self._stepper: ChunkedStepper | None = None
+        self._coordinator: Coordinator | None = None
+        self._diversity_sample_size = 0
+        self._diversity: list[dict[str, float | dict[str, float]]] = []
+        self._generation_ends: list[str] = []
+        self._best_scores: list[int] = []
+        self._mean_scores: list[float] = []
         self._bird_x: int
+        self._bird_y: int
+        self._bird_size: int
+        self._replay_recorder: ReplayRecorder | None = None
+        self._replay_directory: str
+        self._replay_birds: str | list[int]
+        self._champion: PolicyNetwork | None = None
+        self._champion_score = 0
+        self._phase_timer = PhaseTimer()
+        self._phase_seconds: dict[str, float] = {}
+        self._status: TrainingStatus | None = None
+        self._status_server: StatusServer | None = None
+        self._status_time = time.perf_counter()
+        self._status_frames = 0
+        self._frame_recorder: FrameRecorder | None = None
+        self._frame_interval = 1
+        self._frame_surface: pygame.Surface | None = None
+        self._num_updates = 0
+        self._shared_state: SharedStateWriter | None = None
 
     @property
     def max_count(self) -> int:
         """Maximum game counter value before resetting the generation."""
         return self._ga._lifetime * self._fps
 
+    @property
+    def frame_rate(self) -> float:
+        """Get the number of frames per second the game runs at, scaled by the status server's speed multiplier."""
+        return self._fps * self._status.speed if self._status else self._fps
+
+    @property
+    def course_generation(self) -> int:
+        """Get the generation number the Courses are generated for, which is always 1 with a fixed Course."""
+        return 1 if self._fixed_course else self._ga._generation
+
+    @property
+    def batched(self) -> bool:
+        """Check if training scores Birds in a batched World or on workers instead of playing the game on screen."""
+        return self._num_courses > 1 or self._fitness_cache is not None or self._coordinator is not None
+
+    @property
+    def game_settings(self) -> dict[str, int]:
+        """Get the settings workers need to play the game in the same way as this app."""
+        return {
+            "x_lim": self._width,
+            "y_lim": self._height,
+            "fps": self._fps,
+            "num_frames": self.max_count,
+            "bird_x": self._bird_x,
+            "bird_y": self._bird_y,
+            "bird_size": self._bird_size,
+            "timestep": self._timestep,
+        }
+
+    @property
+    def generation_end(self) -> str | None:
+        """Get the reason the current generation has finished, or None if it is still running."""
+        if self._game_counter >= self.max_count:
+            return "lifetime"
+        return self._cutoff(self._ga.num_alive)
+
+    @property
+    def generation_finished(self) -> bool:
+        """Check if the current generation has finished."""
+        return self.generation_end is not None
+
     @property
     def closest_pipe(self) -> Pipe | None:
         """Determine which Pipe is closest to and in front of the Birds.
@@ -66,6 +213,24 @@ class FlappyBirdApp(App):
         """
         return cast(FlappyBirdApp, super().create_app(name, width, height, fps, font, font_size))
 
+    def _cutoff(self, num_alive: int) -> str | None:
+        """Check if a generation with a number of surviving Birds should end before its lifetime is reached.
+
+        The `elite` policy ends the generation once the survivors fit in the elite, as they will be kept whatever their
+        final scores. The `ranking` policy ends it once at most one Bird survives, as the order of every Bird is then
+        fixed and rank based selection cannot change.
+
+        :param int num_alive: Number of surviving Birds
+        :return str | None: Reason the generation has finished, or None if it should keep running
+        """
+        if num_alive == 0:
+            return "extinct"
+        if self._cutoff_policy == "elite" and num_alive <= self._elite_count:
+            return "elite"
+        if self._cutoff_policy == "ranking" and num_alive <= 1:
+            return "ranking"
+        return None
+
     def _write_stats(self) -> None:
         """Write algorithm statistics to screen."""
         _start_x = 20
@@ -73,14 +238,188 @@ class FlappyBirdApp(App):
         self.write_text(f"Generation: {self._ga._generation}", _start_x, _start_y)
         self.write_text(f"Birds alive: {self._ga.num_alive}", _start_x, _start_y * 3)
         self.write_text(f"Score: {int(self._game_counter / self._fps)}", _start_x, _start_y * 4)
+        if self._diversity:
+            self.write_text(f"Diversity: {self._diversity[-1]['pairwise_distance']:.3f}", _start_x, _start_y * 5)
+
+    def _generate_course(self) -> None:
+        """Generate the Course for the current generation."""
+        self._course = Course.generate(
+            Course.generation_seed(self._course_seed, self.course_generation), self._height, self._fps, self.max_count
+        )
+        self._next_spawn_frame = int(self._course.spawn_frames[0]) if len(self._course) else -1
+
+    def _evaluate_courses(self) -> tuple[NDArray, str]:
+        """Play every Bird on every Course of the current generation at once.
+
+        Birds are stepped in a `World` using their stacked neural networks,
+        so the cost of extra Courses goes into larger array operations rather than more Python loops.
+
+        The cutoff policy is applied to the Course with the most survivors. With a fitness cache, Birds whose genome was
+        already played on the same Courses take their cached scores and only the other Birds are played. With a
+        coordinator, Birds are played on the connected workers instead, without a cutoff, unless the first Course is
+        being recorded.
+
+        :return tuple[NDArray, str]: Score of each Bird on each Course, with shape (num_courses, population size), and
+            the reason the generation finished
+        """
+        _courses = [
+            Course.generate(
+                Course.generation_seed(self._course_seed, self.course_generation, _index),
+                self._height,
+                self._fps,
+                self.max_count,
+            )
+            for _index in range(self._num_courses)
+        ]
+        if self._fitness_cache is not None:
+            return self._evaluate_cached(_courses, self._fitness_cache, record=self._replay_recorder is not None)
+
+        return self._play_courses(
+            _courses, self._ga.population_network, len(self._ga._population._members), self._replay_recorder
+        )
+
+    def _play_courses(
+        self,
+        courses: list[Course],
+        network: PopulationNetwork,
+        num_birds: int,
+        recorder: ReplayRecorder | None = None,
+        cached_scores: NDArray | None = None,
+        copies: NDArray | None = None,
+    ) -> tuple[NDArray, str]:
+        """Play a batch of Birds on every Course at once.
+
+        :param list[Course] courses: Courses to play
+        :param PopulationNetwork network: Stacked neural networks of the Birds
+        :param int num_birds: Number of Birds
+        :param ReplayRecorder | None recorder: Recorder for the jumps on the first Course
+        :param NDArray | None cached_scores: Scores of the Birds not played on each Course, counted as alive by the
+            cutoff policy until their score is reached
+        :param NDArray | None copies: Number of Birds sharing each played Bird's genome, counted by the cutoff policy
+            while it is alive, or None if every genome is played once
+        :return tuple[NDArray, str]: Score of each Bird on each Course and the reason the generation finished
+        """
+        _network = network.astype(self._precision)
+        if self._coordinator and recorder is None:
+            return self._coordinator.evaluate([_course.seed for _course in courses], _network, self.game_settings)
+
+        _cached_scores = np.zeros((len(courses), 0)) if cached_scores is None else cached_scores
+        _copies = np.ones(num_birds, dtype=int) if copies is None else copies
+        world = World(
+            courses,
+            num_birds,
+            self._width,
+            self._height,
+            self.max_count,
+            self._bird_x,
+            self._bird_y,
+            self._bird_size,
+            self._timestep,
+            self._precision,
+        )
+
+        _chunks = chunk_slices(num_birds, self._stepper.num_threads) if self._stepper else []
+        _chunk_networks = [_network.select(_birds) for _birds in _chunks]
+
+        while (_end := self._world_end(world, _cached_scores, _copies)) is None:
+            if self._stepper:
+                _jumps = self._stepper.step(world, _chunk_networks, _chunks)
+            else:
+                _jumps = world.step_policy(_network.jumps)
+            if recorder:
+                recorder.record(_jumps[0])
+            if self._shared_state:
+                _on_screen = world.pipe_xs > -Pipe.WIDTH
+                self._shared_state.write_frame(
+                    self._ga._generation,
+                    world._frame,
+                    world._y[0],
+                    world._velocity[0],
+                    world._alive[0],
+                    world._score[0],
+                    world.pipe_xs[_on_screen],
+                    world.top_heights[0, _on_screen],
+                )
+
+        self._status_frames += world._frame
+        return world._score, _end
+
+    def _evaluate_cached(self, courses: list[Course], cache: FitnessCache, *, record: bool) -> tuple[NDArray, str]:
+        """Score every Bird on the Courses, only playing the Birds whose genome is not in the fitness cache.
+
+        Birds sharing a genome within the generation are played once and given the same scores. Scores are cached for
+        Birds that died or lasted the whole lifetime, as a cutoff leaves the survivors unfinished. Survivors are the
+        Birds that have the highest score, as every alive Bird scores on every frame.
+
+        :param list[Course] courses: Courses to play
+        :param FitnessCache cache: Cache of Course scores
+        :param bool record: Whether to play and record every Bird on the first Course
+        :return tuple[NDArray, str]: Score of each Bird on each Course and the reason the generation finished
+        """
+        _networks = [PolicyNetwork.from_member(_bird) for _bird in self._ga._population._members]
+        _seeds = [_course.seed for _course in courses]
+        _keys = [cache.key(_network, _seeds) for _network in _networks]
+        _scores = np.zeros((len(courses), len(_networks)), dtype=int)
+        _played: list[int] = []
+        _genomes: dict[bytes, int] = {}
+        # Index of the played Bird each Bird takes its scores from, or -1 for cached Birds
+        _played_index = np.full(len(_networks), -1)
+        for _bird, _key in enumerate(_keys):
+            if not record and _key in _genomes:
+                _played_index[_bird] = _genomes[_key]
+            elif not record and (_cached := cache.get(_key)) is not None:
+                _scores[:, _bird] = _cached
+            else:
+                _played_index[_bird] = _genomes[_key] = len(_played)
+                _played.append(_bird)
 
-    def _add_pipe(self, speed: float) -> None:
-        """Spawn a new Pipe with a given speed.
+        if not _played:
+            return _scores, "cached"
 
-        :param float speed: Pipe speed
+        _sharing = _played_index >= 0
+        _played_scores, _end = self._play_courses(
+            courses,
+            PopulationNetwork.from_networks([_networks[_bird] for _bird in _played]),
+            len(_played),
+            self._replay_recorder if record else None,
+            _scores[:, ~_sharing],
+            np.bincount(_played_index[_sharing], minlength=len(_played)),
+        )
+        _scores[:, _sharing] = _played_scores[:, _played_index[_sharing]]
+        for _index, _bird in enumerate(_played):
+            if _end in ("lifetime", "extinct") or _played_scores[:, _index].max() < _played_scores.max():
+                cache.put(_keys[_bird], _played_scores[:, _index])
+        return _scores, _end
+
+    def _world_end(self, world: World, cached_scores: NDArray, copies: NDArray) -> str | None:
+        """Get the reason a World evaluating the generation has finished, or None if it is still running.
+
+        :param World world: World playing every Course of the generation
+        :param NDArray cached_scores: Scores of the Birds not played in the World on each Course
+        :param NDArray copies: Number of Birds sharing each played Bird's genome
+        :return str | None: Reason the generation has finished
         """
-        self._pipes.append(Pipe(self._width, self._height, speed))
+        if world._frame >= world._num_frames:
+            return "lifetime"
+        if not world._alive.any():
+            return "extinct"
+        _num_alive = np.sum(world._alive * copies, axis=1) + np.sum(cached_scores >= world._frame, axis=1)
+        return self._cutoff(int(np.max(_num_alive)))
+
+    def _add_pipe(self) -> None:
+        """Spawn the next Pipe in the Course."""
+        self._pipes.append(
+            Pipe(
+                self._width,
+                self._height,
+                float(self._course.speeds[self._current_pipes]),
+                float(self._course.top_heights[self._current_pipes]),
+            )
+        )
         self._current_pipes += 1
+        self._next_spawn_frame = (
+            int(self._course.spawn_frames[self._current_pipes]) if self._current_pipes < len(self._course) else -1
+        )
 
     def add_ga(
         self,
@@ -93,6 +432,27 @@ class FlappyBirdApp(App):
         hidden_layer_sizes: list[int],
         weights_range: tuple[float, float],
         bias_range: tuple[float, float],
+        course_seed: int | None = None,
+        timestep: int = 1,
+        num_courses: int = 1,
+        fitness_aggregation: str = "mean",
+        elite_count: int = 0,
+        cutoff_policy: str | None = None,
+        selection: str = "roulette",
+        tournament_size: int = 2,
+        precision: str = "float64",
+        seed_network: PolicyNetwork | None = None,
+        crossover_rate: float = 1.0,
+        fitness_cache_size: int = 0,
+        diversity_sample_size: int = 256,
+        optimiser: str = "ga",
+        es_sigma: float = 0.1,
+        es_learning_rate: float = 0.03,
+        num_threads: int = 1,
+        *,
+        pipelined_breeding: bool = False,
+        fixed_course: bool = False,
+        steady_state: bool = False,
     ) -> None:
         """Add genetic algorithm to app.
 
@@ -105,8 +465,86 @@ class FlappyBirdApp(App):
         :param list[int] hidden_layer_sizes: Neural network hidden layer sizes
         :param tuple[float, float] weights_range: Range for random weights
         :param tuple[float, float] bias_range: Range for random bias
+        :param int | None course_seed: Base seed for each generation's Course, random if not provided
+        :param int timestep: Number of frames simulated per update, collisions are swept over each frame
+        :param int num_courses: Number of Courses each Bird is scored on per generation
+        :param str fitness_aggregation: How to combine each Bird's scores on several Courses, either "mean" or "min"
+        :param int elite_count: Number of best Birds kept unchanged in each generation
+        :param str | None cutoff_policy: Policy for ending a generation early, either "elite" or "ranking"
+        :param str selection: Parent selection method, either "roulette" or "tournament"
+        :param int tournament_size: Number of Birds competing in each tournament
+        :param str precision: Floating point precision of batched inference and exported networks, either "float32" or
+            "float64"
+        :param PolicyNetwork | None seed_network: Trained network to start the first Bird from
+        :param float crossover_rate: Probability for a child to be bred by crossover rather than as a mutated clone
+        :param int fitness_cache_size: Number of genomes to cache the scores of, or 0 to play every Bird each generation
+        :param int diversity_sample_size: Largest number of Birds compared pairwise when measuring the diversity of
+            each generation, or 0 to not measure diversity
+        :param str optimiser: How the population is evolved, either "ga" for selection and crossover, "openai_es" or
+            "sep_cma_es"
+        :param float es_sigma: Standard deviation of the evolution strategy's noise, or starting step size of CMA-ES
+        :param float es_learning_rate: Adam step size of OpenAI-ES
+        :param int num_threads: Number of threads batched evaluation steps chunks of Birds on, 1 to step them on the
+            main thread or 0 to pick from the CPUs and whether the GIL is enabled
+        :param bool pipelined_breeding: Whether to breed the next generation on a background thread once only the
+            elite is alive, only used by the genetic algorithm
+        :param bool fixed_course: Whether to play the same Courses in every generation
+        :param bool steady_state: Whether to replace each Bird that dies with a child straight away, playing on screen
+            with the genetic algorithm. Generations then only mark when the Course changes
+        :raises ValueError: If steady state evolution is combined with batched evaluation, an evolution strategy,
+            threads or pipelined breeding, if the "ranking" cutoff policy is used with roulette selection, if the
+            "elite" cutoff policy is used with an evolution strategy, if a cutoff policy is used with the mean score on
+            several Courses, if pipelined breeding is used with several Courses, if the fitness cache is used without a
+            fixed Course, or if threads are used without several Courses or a fitness cache
         """
+        # Evolution strategies rank every Bird themselves and never use the selection method
+        if cutoff_policy == "ranking" and optimiser == "ga" and selection != "tournament":
+            msg = "The ranking cutoff policy needs tournament selection, as roulette selection depends on every score"
+            raise ValueError(msg)
+        if cutoff_policy == "elite" and optimiser != "ga":
+            msg = "The elite cutoff policy needs the genetic algorithm, as evolution strategies rank the tied survivors"
+            raise ValueError(msg)
+        if cutoff_policy is not None and num_courses > 1 and fitness_aggregation == "mean":
+            msg = (
+                "Cutoff policies cannot be used with the mean score on several Courses, as a Bird alive on one Course "
+                "can still overtake Birds that died on every Course"
+            )
+            raise ValueError(msg)
+        if fitness_cache_size and not fixed_course:
+            msg = "The fitness cache needs a fixed Course, as new Courses in every generation never repeat a cache key"
+            raise ValueError(msg)
+        if pipelined_breeding and num_courses > 1:
+            msg = "Pipelined breeding needs a single Course, as several Courses are scored together in a batched World"
+            raise ValueError(msg)
+        if steady_state and (
+            num_courses > 1 or fitness_cache_size or optimiser != "ga" or pipelined_breeding or num_threads != 1
+        ):
+            msg = (
+                "Steady state evolution replaces Birds on screen as they die, so it needs one Course, the genetic "
+                "algorithm, one thread and no fitness cache or pipelined breeding"
+            )
+            raise ValueError(msg)
+        if num_threads != 1 and num_courses == 1 and not fitness_cache_size:
+            msg = "Threads only step batched evaluation, so they need several Courses or a fitness cache"
+            raise ValueError(msg)
         self._bird_x = bird_x
+        self._bird_y = bird_y
+        self._bird_size = bird_size
+        self._timestep = timestep
+        self._num_courses = num_courses
+        self._fitness_aggregation = fitness_aggregation
+        self._elite_count = elite_count
+        self._cutoff_policy = cutoff_policy
+        self._precision = precision
+        self._breeding_executor = (
+            ThreadPoolExecutor(max_workers=1) if pipelined_breeding and optimiser == "ga" else None
+        )
+        self._fixed_course = fixed_course
+        self._steady_state = steady_state
+        self._fitness_cache = FitnessCache(fitness_cache_size) if fitness_cache_size else None
+        self._stepper = ChunkedStepper(num_threads) if num_threads != 1 else None
+        self._diversity_sample_size = diversity_sample_size
+        self._course_seed = int(rng.integers(2**32)) if course_seed is None else course_seed
         self._ga = FlappyBirdGA.create(
             population_size,
             mutation_rate,
@@ -119,34 +557,366 @@ class FlappyBirdApp(App):
             hidden_layer_sizes,
             weights_range,
             bias_range,
+            selection,
+            tournament_size,
+            elite_count,
+            crossover_rate,
         )
+        if seed_network is not None:
+            self._ga.seed_network(seed_network)
+        if optimiser != "ga":
+            self._ga.use_strategy(optimiser, es_sigma, es_learning_rate)
+        self._ga._steady_state = steady_state
+        self._generate_course()
 
-    def update(self) -> None:
-        """Run genetic algorithm, update Birds and draw to screen."""
-        if self._game_counter == self.max_count or self._ga.num_alive == 0:
+    def close_stepper(self) -> None:
+        """Stop the thread pool that batched evaluation steps chunks of Birds on."""
+        if self._stepper:
+            self._stepper.shutdown()
+            self._stepper = None
+
+    def add_replay_recorder(self, directory: str, birds: str | list[int] = "best") -> None:
+        """Record a Replay of every generation.
+
+        :param str directory: Directory to save replay files to
+        :param str | list[int] birds: Birds to record, either "best", "all" or a list of indices
+        :raises ValueError: If Birds are replaced as they die, as a Replay plays each Bird from the start of the Course
+        """
+        if self._steady_state:
+            msg = "Replays cannot be recorded with steady state evolution, as Birds are replaced mid-Course"
+            raise ValueError(msg)
+        os.makedirs(directory, exist_ok=True)
+        self._replay_directory = directory
+        self._replay_birds = birds
+        self._replay_recorder = ReplayRecorder()
+
+    def _save_replay(self, replay_recorder: ReplayRecorder, scores: NDArray) -> None:
+        """Save a Replay of the finished generation.
+
+        :param ReplayRecorder replay_recorder: Recorder holding the generation's jump decisions
+        :param NDArray scores: Score of every Bird
+        """
+        if self._replay_birds == "best":
+            _birds = np.array([np.argmax(scores)])
+        elif self._replay_birds == "all":
+            _birds = np.arange(scores.size)
+        else:
+            _birds = np.array(self._replay_birds)
+
+        replay_recorder.create_replay(
+            _birds,
+            self._course,
+            self._width,
+            self._height,
+            self._fps,
+            self.max_count,
+            self._timestep,
+            self._bird_x,
+            self._bird_y,
+            self._bird_size,
+            scores,
+            self._ga._generation,
+        ).save(os.path.join(self._replay_directory, f"generation_{self._ga._generation}.npz"))
+        replay_recorder.reset()
+
+    def _update_champion(self, scores: NDArray, birds: NDArray | None = None) -> PolicyNetwork:
+        """Keep a copy of the best Bird's neural network seen so far.
+
+        :param NDArray scores: Score of every Bird, or of the given Birds
+        :param NDArray | None birds: Indices of the Birds the scores belong to, or None for every Bird
+        :return PolicyNetwork: Neural network of the best Bird seen so far
+        """
+        _best = int(np.argmax(scores))
+        if self._champion is None or scores[_best] > self._champion_score:
+            _bird = _best if birds is None else int(birds[_best])
+            self._champion = PolicyNetwork.from_member(self._ga._population._members[_bird])
+            self._champion_score = int(scores[_best])
+        return self._champion
+
+    def _replace_dead(self) -> None:
+        """Record the final scores of the Birds that died in the last update and replace them with children."""
+        if not self._ga._dead_indices:
+            return
+        _dead = np.array(self._ga._dead_indices)
+        _scores = self._ga.scores[_dead]
+        self._update_champion(_scores, _dead)
+        self._finished_scores.extend(_scores.tolist())
+        self._ga.replace_dead()
+
+    def export_champion(self, filepath: str) -> None:
+        """Save the neural network of the best Bird seen so far, including the current generation.
+
+        :param str filepath: Path to network file
+        """
+        self._update_champion(self._ga.scores).astype(self._precision).save(filepath)
+
+    def _new_generation(self) -> None:
+        """Record the finished generation's scores, evolve the population and reset the game."""
+        _end = self.generation_end
+        if self.batched:
+            with self._phase_timer.phase("evaluate"):
+                _course_scores, _end = self._evaluate_courses()
+            self._ga.set_scores(_course_scores, self._fitness_aggregation)
+        self._generation_ends.append(_end or "lifetime")
+
+        _scores = self._ga.scores
+        # In a steady state the generation's scores include every Bird that died and was replaced during it
+        _generation_scores = np.concatenate([np.array(self._finished_scores, dtype=int), _scores])
+        self._finished_scores = []
+        self._best_scores.append(int(np.max(_generation_scores)))
+        self._mean_scores.append(float(np.mean(_generation_scores)))
+        self._update_champion(_scores)
+        if self._shared_state:
+            self._shared_state.write_fitness(self._ga._generation, self._ga.fitness)
+        if self._replay_recorder:
+            self._save_replay(self._replay_recorder, _scores)
+        if self._diversity_sample_size:
+            with self._phase_timer.phase("diversity"):
+                self._diversity.append(population_diversity(self._ga.population_network, self._diversity_sample_size))
+
+        with self._phase_timer.phase("evolve"):
+            self._ga._evaluate()
             self._ga._analyse()
-            self._ga._evolve()
-            self._ga.reset()
-            self._game_counter = 0
-            self._pipes = []
-            self._current_pipes = 0
-            self._pipe_counter = 0
-
-        _next_pipe_spawntime = Pipe.get_spawn_time(self._current_pipes)
-        _next_pipe_speed = Pipe.get_speed(self._current_pipes) / self._fps
-        if int(self._pipe_counter) % _next_pipe_spawntime == 0:
-            self._add_pipe(_next_pipe_speed)
-            self._pipe_counter = 0
+            if self._breeding:
+                self._ga.replace_chromosomes(self._breeding.result())
+                self._breeding = None
+            else:
+                self._ga._evolve()
+        self._ga.reset()
+        self._game_counter = 0
+        self._pipes = []
+        self._current_pipes = 0
+        self._generate_course()
+
+        self._phase_seconds = self._phase_timer.totals
+        self._phase_timer.reset()
+        self._publish_status(force=True)
+
+    def step(self) -> None:
+        """Advance the simulation by one update without drawing, starting a new generation if required.
+
+        Batched training scores every Bird in `_new_generation` without playing the Course on screen, so each update
+        then trains a whole generation.
+        """
+        if self.batched:
+            self._new_generation()
+            return
+        if self.generation_finished:
+            self._new_generation()
+
+        _timestep = min(self._timestep, self.max_count - self._game_counter)
+        with self._phase_timer.phase("pipes"):
+            while 0 <= self._next_spawn_frame < self._game_counter + _timestep:
+                _frames_early = self._next_spawn_frame - self._game_counter
+                self._add_pipe()
+                self._pipes[-1]._x += _frames_early * self._pipes[-1]._speed
+
+            for _pipe in self._pipes:
+                _pipe.update(_timestep)
+
+        with self._phase_timer.phase("birds"):
+            self._ga.update_birds(self.closest_pipe, _timestep, self._pipes)
+            if self._steady_state:
+                self._replace_dead()
+            self._start_breeding()
+
+        if self._replay_recorder:
+            with self._phase_timer.phase("record"):
+                self._replay_recorder.record(np.array([_bird._jumped for _bird in self._ga._population._members]))
+
+        self._game_counter += _timestep
+        self._status_frames += _timestep
+        self._publish_status()
+        if self._shared_state:
+            self._export_frame(self._shared_state)
+
+    def _start_breeding(self) -> None:
+        """Start breeding the next generation on a background thread once the remaining Birds are all in the elite.
+
+        From then on the dead Birds' scores are final and the elite is fixed, so only the new chromosomes of dead Birds
+        are written while the elite keeps playing. The alive Birds are selected as parents with their fitness so far,
+        which ranks them above every dead Bird as it will at the end of the generation. Batched training scores the
+        generation in a World instead, so the Birds on screen are not bred from.
+        """
+        if (
+            self._breeding_executor is None
+            or self.batched
+            or self._breeding is not None
+            or not 0 < self._ga.num_alive <= self._elite_count
+        ):
+            return
+        self._breeding = self._breeding_executor.submit(self._ga.breed, self._ga.fitness)
+
+    def add_status_server(self, port: int) -> int:
+        """Serve the training status and pause, resume and speed controls over HTTP on localhost.
+
+        :param int port: Port to listen on, or 0 to pick a free port
+        :return int: Port the server is listening on
+        """
+        self._status = TrainingStatus()
+        self._status_server = StatusServer(self._status, port)
+        self._status_server.start()
+        self._publish_status(force=True)
+        return self._status_server.port
+
+    def _publish_status(self, *, force: bool = False) -> None:
+        """Publish the training metrics to the status server, at most once per status interval unless forced.
+
+        :param bool force: Whether to publish even if the interval has not passed
+        """
+        _now = time.perf_counter()
+        if self._status is None or (not force and _now - self._status_time < STATUS_INTERVAL):
+            return
+        _diversity = self._diversity[-1] if self._diversity else {}
+        self._status.publish(
+            {
+                "generation": self._ga._generation,
+                "alive": self._ga.num_alive,
+                "best_score": self._best_scores[-1] if self._best_scores else 0,
+                "mean_score": self._mean_scores[-1] if self._mean_scores else 0.0,
+                **{f"diversity_{_name}": _value for _name, _value in _diversity.items()},
+                "frames_per_second": self._status_frames / max(_now - self._status_time, 1e-9),
+                "phase_seconds": self._phase_seconds,
+                "peak_memory_bytes": peak_memory(),
+            }
+        )
+        self._status_time = _now
+        self._status_frames = 0
 
+    def add_coordinator(self, port: int, host: str = "127.0.0.1", batch_size: int = 64, timeout: float = 30.0) -> int:
+        """Score Birds on worker processes connected over TCP, started with `flappy-bird worker --connect host:port`.
+
+        :param int port: Port to listen on, or 0 to pick a free port
+        :param str host: Host to bind to
+        :param int batch_size: Number of Birds sent to a worker at once
+        :param float timeout: Seconds a batch can be out before it is sent to another worker
+        :return int: Port the coordinator is listening on
+        :raises ValueError: If Birds are replaced as they die, as workers play each Bird from the start of the Course
+        """
+        if self._steady_state:
+            msg = "Workers cannot score Birds with steady state evolution, as Birds are replaced mid-Course"
+            raise ValueError(msg)
+        self._coordinator = Coordinator(port, host, batch_size, timeout)
+        return self._coordinator.port
+
+    def wait_for_workers(self, num_workers: int) -> int:
+        """Wait until a number of workers have connected to the coordinator.
+
+        :param int num_workers: Number of workers to wait for
+        :return int: Number of connected workers
+        """
+        return self._coordinator.wait_for_workers(num_workers) if self._coordinator else 0
+
+    def close_coordinator(self) -> None:
+        """Disconnect the workers and stop listening."""
+        if self._coordinator:
+            self._coordinator.close()
+            self._coordinator = None
+
+    def add_shared_state(self, name: str, max_pipes: int = 16) -> None:
+        """Mirror the state of every frame and the fitness of every generation into a named shared memory segment.
+
+        :param str name: Name of the shared memory segment, which `SharedStateReader` attaches to
+        :param int max_pipes: Maximum number of Pipes on screen to export
+        """
+        self._shared_state = SharedStateWriter(name, len(self._ga._population._members), max_pipes)
+
+    def close_shared_state(self) -> None:
+        """Remove the shared memory segment."""
+        if self._shared_state:
+            self._shared_state.close()
+            self._shared_state = None
+
+    def _export_frame(self, shared_state: SharedStateWriter) -> None:
+        """Write the state of the game on screen to the shared memory segment.
+
+        :param SharedStateWriter shared_state: Writer of the shared memory segment
+        """
+        _birds = self._ga._population._members
+        _pipes = [_pipe for _pipe in self._pipes if not _pipe.offscreen]
+        shared_state.write_frame(
+            self._ga._generation,
+            self._game_counter,
+            np.array([_bird._y for _bird in _birds], dtype=float),
+            np.array([_bird._velocity for _bird in _birds], dtype=float),
+            np.array([_bird._alive for _bird in _birds], dtype=bool),
+            np.array([_bird._score for _bird in _birds], dtype=int),
+            np.array([_pipe._x for _pipe in _pipes], dtype=float),
+            np.array([_pipe._top_height for _pipe in _pipes], dtype=float),
+        )
+
+    def add_frame_recorder(
+        self, path: str, output_format: str = "y4m", queue_size: int = 64, frame_interval: int = 1
+    ) -> None:
+        """Record a video of training, written by a background thread.
+
+        :param str path: Directory for a PNG image sequence, or file for a Y4M video
+        :param str output_format: Output format, either "png" or "y4m"
+        :param int queue_size: Maximum number of frames waiting to be written before new frames are dropped
+        :param int frame_interval: Number of updates between captured frames
+        """
+        self._frame_interval = frame_interval
+        self._frame_recorder = FrameRecorder(
+            path, self._width, self._height, self._fps / (self._timestep * frame_interval), output_format, queue_size
+        )
+        self._frame_recorder.start()
+
+    def close_frame_recorder(self) -> None:
+        """Finish writing the recorded video."""
+        if self._frame_recorder:
+            self._frame_recorder.close()
+            self._frame_recorder = None
+
+    def _capture_frame(self, surface: pygame.Surface | None = None) -> None:
+        """Capture a frame every frame interval, rendering the game to an offscreen surface if no surface is given.
+
+        :param pygame.Surface | None surface: Rendered surface to capture
+        """
+        self._num_updates += 1
+        if self._frame_recorder is None or (self._num_updates - 1) % self._frame_interval:
+            return
+        if surface is None:
+            import pygame  # noqa: PLC0415
+
+            if self._frame_surface is None:
+                self._frame_surface = pygame.Surface((self._width, self._height))
+            surface = self._frame_surface
+            surface.fill((0, 0, 0))
+            self.draw(surface)
+        self._frame_recorder.capture(surface)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the Pipes and alive Birds.
+
+        :param pygame.Surface surface: Surface to draw to
+        """
         for _pipe in self._pipes:
-            _pipe.update()
-            _pipe.draw(self.screen)
+            _pipe.draw(surface)
+
+        for _bird in self._ga.alive_birds:
+            _bird.draw(surface)
 
-        for _bird in self._ga._population._members:
-            _bird.update(self.closest_pipe)
-            _bird.draw(self.screen)
+    def run_headless(self, generations: int) -> None:
+        """Train for a number of generations without a display, waiting while the status server has paused training.
+
+        :param int generations: Number of generations to train for
+        """
+        for _ in range(generations):
+            # Batched training scores every Bird in `_new_generation`, so the on screen Course is not played
+            while not self.batched and not self.generation_finished:
+                if self._status:
+                    self._status.wait_until_resumed()
+                self.step()
+                self._capture_frame()
+            if self._status:
+                self._status.wait_until_resumed()
+            self._new_generation()
+
+    def update(self) -> None:
+        """Run genetic algorithm, update Birds and draw to screen, keeping the game still while training is paused."""
+        if not (self._status and self._status.paused):
+            self.step()
 
-        self._ga._evaluate()
-        self._game_counter += 1
-        self._pipe_counter += 1
+        self.draw(self.screen)
         self._write_stats()
+        self._capture_frame(self.screen)
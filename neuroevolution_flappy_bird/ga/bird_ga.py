@@ -2,14 +2,42 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 import numpy as np
 from genetic_algorithm.ga import GeneticAlgorithm
+from numpy.typing import NDArray
 
+from neuroevolution_flappy_bird.ga.evolution_strategies import (
+    OpenAIES,
+    SepCMAES,
+    create_strategy,
+    flatten_network,
+    unflatten_network,
+)
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork, PopulationNetwork
 from neuroevolution_flappy_bird.objects.bird import Bird
+from neuroevolution_flappy_bird.objects.pipe import Pipe
+
+rng = np.random.default_rng()
+
+FITNESS_AGGREGATIONS: dict[str, Callable[..., NDArray]] = {"mean": np.mean, "min": np.min}
 
 
 class FlappyBirdGA(GeneticAlgorithm):
-    """Genetic algorithm for Flappy Bird training."""
+    """Genetic algorithm for Flappy Bird training.
+
+    Parents for the whole population are drawn at once from an array of fitness values, either by roulette wheel
+    selection or by tournament selection, and the fittest Birds can be carried over unchanged as an elite. Children
+    with the same parent twice, or not chosen for crossover, are mutated clones sharing their parent's matrices.
+
+    The indices of the alive Birds are kept in a compact list which drops each Bird as soon as it dies, so updating and
+    counting the population late in a generation only costs as much as the few Birds still alive.
+
+    Alternatively, the population can be evolved by an evolution strategy, which samples every Bird's network as a flat
+    parameter vector and replaces selection and crossover, or in a steady state, where each Bird that dies is replaced
+    by a child straight away instead of waiting for the rest of its generation.
+    """
 
     def __init__(
         self,
@@ -23,12 +51,42 @@ class FlappyBirdGA(GeneticAlgorithm):
         """
         super().__init__(birds, mutation_rate)
         self._lifetime: int
+        self._selection = "roulette"
+        self._tournament_size = 2
+        self._elite_count = 0
+        self._crossover_rate = 1.0
+        self._strategy: OpenAIES | SepCMAES | None = None
+        self._steady_state = False
+        self._num_births = 0
+        self._alive_indices = [_index for _index, _bird in enumerate(self._population._members) if _bird._alive]
+        self._dead_indices: list[int] = []
 
     @property
     def num_alive(self) -> int:
         """Get number of alive Birds in population."""
-        _alive_array = np.array([_bird._alive for _bird in self._population._members])
-        return int(np.sum(_alive_array))
+        return len(self._alive_indices)
+
+    @property
+    def alive_birds(self) -> list[Bird]:
+        """Get alive Birds in population."""
+        return [self._population._members[_index] for _index in self._alive_indices]
+
+    @property
+    def scores(self) -> NDArray:
+        """Get score of each Bird in population."""
+        return np.array([_bird._score for _bird in self._population._members])
+
+    @property
+    def fitness(self) -> NDArray:
+        """Get fitness of each Bird in population."""
+        return np.array([_bird.fitness for _bird in self._population._members], dtype=float)
+
+    @property
+    def population_network(self) -> PopulationNetwork:
+        """Get the neural networks of every Bird stacked for batched evaluation."""
+        return PopulationNetwork.from_networks(
+            [PolicyNetwork.from_member(_bird) for _bird in self._population._members]
+        )
 
     @classmethod
     def create(
@@ -44,6 +102,10 @@ class FlappyBirdGA(GeneticAlgorithm):
         hidden_layer_sizes: list[int],
         weights_range: tuple[float, float],
         bias_range: tuple[float, float],
+        selection: str = "roulette",
+        tournament_size: int = 2,
+        elite_count: int = 0,
+        crossover_rate: float = 1.0,
     ) -> FlappyBirdGA:
         """Create genetic algorithm and configure neural network.
 
@@ -58,6 +120,10 @@ class FlappyBirdGA(GeneticAlgorithm):
         :param list[int] hidden_layer_sizes: Neural network hidden layer sizes
         :param tuple[float, float] weights_range: Range for random weights
         :param tuple[float, float] bias_range: Range for random bias
+        :param str selection: Parent selection method, either "roulette" or "tournament"
+        :param int tournament_size: Number of Birds competing in each tournament
+        :param int elite_count: Number of fittest Birds copied unchanged into the next generation
+        :param float crossover_rate: Probability for a child to be bred by crossover rather than as a mutated clone
         :return FlappyBirdGA: Flappy Bird app
         """
         flappy_bird = cls(
@@ -68,9 +134,198 @@ class FlappyBirdGA(GeneticAlgorithm):
             mutation_rate,
         )
         flappy_bird._lifetime = lifetime
+        flappy_bird._selection = selection
+        flappy_bird._tournament_size = tournament_size
+        flappy_bird._elite_count = elite_count
+        flappy_bird._crossover_rate = crossover_rate
         return flappy_bird
 
+    @staticmethod
+    def roulette_selection(fitness: NDArray, num_pairs: int) -> NDArray:
+        """Draw parent pairs with probability proportional to fitness.
+
+        Every parent is found with a single `searchsorted` on the normalised cumulative fitness. If no Bird has any
+        fitness, parents are drawn uniformly.
+
+        :param NDArray fitness: Fitness of each Bird
+        :param int num_pairs: Number of parent pairs to draw
+        :return NDArray: Indices of the parents, with shape (num_pairs, 2)
+        """
+        _cumulative = np.cumsum(fitness)
+        if _cumulative[-1] <= 0:
+            return rng.integers(fitness.size, size=(num_pairs, 2))
+        _cumulative /= _cumulative[-1]
+        return np.minimum(np.searchsorted(_cumulative, rng.random((num_pairs, 2)), side="right"), fitness.size - 1)
+
+    @staticmethod
+    def tournament_selection(fitness: NDArray, num_pairs: int, tournament_size: int) -> NDArray:
+        """Draw parent pairs as the winners of tournaments between randomly chosen Birds.
+
+        :param NDArray fitness: Fitness of each Bird
+        :param int num_pairs: Number of parent pairs to draw
+        :param int tournament_size: Number of Birds competing in each tournament
+        :return NDArray: Indices of the parents, with shape (num_pairs, 2)
+        """
+        _contenders = rng.integers(fitness.size, size=(num_pairs, 2, tournament_size))
+        _winners = np.argmax(fitness[_contenders], axis=-1)
+        return np.take_along_axis(_contenders, _winners[..., None], axis=-1)[..., 0]
+
+    def select_parents(self, fitness: NDArray, num_pairs: int) -> NDArray:
+        """Draw parent pairs using the configured selection method.
+
+        :param NDArray fitness: Fitness of each Bird
+        :param int num_pairs: Number of parent pairs to draw
+        :return NDArray: Indices of the parents, with shape (num_pairs, 2)
+        """
+        if self._selection == "tournament":
+            return self.tournament_selection(fitness, num_pairs, self._tournament_size)
+        return self.roulette_selection(fitness, num_pairs)
+
+    def breed_into(self, children: NDArray, fitness: NDArray) -> None:
+        """Cross over parents drawn by fitness for a set of Birds, without replacing any chromosomes yet.
+
+        :param NDArray children: Indices of the Birds to give a new chromosome
+        :param NDArray fitness: Fitness of each Bird
+        """
+        _members = self._population._members
+        _parents = self.select_parents(fitness, len(children))
+        _clones = (_parents[:, 0] == _parents[:, 1]) | (rng.random(len(children)) >= self._crossover_rate)
+
+        for _child, (_parent_a, _parent_b), _clone in zip(children, _parents, _clones, strict=True):
+            if _clone:
+                _members[_child].clone(_members[_parent_a], self._mutation_rate)
+            else:
+                _members[_child].crossover(_members[_parent_a], _members[_parent_b], self._mutation_rate)
+
+    def breed(self, fitness: NDArray) -> NDArray:
+        """Cross over parents for every Bird outside the elite, without replacing any chromosomes yet.
+
+        Only the new chromosomes of the children are written, so this can run on a background thread while the elite
+        Birds are still playing.
+
+        :param NDArray fitness: Fitness of each Bird
+        :return NDArray: Indices of the Birds given a new chromosome
+        """
+        _elite_count = min(self._elite_count, len(self._population._members))
+        _children = np.argsort(-fitness, kind="stable")[_elite_count:]
+        self.breed_into(_children, fitness)
+        return _children
+
+    def replace_chromosomes(self, children: NDArray) -> None:
+        """Give the bred Birds their new chromosomes and move on to the next generation.
+
+        :param NDArray children: Indices of the Birds given a new chromosome
+        """
+        _members = self._population._members
+        for _child in children:
+            _members[_child].chromosome = _members[_child]._new_chromosome
+        self._generation += 1
+
+    def replace_dead(self) -> NDArray:
+        """Breed a child into the place of each Bird that died in the last update and respawn it at its start position.
+
+        Parents are drawn from the fitness of every Bird, which is the final score of the Birds that just died and the
+        score so far of the alive Birds, so long survivors spread their genes while they are still playing.
+
+        :return NDArray: Indices of the Birds replaced by a child
+        """
+        _children = np.array(self._dead_indices, dtype=int)
+        if not _children.size:
+            return _children
+
+        # Chromosomes are only replaced once every child is bred, as parents may also be children
+        self.breed_into(_children, self.fitness)
+        _members = self._population._members
+        for _child in _children:
+            _members[_child].chromosome = _members[_child]._new_chromosome
+            _members[_child].reset()
+        self._alive_indices.extend(self._dead_indices)
+        self._dead_indices = []
+        self._num_births += _children.size
+        return _children
+
+    def _evolve(self) -> None:
+        """Breed the next generation, keeping the elite unchanged and crossing over parents for every other Bird.
+
+        With an evolution strategy, the strategy is updated with the fitness of its samples and samples the next
+        generation instead. In a steady state every child has already been bred as Birds died, so only the generation
+        number moves on.
+        """
+        if self._steady_state:
+            self._generation += 1
+            return
+        if self._strategy is not None:
+            self._strategy.tell(self.fitness)
+            self.load_parameters(self._strategy.ask())
+            self._generation += 1
+            return
+        # Chromosomes are only replaced once every child is bred, as parents may also be children
+        self.replace_chromosomes(self.breed(self.fitness))
+
+    def load_parameters(self, parameters: NDArray) -> None:
+        """Give every Bird a neural network from a flat parameter vector.
+
+        :param NDArray parameters: Parameter vector of each Bird, with shape (population size, parameters)
+        """
+        _members = self._population._members
+        _template = PolicyNetwork.from_member(_members[0])
+        for _member, _parameters in zip(_members, parameters, strict=True):
+            _member.load_network(unflatten_network(_parameters, _template))
+
+    def use_strategy(self, name: str, sigma: float, learning_rate: float) -> None:
+        """Evolve the population with an evolution strategy centred on the first Bird's network.
+
+        The population is replaced with the strategy's first samples straight away.
+
+        :param str name: Evolution strategy, either "openai_es" or "sep_cma_es"
+        :param float sigma: Standard deviation of the noise, or starting step size of CMA-ES
+        :param float learning_rate: Adam step size of OpenAI-ES
+        """
+        _members = self._population._members
+        _mean = flatten_network(PolicyNetwork.from_member(_members[0]))
+        self._strategy = create_strategy(name, _mean, len(_members), sigma, learning_rate)
+        self.load_parameters(self._strategy.ask())
+
+    def seed_network(self, network: PolicyNetwork) -> None:
+        """Start the first Bird of the population from a trained network, such as a pruned champion.
+
+        :param PolicyNetwork network: Network to copy into the first Bird
+        """
+        self._population._members[0].load_network(network)
+
+    def set_scores(self, course_scores: NDArray, aggregation: str) -> None:
+        """Set each Bird's score from its scores on several Courses.
+
+        :param NDArray course_scores: Score of each Bird on each Course, with shape (num_courses, population size)
+        :param str aggregation: How to combine the scores of each Bird, either "mean" or "min"
+        """
+        _scores = np.rint(FITNESS_AGGREGATIONS[aggregation](course_scores, axis=0)).astype(int)
+        for _bird, _score in zip(self._population._members, _scores, strict=True):
+            _bird._score = int(_score)
+
+    def update_birds(self, closest_pipe: Pipe | None, timestep: int, pipes: list[Pipe]) -> None:
+        """Update every alive Bird and move the Birds that die from the alive list to the dead list of this update.
+
+        :param Pipe | None closest_pipe: Pipe closest to the Birds
+        :param int timestep: Number of frames to simulate
+        :param list[Pipe] pipes: Pipes on screen
+        """
+        _members = self._population._members
+        _alive_indices = []
+        _dead_indices = []
+        for _index in self._alive_indices:
+            _bird = _members[_index]
+            _bird.update(closest_pipe, timestep, pipes)
+            if _bird._alive:
+                _alive_indices.append(_index)
+            else:
+                _dead_indices.append(_index)
+        self._alive_indices = _alive_indices
+        self._dead_indices = _dead_indices
+
     def reset(self) -> None:
         """Reset all Birds."""
         for _bird in self._population._members:
             _bird.reset()
+        self._alive_indices = list(range(len(self._population._members)))
+        self._dead_indices = []
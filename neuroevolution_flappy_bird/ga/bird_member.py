@@ -10,6 +10,9 @@ from neural_network.math.matrix import Matrix
 from neural_network.neural_network import NeuralNetwork
 from numpy.typing import NDArray
 
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork
+from neuroevolution_flappy_bird.inference.prune import expand
+
 rng = np.random.default_rng()
 
 
@@ -18,6 +21,9 @@ class BirdMember(Member):
 
     The bird is assigned a neural network which acts as its brain and determines when the bird should 'jump'.
     This brain evolves via crossover and mutations.
+
+    Birds bred from a single parent reuse the parent's matrix for each layer with no mutated gene, and a layer with any
+    mutated gene is copied in full.
     """
 
     def __init__(
@@ -71,6 +77,20 @@ class BirdMember(Member):
         self._nn.weights = new_chromosome[0]
         self._nn.bias = new_chromosome[1]
 
+    def load_network(self, network: PolicyNetwork) -> None:
+        """Copy the weights and biases of a PolicyNetwork into BirdMember's neural network.
+
+        Networks with fewer hidden units, such as pruned networks, are padded with units that have no weights.
+
+        :param PolicyNetwork network: Network to copy
+        """
+        _network = expand(network, [len(self.nn_input), *self._hidden_layer_sizes, 2])
+        _weights, _biases = self.chromosome
+        self.chromosome = (
+            [_weights[0], *[Matrix.from_array(_layer_weights) for _layer_weights in _network._weights]],
+            [_biases[0], *[Matrix.from_array(_layer_biases) for _layer_biases in _network._biases]],
+        )
+
     @property
     def fitness(self) -> int:
         """Get BirdMember's fitness value."""
@@ -94,6 +114,45 @@ class BirdMember(Member):
 
         return float(rng.choice([element, other_element], p=[0.5, 0.5]))
 
+    @staticmethod
+    def mutate_matrix(matrix: Matrix, mutation_rate: float, random_range: tuple[float, float]) -> Matrix:
+        """Mutate the genes of a matrix, returning the same matrix if no gene is mutated.
+
+        The number of mutated genes is drawn first, so only those genes are drawn and written.
+
+        :param Matrix matrix: Matrix to mutate
+        :param float mutation_rate: Probability for each gene to be mutated
+        :param tuple[float, float] random_range: Range for random gene if mutation occurs
+        :return Matrix: Mutated copy of the matrix, or the matrix itself if no gene is mutated
+        """
+        _size = int(np.size(matrix.vals))
+        _num_mutations = rng.binomial(_size, mutation_rate)
+        if not _num_mutations:
+            return matrix
+
+        _vals = np.array(matrix.vals, dtype=float)
+        _genes = rng.choice(_size, size=_num_mutations, replace=False)
+        _vals.flat[_genes] = rng.uniform(low=random_range[0], high=random_range[1], size=_num_mutations)
+        return Matrix.from_array(_vals)
+
+    def clone(self, parent: BirdMember, mutation_rate: float) -> None:
+        """Create a new chromosome from a single parent with mutations, reusing the parent's unmutated matrices.
+
+        :param BirdMember parent: Used to construct new chromosome
+        :param float mutation_rate: Probability for mutations to occur
+        """
+        _weights, _biases = parent.chromosome
+        self._new_chromosome = (
+            [
+                _weights[0],
+                *[self.mutate_matrix(_matrix, mutation_rate, self._weights_range) for _matrix in _weights[1:]],
+            ],
+            [
+                _biases[0],
+                *[self.mutate_matrix(_matrix, mutation_rate, self._bias_range) for _matrix in _biases[1:]],
+            ],
+        )
+
     def crossover(self, parent_a: BirdMember, parent_b: BirdMember, mutation_rate: float) -> None:
         """Crossover the chromosomes of two birds to create a new chromosome.
 
@@ -0,0 +1,74 @@
+"""Diversity statistics of a population's chromosomes."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+from neuroevolution_flappy_bird.inference.network import PopulationNetwork
+
+rng = np.random.default_rng()
+
+
+def flatten_chromosomes(network: PopulationNetwork) -> tuple[NDArray, list[int]]:
+    """Flatten the weights and biases of every Bird's neural network into one row per Bird.
+
+    :param PopulationNetwork network: Stacked networks of the population
+    :return tuple[NDArray, list[int]]: Chromosomes with shape (population size, parameters), and the number of
+        parameters in each layer
+    """
+    _population_size = network._weights[0].shape[0]
+    _layers = [
+        np.concatenate([_weights.reshape(_population_size, -1), _biases], axis=1)
+        for _weights, _biases in zip(network._weights, network._biases, strict=True)
+    ]
+    return np.concatenate(_layers, axis=1), [_layer.shape[1] for _layer in _layers]
+
+
+def mean_pairwise_distance(chromosomes: NDArray) -> float:
+    """Get the mean L2 distance between every pair of chromosomes.
+
+    Squared distances are computed from a single matrix product of the centred chromosomes, rather than a loop over
+    pairs. Centring first keeps the result accurate when the chromosomes are close together compared to their size,
+    which is the case this statistic is meant to detect.
+
+    :param NDArray chromosomes: Chromosomes with shape (number of chromosomes, parameters)
+    :return float: Mean distance between distinct pairs
+    """
+    _num_chromosomes = chromosomes.shape[0]
+    if _num_chromosomes < 2:  # noqa: PLR2004
+        return 0.0
+    _centred = chromosomes - chromosomes.mean(axis=0)
+    _squared_norms = np.einsum("pd,pd->p", _centred, _centred)
+    _squared_distances = _squared_norms[:, None] + _squared_norms[None, :] - 2 * _centred @ _centred.T
+    _pairs = np.triu_indices(_num_chromosomes, k=1)
+    return float(np.sqrt(np.maximum(_squared_distances[_pairs], 0)).mean())
+
+
+def population_diversity(network: PopulationNetwork, sample_size: int) -> dict[str, float | dict[str, float]]:
+    """Measure how spread out the chromosomes of a population are.
+
+    The distance to the centroid and the variance of each layer use every Bird. The pairwise distance grows with the
+    square of the population size, so for populations larger than the sample size it is estimated from a random
+    sample of Birds.
+
+    :param PopulationNetwork network: Stacked networks of the population
+    :param int sample_size: Largest number of Birds to compare pairwise
+    :return dict[str, float | dict[str, float]]: Mean pairwise distance, mean distance to the centroid and mean
+        parameter variance of each layer
+    """
+    _chromosomes, _layer_sizes = flatten_chromosomes(network)
+    _sample = _chromosomes
+    if len(_chromosomes) > sample_size:
+        _sample = _chromosomes[rng.choice(len(_chromosomes), size=sample_size, replace=False)]
+
+    _variances = _chromosomes.var(axis=0)
+    _layer_ends = np.cumsum(_layer_sizes)
+    return {
+        "pairwise_distance": mean_pairwise_distance(_sample),
+        "centroid_distance": float(np.linalg.norm(_chromosomes - _chromosomes.mean(axis=0), axis=1).mean()),
+        "layer_variance": {
+            str(_layer): float(_variances[_end - _size : _end].mean())
+            for _layer, (_size, _end) in enumerate(zip(_layer_sizes, _layer_ends, strict=True))
+        },
+    }
@@ -0,0 +1,243 @@
+"""Evolution strategies that train Birds' neural networks as flat parameter vectors."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork
+
+rng = np.random.default_rng()
+
+
+def flatten_network(network: PolicyNetwork) -> NDArray:
+    """Flatten the weights and biases of a neural network into one parameter vector, layer by layer.
+
+    :param PolicyNetwork network: Network to flatten
+    :return NDArray: Parameter vector, in the same order as `flatten_chromosomes`
+    """
+    return np.concatenate(
+        [
+            np.concatenate([_weights.ravel(), _biases])
+            for _weights, _biases in zip(network._weights, network._biases, strict=True)
+        ]
+    )
+
+
+def unflatten_network(parameters: NDArray, template: PolicyNetwork) -> PolicyNetwork:
+    """Build a neural network with the layer sizes of a template from a parameter vector.
+
+    :param NDArray parameters: Parameter vector, as given by `flatten_network`
+    :param PolicyNetwork template: Network with the layer sizes and activations to use
+    :return PolicyNetwork: Network with the given parameters
+    """
+    _weights = []
+    _biases = []
+    _start = 0
+    for _template_weights in template._weights:
+        _end = _start + _template_weights.size
+        _weights.append(parameters[_start:_end].reshape(_template_weights.shape))
+        _start, _end = _end, _end + _template_weights.shape[0]
+        _biases.append(parameters[_start:_end])
+        _start = _end
+    return PolicyNetwork(_weights, _biases, template._activations)
+
+
+def centred_ranks(fitness: NDArray) -> NDArray:
+    """Shape fitness values into their ranks, scaled to lie evenly between -0.5 and 0.5.
+
+    Ranks make the update independent of the scale of the fitness, so a few Birds with far higher scores than the rest
+    do not swamp it.
+
+    :param NDArray fitness: Fitness of each sample
+    :return NDArray: Shaped fitness of each sample
+    """
+    _ranks = np.empty(fitness.size)
+    _ranks[np.argsort(fitness, kind="stable")] = np.arange(fitness.size)
+    _shaped: NDArray = _ranks / max(fitness.size - 1, 1) - 0.5
+    return _shaped
+
+
+class OpenAIES:
+    """This class implements the evolution strategy of Salimans et al. (2017), known as OpenAI-ES.
+
+    Each generation samples parameter vectors around a mean with Gaussian noise, using antithetic pairs of noise and
+    its negation to cancel out sampling error. The mean moves along the estimated gradient of the centred rank fitness
+    using Adam. With an odd population size the last sample is the mean itself.
+    """
+
+    def __init__(
+        self,
+        mean: NDArray,
+        population_size: int,
+        sigma: float,
+        learning_rate: float,
+        beta1: float = 0.9,
+        beta2: float = 0.999,
+    ) -> None:
+        """Initialise OpenAIES.
+
+        :param NDArray mean: Starting parameter vector
+        :param int population_size: Number of samples per generation
+        :param float sigma: Standard deviation of the noise
+        :param float learning_rate: Adam step size
+        :param float beta1: Adam decay rate of the gradient mean
+        :param float beta2: Adam decay rate of the squared gradient mean
+        """
+        self._mean = mean.astype(float)
+        self._num_pairs = population_size // 2
+        self._population_size = population_size
+        self._sigma = sigma
+        self._learning_rate = learning_rate
+        self._beta1 = beta1
+        self._beta2 = beta2
+        self._moment = np.zeros_like(self._mean)
+        self._second_moment = np.zeros_like(self._mean)
+        self._num_updates = 0
+        self._noise = np.zeros((self._num_pairs, self._mean.size))
+
+    @property
+    def mean(self) -> NDArray:
+        """Get mean parameter vector."""
+        return self._mean
+
+    def ask(self) -> NDArray:
+        """Sample the parameter vectors of the next generation.
+
+        :return NDArray: Samples with shape (population size, parameters)
+        """
+        self._noise = rng.standard_normal((self._num_pairs, self._mean.size))
+        _samples = [self._mean + self._sigma * self._noise, self._mean - self._sigma * self._noise]
+        if self._population_size % 2:
+            _samples.append(self._mean[None])
+        return np.concatenate(_samples)
+
+    def tell(self, fitness: NDArray) -> None:
+        """Move the mean along the estimated fitness gradient of the last samples.
+
+        :param NDArray fitness: Fitness of each sample, in the order returned by `ask`
+        """
+        _shaped = centred_ranks(fitness)
+        _gradient = (_shaped[: self._num_pairs] - _shaped[self._num_pairs : 2 * self._num_pairs]) @ self._noise
+        _gradient /= 2 * self._num_pairs * self._sigma
+
+        self._num_updates += 1
+        self._moment = self._beta1 * self._moment + (1 - self._beta1) * _gradient
+        self._second_moment = self._beta2 * self._second_moment + (1 - self._beta2) * _gradient**2
+        _step_size = (
+            self._learning_rate * np.sqrt(1 - self._beta2**self._num_updates) / (1 - self._beta1**self._num_updates)
+        )
+        self._mean += _step_size * self._moment / (np.sqrt(self._second_moment) + 1e-8)
+
+
+class SepCMAES:
+    """This class implements the separable CMA-ES of Ros and Hansen (2008), which adapts a diagonal covariance.
+
+    Samples are drawn from a Gaussian with a per parameter scale, and the mean moves to a weighted average of the
+    fittest half. The step size and the scale of each parameter are adapted from evolution paths, at a cost linear in
+    the number of parameters rather than quadratic as in full CMA-ES.
+    """
+
+    def __init__(self, mean: NDArray, population_size: int, sigma: float) -> None:
+        """Initialise SepCMAES with the default strategy parameters for its dimension and population size.
+
+        :param NDArray mean: Starting parameter vector
+        :param int population_size: Number of samples per generation
+        :param float sigma: Starting step size
+        """
+        self._mean = mean.astype(float)
+        self._sigma = sigma
+        _dimension = self._mean.size
+        self._num_parents = population_size // 2
+        _weights = np.log(self._num_parents + 0.5) - np.log(np.arange(1, self._num_parents + 1))
+        self._weights = _weights / _weights.sum()
+        self._mu_eff = 1 / np.sum(self._weights**2)
+
+        self._c_c = (4 + self._mu_eff / _dimension) / (_dimension + 4 + 2 * self._mu_eff / _dimension)
+        self._c_sigma = (self._mu_eff + 2) / (_dimension + self._mu_eff + 5)
+        # Learning rates of the full covariance, sped up as a diagonal has fewer entries to learn
+        _separable = (_dimension + 2) / 3
+        self._c_1 = min(1, _separable * 2 / ((_dimension + 1.3) ** 2 + self._mu_eff))
+        self._c_mu = min(
+            1 - self._c_1,
+            _separable * 2 * (self._mu_eff - 2 + 1 / self._mu_eff) / ((_dimension + 2) ** 2 + self._mu_eff),
+        )
+        self._damping = 1 + 2 * max(0, np.sqrt((self._mu_eff - 1) / (_dimension + 1)) - 1) + self._c_sigma
+        self._expected_norm = np.sqrt(_dimension) * (1 - 1 / (4 * _dimension) + 1 / (21 * _dimension**2))
+
+        self._variances = np.ones(_dimension)
+        self._path_c = np.zeros(_dimension)
+        self._path_sigma = np.zeros(_dimension)
+        self._num_updates = 0
+        self._steps = np.zeros((population_size, _dimension))
+
+    @property
+    def mean(self) -> NDArray:
+        """Get mean parameter vector."""
+        return self._mean
+
+    @property
+    def sigma(self) -> float:
+        """Get step size."""
+        return self._sigma
+
+    def ask(self) -> NDArray:
+        """Sample the parameter vectors of the next generation.
+
+        :return NDArray: Samples with shape (population size, parameters)
+        """
+        self._steps = rng.standard_normal(self._steps.shape) * np.sqrt(self._variances)
+        _samples: NDArray = self._mean + self._sigma * self._steps
+        return _samples
+
+    def tell(self, fitness: NDArray) -> None:
+        """Move the mean to the fittest samples and adapt the step size and covariance.
+
+        :param NDArray fitness: Fitness of each sample, in the order returned by `ask`
+        """
+        _parents = self._steps[np.argsort(-fitness, kind="stable")[: self._num_parents]]
+        _step = self._weights @ _parents
+        self._mean += self._sigma * _step
+        self._num_updates += 1
+
+        self._path_sigma = (1 - self._c_sigma) * self._path_sigma + np.sqrt(
+            self._c_sigma * (2 - self._c_sigma) * self._mu_eff
+        ) * _step / np.sqrt(self._variances)
+        _norm = np.linalg.norm(self._path_sigma)
+        self._sigma *= np.exp(self._c_sigma / self._damping * (_norm / self._expected_norm - 1))
+
+        # Stall the covariance path while the step size path is long, so a fast growing step size is not learnt twice
+        _stalled = (
+            _norm / np.sqrt(1 - (1 - self._c_sigma) ** (2 * self._num_updates))
+            >= (1.4 + 2 / (self._mean.size + 1)) * self._expected_norm
+        )
+        _h_sigma = 0.0 if _stalled else 1.0
+        self._path_c = (1 - self._c_c) * self._path_c + _h_sigma * np.sqrt(
+            self._c_c * (2 - self._c_c) * self._mu_eff
+        ) * _step
+        self._variances = (
+            (1 - self._c_1 - self._c_mu) * self._variances
+            + self._c_1 * (self._path_c**2 + (1 - _h_sigma) * self._c_c * (2 - self._c_c) * self._variances)
+            + self._c_mu * (self._weights @ _parents**2)
+        )
+
+
+def create_strategy(
+    name: str, mean: NDArray, population_size: int, sigma: float, learning_rate: float
+) -> OpenAIES | SepCMAES:
+    """Create an evolution strategy by name.
+
+    :param str name: Evolution strategy, either "openai_es" or "sep_cma_es"
+    :param NDArray mean: Starting parameter vector
+    :param int population_size: Number of samples per generation
+    :param float sigma: Standard deviation of the noise, or starting step size of CMA-ES
+    :param float learning_rate: Adam step size of OpenAI-ES, unused by CMA-ES which sets its own learning rates
+    :return OpenAIES | SepCMAES: Evolution strategy
+    """
+    _strategies: dict[str, Callable[[], OpenAIES | SepCMAES]] = {
+        "openai_es": lambda: OpenAIES(mean, population_size, sigma, learning_rate),
+        "sep_cma_es": lambda: SepCMAES(mean, population_size, sigma),
+    }
+    return _strategies[name]()
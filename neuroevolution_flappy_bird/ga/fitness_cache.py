@@ -0,0 +1,78 @@
+"""Cache of Course scores for unchanged genomes."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+
+from numpy.typing import NDArray
+
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork
+
+
+class FitnessCache:
+    """This class caches the scores of genomes on Courses so that unchanged genomes are not played again.
+
+    Courses are deterministic, so a genome carried over unchanged, or appearing twice in a generation, scores the same
+    on the same Courses. Entries are keyed on a BLAKE2b digest of the genome's parameter bytes and the Course seeds,
+    and the least recently used entry is evicted once the cache is full.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialise FitnessCache with a maximum number of entries.
+
+        :param int max_size: Maximum number of cached genomes
+        """
+        self._max_size = max_size
+        self._entries: OrderedDict[bytes, NDArray] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Get number of cached genomes."""
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Get fraction of lookups found in the cache."""
+        _lookups = self._hits + self._misses
+        return self._hits / _lookups if _lookups else 0.0
+
+    @staticmethod
+    def key(network: PolicyNetwork, course_seeds: list[int]) -> bytes:
+        """Get the cache key of a genome played on a set of Courses.
+
+        :param PolicyNetwork network: Neural network of the genome
+        :param list[int] course_seeds: Seed of each Course
+        :return bytes: Digest of the genome and Course seeds
+        """
+        _hash = hashlib.blake2b(digest_size=16)
+        for _weights, _biases in zip(network._weights, network._biases, strict=True):
+            _hash.update(_weights.tobytes())
+            _hash.update(_biases.tobytes())
+        _hash.update(str(course_seeds).encode())
+        return _hash.digest()
+
+    def get(self, key: bytes) -> NDArray | None:
+        """Get the cached scores of a genome, marking it as recently used.
+
+        :param bytes key: Cache key
+        :return NDArray | None: Score on each Course, or None if the genome is not cached
+        """
+        if (_scores := self._entries.get(key)) is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return _scores
+
+    def put(self, key: bytes, scores: NDArray) -> None:
+        """Cache the scores of a genome, evicting the least recently used genome if the cache is full.
+
+        :param bytes key: Cache key
+        :param NDArray scores: Score on each Course
+        """
+        self._entries[key] = scores
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
@@ -0,0 +1,188 @@
+"""Lookup table policies distilled from trained neural networks for decisions without matrix products."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork
+from neuroevolution_flappy_bird.objects.pipe import Pipe
+from neuroevolution_flappy_bird.objects.world import GRAV, MIN_VELOCITY
+
+# Observations used as table axes: Bird y, velocity, top Pipe height and Pipe x. The bottom Pipe height is left out as
+# it is fixed by the top Pipe height
+TABLE_AXES = [0, 1, 2, 4]
+BOTTOM_HEIGHT = 3
+
+
+def observation_bounds(x_lim: int, y_lim: int, bird_x: int) -> tuple[NDArray, NDArray]:
+    """Get the range of each table axis that alive Birds can observe.
+
+    :param int x_lim: Screen width
+    :param int y_lim: Screen height
+    :param int bird_x: x coordinate of Birds
+    :return tuple[NDArray, NDArray]: Lower and upper bound of Bird y, velocity, top Pipe height and Pipe x
+    """
+    # Fastest fall, reached by falling the height of the screen after a jump
+    _max_velocity = np.sqrt(MIN_VELOCITY**2 + 2 * GRAV * y_lim)
+    return (
+        np.array([0, _max_velocity / MIN_VELOCITY, Pipe.SPACING / y_lim, (bird_x - Pipe.WIDTH) / x_lim]),
+        np.array([1, 1, (y_lim - 2 * Pipe.SPACING) / y_lim, 1]),
+    )
+
+
+class LookupPolicy:
+    """This class decides whether a Bird jumps by looking up its observation in a table of a network's decisions.
+
+    The observation space is split into a grid of cells over Bird y, velocity, top Pipe height and Pipe x, and the
+    network's decision at the centre of each cell is stored as one bit. Observations before the first Pipe has spawned
+    have no Pipe inputs, so they are looked up in a second table over Bird y and velocity only. Observations outside the
+    grid use the nearest cell.
+
+    A decision is a handful of arithmetic operations and one bit read, whatever the size of the network.
+    """
+
+    def __init__(self, lows: NDArray, highs: NDArray, bins: NDArray, bits: NDArray) -> None:
+        """Initialise LookupPolicy with a grid and its packed decisions.
+
+        :param NDArray lows: Lower bound of each table axis
+        :param NDArray highs: Upper bound of each table axis
+        :param NDArray bins: Number of cells along each table axis
+        :param NDArray bits: Packed decisions of every cell with Pipe inputs, followed by every cell without
+        """
+        self._lows = lows
+        self._highs = highs
+        self._bins = bins
+        self._bits = bits
+        self._num_cells = int(np.prod(bins))
+        self._scales = bins / (highs - lows)
+        self._strides = np.append(np.cumprod(bins[:0:-1])[::-1], 1)
+        self._no_pipe_strides = np.array([bins[1], 1])
+        # Plain Python copies of the grid for single observations, where NumPy's per call overhead would dominate
+        _grid = list(zip(TABLE_AXES, lows.tolist(), self._scales.tolist(), (bins - 1).tolist(), strict=True))
+        self._pipe_axes = [(*_axis, _stride) for _axis, _stride in zip(_grid, self._strides.tolist(), strict=True)]
+        self._no_pipe_axes = [
+            (*_axis, _stride) for _axis, _stride in zip(_grid[:2], self._no_pipe_strides.tolist(), strict=True)
+        ]
+        self._bytes = bits.tobytes()
+
+    @property
+    def num_cells(self) -> int:
+        """Get number of cells with Pipe inputs."""
+        return self._num_cells
+
+    @property
+    def precision(self) -> str:
+        """Get floating point precision of the observations the table is looked up with."""
+        return "float64"
+
+    @staticmethod
+    def cell_centres(lows: NDArray, highs: NDArray, bins: NDArray) -> NDArray:
+        """Get the centre of every cell of a grid, in C order.
+
+        :param NDArray lows: Lower bound of each axis
+        :param NDArray highs: Upper bound of each axis
+        :param NDArray bins: Number of cells along each axis
+        :return NDArray: Cell centres with shape (number of cells, number of axes)
+        """
+        _axes = [
+            _low + (np.arange(_bins) + 0.5) * (_high - _low) / _bins
+            for _low, _high, _bins in zip(lows, highs, bins, strict=True)
+        ]
+        return np.stack(np.meshgrid(*_axes, indexing="ij"), axis=-1).reshape(-1, len(_axes))
+
+    @classmethod
+    def distill(
+        cls, network: PolicyNetwork, lows: NDArray, highs: NDArray, bins: NDArray, y_lim: int, batch_size: int = 65536
+    ) -> LookupPolicy:
+        """Evaluate a network at the centre of every cell of a grid.
+
+        :param PolicyNetwork network: Network to distill
+        :param NDArray lows: Lower bound of Bird y, velocity, top Pipe height and Pipe x
+        :param NDArray highs: Upper bound of Bird y, velocity, top Pipe height and Pipe x
+        :param NDArray bins: Number of cells along each table axis
+        :param int y_lim: Screen height, used to work out the bottom Pipe height of each cell
+        :param int batch_size: Number of cells evaluated per forward pass
+        :return LookupPolicy: Lookup table of the network's decisions
+        """
+        _centres = cls.cell_centres(lows, highs, bins)
+        _observations = np.zeros((len(_centres), 5))
+        _observations[:, TABLE_AXES] = _centres
+        _observations[:, BOTTOM_HEIGHT] = 1 - _centres[:, 2] + Pipe.SPACING / y_lim
+
+        _no_pipe_observations = np.zeros((int(np.prod(bins[:2])), 5))
+        _no_pipe_observations[:, :2] = cls.cell_centres(lows[:2], highs[:2], bins[:2])
+
+        _all_observations = np.concatenate([_observations, _no_pipe_observations])
+        _jumps = np.concatenate(
+            [
+                network.jumps(_all_observations[_start : _start + batch_size])
+                for _start in range(0, len(_all_observations), batch_size)
+            ]
+        )
+        return cls(lows, highs, bins, np.packbits(_jumps))
+
+    @classmethod
+    def load(cls, filepath: str) -> LookupPolicy:
+        """Load LookupPolicy from file.
+
+        :param str filepath: Path to lookup table file
+        :return LookupPolicy: Loaded lookup table
+        """
+        with np.load(filepath) as table_file:
+            return cls(table_file["lows"], table_file["highs"], table_file["bins"], table_file["bits"])
+
+    def save(self, filepath: str) -> None:
+        """Save LookupPolicy to file.
+
+        :param str filepath: Path to lookup table file
+        """
+        np.savez(filepath, lows=self._lows, highs=self._highs, bins=self._bins, bits=self._bits)
+
+    def cell_indices(self, inputs: NDArray) -> NDArray:
+        """Get the cell each observation falls in, with cells without Pipe inputs after those with Pipe inputs.
+
+        :param NDArray inputs: Observation of one Bird, or a batch of observations with one row per Bird
+        :return NDArray: Index of each observation's cell
+        """
+        _cells = np.clip(((inputs[..., TABLE_AXES] - self._lows) * self._scales).astype(np.int64), 0, self._bins - 1)
+        _indices: NDArray = np.where(
+            inputs[..., 2] == 0, self.num_cells + _cells[..., :2] @ self._no_pipe_strides, _cells @ self._strides
+        )
+        return _indices
+
+    def jump(self, observation: Sequence[float]) -> bool:
+        """Decide whether a single Bird jumps using plain Python arithmetic.
+
+        :param Sequence[float] observation: Observation of one Bird
+        :return bool: Whether the Bird jumps
+        """
+        _axes, _cell = (self._pipe_axes, 0) if observation[2] else (self._no_pipe_axes, self._num_cells)
+        for _axis, _low, _scale, _last, _stride in _axes:
+            _cell += min(max(int((observation[_axis] - _low) * _scale), 0), _last) * _stride
+        return bool(self._bytes[_cell >> 3] >> (7 - (_cell & 7)) & 1)
+
+    def jumps(self, inputs: NDArray) -> NDArray:
+        """Decide whether each Bird jumps by reading its cell's bit.
+
+        :param NDArray inputs: Observation of one Bird, or a batch of observations with one row per Bird
+        :return NDArray: Whether each Bird jumps
+        """
+        if inputs.ndim == 1:
+            return np.array(self.jump(inputs.tolist()))
+        _cells = self.cell_indices(inputs)
+        _bits: NDArray = (self._bits[_cells >> 3] >> (7 - (_cells & 7))) & 1
+        return _bits.astype(bool)
+
+
+def load_policy(filepath: str) -> PolicyNetwork | LookupPolicy:
+    """Load an exported neural network or a lookup table distilled from one.
+
+    :param str filepath: Path to network or lookup table file
+    :return PolicyNetwork | LookupPolicy: Loaded policy
+    """
+    with np.load(filepath) as policy_file:
+        _is_table = "bits" in policy_file.files
+    return LookupPolicy.load(filepath) if _is_table else PolicyNetwork.load(filepath)
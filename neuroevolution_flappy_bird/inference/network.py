@@ -0,0 +1,215 @@
+"""Standalone neural network for playing Flappy Bird without the genetic algorithm."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import numpy as np
+from numpy.typing import NDArray
+
+# The genetic algorithm and neural network libraries are only needed to export a network, so loading and playing a
+# network does not depend on them
+if TYPE_CHECKING:
+    from neuroevolution_flappy_bird.ga.bird_member import BirdMember
+
+
+class PolicyNetwork:
+    """This class runs the forward pass of a trained Bird's neural network using only NumPy.
+
+    The weights and biases of each layer are copied out of a `BirdMember`, so a network can be saved to a file and
+    played on machines without the genetic algorithm or neural network libraries. Inputs can be a single Bird's
+    observation or a batch of observations with one row per Bird.
+
+    Inputs are cast to the precision of the parameters, so a float32 network runs its forward pass in float32.
+    """
+
+    ACTIVATIONS: ClassVar[dict[str, Callable[[NDArray], NDArray]]] = {
+        "linear": lambda x: x,
+        "relu": lambda x: np.maximum(x, 0),
+    }
+
+    def __init__(self, weights: list[NDArray], biases: list[NDArray], activations: list[str]) -> None:
+        """Initialise PolicyNetwork with the parameters of each layer.
+
+        :param list[NDArray] weights: Weights of each layer, with shape (layer size, previous layer size)
+        :param list[NDArray] biases: Biases of each layer, with shape (layer size,)
+        :param list[str] activations: Activation function of each layer
+        """
+        self._weights = weights
+        self._biases = biases
+        self._activations = activations
+
+    @property
+    def layer_sizes(self) -> list[int]:
+        """Get size of each layer, starting with the input layer."""
+        return [self._weights[0].shape[1], *[_weights.shape[0] for _weights in self._weights]]
+
+    @property
+    def precision(self) -> str:
+        """Get floating point precision of the network's parameters."""
+        return str(self._weights[0].dtype)
+
+    def astype(self, precision: str) -> PolicyNetwork:
+        """Copy the network with its parameters in another floating point precision.
+
+        :param str precision: Floating point precision, either "float32" or "float64"
+        :return PolicyNetwork: Network with parameters in the given precision
+        """
+        return PolicyNetwork(
+            [_weights.astype(precision) for _weights in self._weights],
+            [_biases.astype(precision) for _biases in self._biases],
+            self._activations,
+        )
+
+    @classmethod
+    def from_member(cls, member: BirdMember) -> PolicyNetwork:
+        """Copy the neural network of a BirdMember.
+
+        :param BirdMember member: Member to copy neural network from
+        :return PolicyNetwork: Network with the member's weights and biases
+        """
+        _weights, _biases = member.chromosome
+        return cls(
+            [np.array(_layer_weights.vals, dtype=float) for _layer_weights in _weights[1:]],
+            [np.array(_layer_biases.vals, dtype=float).ravel() for _layer_biases in _biases[1:]],
+            [*["relu"] * len(member._hidden_layer_sizes), "linear"],
+        )
+
+    @classmethod
+    def load(cls, filepath: str) -> PolicyNetwork:
+        """Load PolicyNetwork from file.
+
+        :param str filepath: Path to network file
+        :return PolicyNetwork: Loaded network
+        """
+        with np.load(filepath) as network_file:
+            _activations = [str(_activation) for _activation in network_file["activations"]]
+            return cls(
+                [network_file[f"weights_{_layer}"] for _layer in range(len(_activations))],
+                [network_file[f"biases_{_layer}"] for _layer in range(len(_activations))],
+                _activations,
+            )
+
+    def save(self, filepath: str) -> None:
+        """Save PolicyNetwork to file.
+
+        :param str filepath: Path to network file
+        """
+        _arrays: dict[str, Any] = {
+            "layer_sizes": np.array(self.layer_sizes),
+            "activations": np.array(self._activations),
+        }
+        for _layer, (_weights, _biases) in enumerate(zip(self._weights, self._biases, strict=True)):
+            _arrays[f"weights_{_layer}"] = _weights
+            _arrays[f"biases_{_layer}"] = _biases
+        np.savez(filepath, **_arrays)
+
+    def feedforward(self, inputs: NDArray) -> NDArray:
+        """Run the forward pass of the network.
+
+        :param NDArray inputs: Observation of one Bird, or a batch of observations with one row per Bird
+        :return NDArray: Output of the network for each observation
+        """
+        _outputs = inputs.astype(self._weights[0].dtype, copy=False)
+        for _weights, _biases, _activation in zip(self._weights, self._biases, self._activations, strict=True):
+            _outputs = self.ACTIVATIONS[_activation](_outputs @ _weights.T + _biases)
+        return _outputs
+
+    def jumps(self, inputs: NDArray) -> NDArray:
+        """Decide whether each Bird jumps, in the same way as `Bird.update`.
+
+        :param NDArray inputs: Observation of one Bird, or a batch of observations with one row per Bird
+        :return NDArray: Whether each Bird jumps
+        """
+        _outputs = self.feedforward(inputs)
+        return _outputs[..., 0] < _outputs[..., 1]
+
+
+class PopulationNetwork:
+    """This class runs the forward pass of every Bird's neural network in a population at once using only NumPy.
+
+    The weights and biases of each layer are stacked along a leading population axis, so a single batched matrix
+    product per layer evaluates every Bird on every Course instead of one feedforward call per Bird.
+    """
+
+    def __init__(self, weights: list[NDArray], biases: list[NDArray], activations: list[str]) -> None:
+        """Initialise PopulationNetwork with the stacked parameters of each layer.
+
+        :param list[NDArray] weights: Weights of each layer, with shape (population size, layer size, previous size)
+        :param list[NDArray] biases: Biases of each layer, with shape (population size, layer size)
+        :param list[str] activations: Activation function of each layer
+        """
+        self._weights = weights
+        self._biases = biases
+        self._activations = activations
+
+    @property
+    def precision(self) -> str:
+        """Get floating point precision of the networks' parameters."""
+        return str(self._weights[0].dtype)
+
+    def astype(self, precision: str) -> PopulationNetwork:
+        """Copy the networks with their parameters in another floating point precision.
+
+        :param str precision: Floating point precision, either "float32" or "float64"
+        :return PopulationNetwork: Networks with parameters in the given precision
+        """
+        return PopulationNetwork(
+            [_weights.astype(precision) for _weights in self._weights],
+            [_biases.astype(precision) for _biases in self._biases],
+            self._activations,
+        )
+
+    @classmethod
+    def from_networks(cls, networks: list[PolicyNetwork]) -> PopulationNetwork:
+        """Stack the networks of a population, which must share their layer sizes.
+
+        :param list[PolicyNetwork] networks: Network of each Bird
+        :return PopulationNetwork: Stacked networks
+        """
+        return cls(
+            [
+                np.stack(_layer_weights)
+                for _layer_weights in zip(*[_network._weights for _network in networks], strict=True)
+            ],
+            [
+                np.stack(_layer_biases)
+                for _layer_biases in zip(*[_network._biases for _network in networks], strict=True)
+            ],
+            networks[0]._activations,
+        )
+
+    def feedforward(self, inputs: NDArray) -> NDArray:
+        """Run the forward pass of each Bird's network on its own observations.
+
+        :param NDArray inputs: Observations with shape (..., population size, input size)
+        :return NDArray: Outputs with shape (..., population size, output size)
+        """
+        _outputs = inputs.astype(self._weights[0].dtype, copy=False)
+        for _weights, _biases, _activation in zip(self._weights, self._biases, self._activations, strict=True):
+            _outputs = PolicyNetwork.ACTIVATIONS[_activation](
+                np.einsum("poi,...pi->...po", _weights, _outputs) + _biases
+            )
+        return _outputs
+
+    def select(self, birds: slice) -> PopulationNetwork:
+        """Get the networks of a range of Birds without copying their parameters.
+
+        :param slice birds: Birds to select
+        :return PopulationNetwork: Networks of the selected Birds
+        """
+        return PopulationNetwork(
+            [_weights[birds] for _weights in self._weights],
+            [_biases[birds] for _biases in self._biases],
+            self._activations,
+        )
+
+    def jumps(self, inputs: NDArray) -> NDArray:
+        """Decide whether each Bird jumps, in the same way as `Bird.update`.
+
+        :param NDArray inputs: Observations with shape (..., population size, input size)
+        :return NDArray: Whether each Bird jumps, with shape (..., population size)
+        """
+        _outputs = self.feedforward(inputs)
+        return _outputs[..., 0] < _outputs[..., 1]
@@ -0,0 +1,112 @@
+"""Magnitude pruning of trained neural networks for faster inference."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+from neuroevolution_flappy_bird.inference.lookup import LookupPolicy
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork
+from neuroevolution_flappy_bird.objects.world import World
+
+
+def prune_weights(network: PolicyNetwork, threshold: float) -> PolicyNetwork:
+    """Set every weight with a magnitude below a threshold to zero.
+
+    :param PolicyNetwork network: Network to prune
+    :param float threshold: Smallest weight magnitude to keep
+    :return PolicyNetwork: Network with small weights set to zero
+    """
+    return PolicyNetwork(
+        [np.where(np.abs(_weights) < threshold, 0, _weights) for _weights in network._weights],
+        [_biases.copy() for _biases in network._biases],
+        network._activations,
+    )
+
+
+def remove_dead_units(network: PolicyNetwork) -> PolicyNetwork:
+    """Remove the hidden units that cannot change the network's outputs.
+
+    A unit with no outgoing weights is removed. A unit with no incoming weights always outputs its activated bias, so
+    that constant is folded into the biases of the next layer before it is removed. Both are exact, so the pruned
+    network gives the same outputs for every input. Removing units can leave others without weights, so this repeats
+    until no more units are removed.
+
+    :param PolicyNetwork network: Network to remove units from
+    :return PolicyNetwork: Network without dead hidden units
+    """
+    _weights = [_layer_weights.copy() for _layer_weights in network._weights]
+    _biases = [_layer_biases.copy() for _layer_biases in network._biases]
+
+    _removed = True
+    while _removed:
+        _removed = False
+        for _layer in range(len(_weights) - 1):
+            _no_outputs = ~np.any(_weights[_layer + 1], axis=0)
+            _no_inputs = ~np.any(_weights[_layer], axis=1)
+            _dead = _no_outputs | _no_inputs
+            if not np.any(_dead):
+                continue
+
+            _constants = PolicyNetwork.ACTIVATIONS[network._activations[_layer]](_biases[_layer])
+            _folded = _no_inputs & ~_no_outputs
+            _biases[_layer + 1] += _weights[_layer + 1][:, _folded] @ _constants[_folded]
+
+            _weights[_layer] = _weights[_layer][~_dead]
+            _biases[_layer] = _biases[_layer][~_dead]
+            _weights[_layer + 1] = _weights[_layer + 1][:, ~_dead]
+            _removed = True
+
+    return PolicyNetwork(_weights, _biases, network._activations)
+
+
+def prune(network: PolicyNetwork, threshold: float) -> PolicyNetwork:
+    """Prune small weights from a network and remove the hidden units left without weights.
+
+    :param PolicyNetwork network: Network to prune
+    :param float threshold: Smallest weight magnitude to keep
+    :return PolicyNetwork: Pruned network
+    """
+    return remove_dead_units(prune_weights(network, threshold))
+
+
+def expand(network: PolicyNetwork, layer_sizes: list[int]) -> PolicyNetwork:
+    """Pad the hidden layers of a pruned network with units that have no weights, back up to the given layer sizes.
+
+    The padded units have zero weights and biases, so for ReLU hidden layers the expanded network gives the same outputs
+    as the pruned one. This lets a pruned network seed a population with the original layer sizes.
+
+    :param PolicyNetwork network: Pruned network
+    :param list[int] layer_sizes: Size of each layer, starting with the input layer
+    :return PolicyNetwork: Network with the given layer sizes
+    """
+    _weights = []
+    _biases = []
+    for _layer, (_layer_weights, _layer_biases) in enumerate(zip(network._weights, network._biases, strict=True)):
+        _padded_weights = np.zeros((layer_sizes[_layer + 1], layer_sizes[_layer]), dtype=_layer_weights.dtype)
+        _padded_weights[: _layer_weights.shape[0], : _layer_weights.shape[1]] = _layer_weights
+        _padded_biases = np.zeros(layer_sizes[_layer + 1], dtype=_layer_biases.dtype)
+        _padded_biases[: _layer_biases.size] = _layer_biases
+        _weights.append(_padded_weights)
+        _biases.append(_padded_biases)
+    return PolicyNetwork(_weights, _biases, network._activations)
+
+
+def decision_agreement(network: PolicyNetwork, pruned: PolicyNetwork | LookupPolicy, world: World) -> float:
+    """Play a World with a network and compare the decisions a pruned copy or lookup table would make at every step.
+
+    :param PolicyNetwork network: Network playing the World
+    :param PolicyNetwork | LookupPolicy pruned: Pruned copy of the network, or lookup table distilled from it
+    :param World world: World to play, usually with held-out Courses and one Bird per Course
+    :return float: Fraction of decisions by alive Birds that the pruned network or lookup table agrees with
+    """
+    _matches = []
+
+    def _policy(observations: NDArray) -> NDArray:
+        _jumps = network.jumps(observations)
+        _matches.append((_jumps == pruned.jumps(observations))[world._alive])
+        return _jumps
+
+    while not world.done:
+        world.step_policy(_policy)
+    return float(np.mean(np.concatenate(_matches)))
@@ -1,16 +1,42 @@
 """Main module to run the Flappy Bird neuroevolution application."""
 
+import argparse
 import json
+from typing import Any
 
-from neuroevolution_flappy_bird.flappy_bird_app import FlappyBirdApp
+import numpy as np
+
+from neuroevolution_flappy_bird.inference.lookup import LookupPolicy, load_policy, observation_bounds
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork
+from neuroevolution_flappy_bird.inference.prune import decision_agreement
+from neuroevolution_flappy_bird.inference.prune import prune as prune_network
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.objects.world import World
+from neuroevolution_flappy_bird.replay import Replay
 
 CONFIG_FILEPATH = "./config/config.json"
+SWEEP_CONFIG_FILEPATH = "./config/sweep.json"
 
 
-def run() -> None:
-    """Run the Flappy Bird neuroevolution simulation."""
-    with open(CONFIG_FILEPATH) as config_file:
-        config = json.load(config_file)
+def load_config(filepath: str) -> dict[str, Any]:
+    """Load a JSON configuration file.
+
+    :param str filepath: Path to configuration file
+    :return dict[str, Any]: Configuration
+    """
+    with open(filepath) as config_file:
+        config: dict[str, Any] = json.load(config_file)
+    return config
+
+
+def train(config: dict[str, Any]) -> None:
+    """Run the Flappy Bird neuroevolution simulation.
+
+    :param dict[str, Any] config: App and genetic algorithm configuration
+    """
+    # Training modules are imported on use so playing and replaying do not need the genetic algorithm library
+    from neuroevolution_flappy_bird.flappy_bird_app import FlappyBirdApp, add_ga_kwargs  # noqa: PLC0415
+
     app_config = config["app"]
     ga_config = config["genetic_algorithm"]
 
@@ -22,15 +48,299 @@ def run() -> None:
         font=app_config["font"],
         font_size=app_config["font_size"],
     )
-    fba.add_ga(
-        population_size=ga_config["population_size"],
-        mutation_rate=ga_config["mutation_rate"],
+    fba.add_ga(**add_ga_kwargs(ga_config))
+    if replay_directory := config.get("replay", {}).get("directory"):
+        fba.add_replay_recorder(replay_directory, config["replay"].get("birds", "best"))
+    if (status_port := config.get("status", {}).get("port")) is not None:
+        print(f"Serving training status on http://127.0.0.1:{fba.add_status_server(status_port)}")
+    if video_path := config.get("video", {}).get("path"):
+        fba.add_frame_recorder(
+            video_path,
+            output_format=config["video"].get("format", "y4m"),
+            queue_size=config["video"].get("queue_size", 64),
+            frame_interval=config["video"].get("frame_interval", 1),
+        )
+    if shared_state_name := config.get("shared_state", {}).get("name"):
+        fba.add_shared_state(shared_state_name, config["shared_state"].get("max_pipes", 16))
+    if (coordinator_port := config.get("distributed", {}).get("port")) is not None:
+        distributed_config = config["distributed"]
+        coordinator_host = distributed_config.get("host", "127.0.0.1")
+        coordinator_port = fba.add_coordinator(
+            coordinator_port,
+            coordinator_host,
+            distributed_config.get("batch_size", 64),
+            distributed_config.get("timeout", 30.0),
+        )
+        num_workers = distributed_config.get("workers", 0)
+        print(f"Waiting for {num_workers} workers on {coordinator_host}:{coordinator_port}")
+        fba.wait_for_workers(num_workers)
+    fba.run()
+    fba.close_frame_recorder()
+    fba.close_shared_state()
+    fba.close_coordinator()
+    fba.close_stepper()
+
+    if champion_filepath := config.get("champion", {}).get("filepath"):
+        fba.export_champion(champion_filepath)
+
+
+def replay(config: dict[str, Any], filepath: str, *, headless: bool) -> None:
+    """Watch a recorded replay, or rebuild it without a display and print the final scores.
+
+    :param dict[str, Any] config: App configuration
+    :param str filepath: Path to replay file
+    :param bool headless: Whether to rebuild the replay without a display
+    """
+    # The pygame apps are imported on use so training, sweep and worker processes start without loading pygame
+    from neuroevolution_flappy_bird.replay_app import ReplayApp  # noqa: PLC0415
+
+    _replay = Replay.load(filepath)
+
+    if headless:
+        _, _, scores = _replay.simulate()
+        print(f"Generation {_replay._generation}: {_replay.num_birds} birds, {_replay.num_steps} steps")
+        print(f"Scores: {scores.tolist()}")
+        return
+
+    app_config = config["app"]
+    ra = ReplayApp.create_game(
+        name=app_config["name"],
+        width=_replay._x_lim,
+        height=_replay._y_lim,
+        fps=_replay._fps,
+        font=app_config["font"],
+        font_size=app_config["font_size"],
+    )
+    ra.add_replay(_replay)
+    ra.run()
+
+
+def sweep(config: dict[str, Any], sweep_config: dict[str, Any]) -> None:
+    """Run a hyperparameter sweep over headless training runs and write a summary table.
+
+    :param dict[str, Any] config: App and base genetic algorithm configuration
+    :param dict[str, Any] sweep_config: Sweep configuration
+    """
+    from neuroevolution_flappy_bird.sweep import (  # noqa: PLC0415
+        format_summary,
+        grid_search,
+        random_search,
+        run_sweep,
+        write_summary,
+    )
+
+    if sweep_config["search"] == "grid":
+        runs = grid_search(sweep_config["parameters"])
+    else:
+        runs = random_search(sweep_config["parameters"], sweep_config["num_samples"], sweep_config.get("seed"))
+
+    results = run_sweep(
+        config["app"], config["genetic_algorithm"], runs, sweep_config["generations"], sweep_config.get("workers")
+    )
+    write_summary(results, sweep_config["output"])
+    print(format_summary(results))
+
+
+def worker(address: str) -> None:
+    """Play batches of Birds sent by a training run's coordinator until it finishes.
+
+    :param str address: Address of the coordinator, as host:port
+    """
+    from neuroevolution_flappy_bird.distributed import run_worker  # noqa: PLC0415
+
+    host, _, port = address.rpartition(":")
+    print(f"Connecting to coordinator on {host}:{port}")
+    num_tasks = run_worker(host, int(port))
+    print(f"Coordinator closed the connection after {num_tasks} batches")
+
+
+def play(config: dict[str, Any], filepath: str, *, headless: bool, games: int) -> None:
+    """Play an exported neural network with a single Bird, or score it over several games without a display.
+
+    :param dict[str, Any] config: App and genetic algorithm configuration
+    :param str filepath: Path to network or lookup table file
+    :param bool headless: Whether to play without a display and print the scores
+    :param int games: Number of games to score without a display
+    """
+    from neuroevolution_flappy_bird.play_app import PlayApp, play_game  # noqa: PLC0415
+
+    app_config = config["app"]
+    ga_config = config["genetic_algorithm"]
+    network = load_policy(filepath)
+
+    app_args = {
+        "name": app_config["name"],
+        "width": app_config["width"],
+        "height": app_config["height"],
+        "fps": app_config["fps"],
+        "font": app_config["font"],
+        "font_size": app_config["font_size"],
+    }
+    pa = PlayApp(**app_args) if headless else PlayApp.create_game(**app_args)
+    pa.add_network(
+        network,
         lifetime=ga_config["lifetime"],
         bird_x=ga_config["bird_x"],
         bird_y=ga_config["bird_y"],
         bird_size=ga_config["bird_size"],
-        hidden_layer_sizes=ga_config["hidden_layer_sizes"],
-        weights_range=ga_config["weights_range"],
-        bias_range=ga_config["bias_range"],
+        course_seed=ga_config.get("course_seed"),
     )
-    fba.run()
+
+    if not headless:
+        pa.run()
+        return
+
+    scores = [play_game(network, pa.create_world(_game)) for _game in range(1, games + 1)]
+    print(f"Scores: {scores}")
+    print(f"Mean score: {sum(scores) / games:.1f}")
+
+
+def held_out_world(config: dict[str, Any], courses: int, seed: int) -> World:
+    """Create a World with one Bird on each of several held-out Courses, for checking a network's approximations.
+
+    :param dict[str, Any] config: App and genetic algorithm configuration
+    :param int courses: Number of held-out Courses
+    :param int seed: Base seed for the held-out Courses
+    :return World: World at the start of the games
+    """
+    app_config = config["app"]
+    ga_config = config["genetic_algorithm"]
+    num_frames = ga_config["lifetime"] * app_config["fps"]
+    return World(
+        [
+            Course.generate(
+                Course.generation_seed(seed, 1, _index), app_config["height"], app_config["fps"], num_frames
+            )
+            for _index in range(courses)
+        ],
+        1,
+        app_config["width"],
+        app_config["height"],
+        num_frames,
+        ga_config["bird_x"],
+        ga_config["bird_y"],
+        ga_config["bird_size"],
+    )
+
+
+def prune(config: dict[str, Any], filepath: str, output: str, threshold: float, courses: int, seed: int) -> None:
+    """Prune an exported neural network and check its decisions still match on held-out Courses.
+
+    :param dict[str, Any] config: App and genetic algorithm configuration
+    :param str filepath: Path to network file
+    :param str output: Path to save the pruned network to
+    :param float threshold: Smallest weight magnitude to keep
+    :param int courses: Number of held-out Courses to check the pruned network on
+    :param int seed: Base seed for the held-out Courses
+    """
+    network = PolicyNetwork.load(filepath)
+    pruned = prune_network(network, threshold)
+    agreement = decision_agreement(network, pruned, held_out_world(config, courses, seed))
+
+    pruned.save(output)
+    _sizes = [int(np.prod(_weights.shape)) for _weights in network._weights]
+    _pruned_sizes = [int(np.count_nonzero(_weights)) for _weights in pruned._weights]
+    print(f"Layer sizes: {network.layer_sizes} -> {pruned.layer_sizes}")
+    print(f"Weights: {sum(_sizes)} -> {sum(_pruned_sizes)} non-zero")
+    print(f"Decision agreement on {courses} held-out courses: {agreement:.2%}")
+
+
+def distill(config: dict[str, Any], filepath: str, output: str, bins: list[int], courses: int, seed: int) -> None:
+    """Distill an exported neural network into a lookup table and check its decisions match on held-out Courses.
+
+    :param dict[str, Any] config: App and genetic algorithm configuration
+    :param str filepath: Path to network file
+    :param str output: Path to save the lookup table to
+    :param list[int] bins: Number of cells along the Bird y, velocity, top Pipe height and Pipe x axes
+    :param int courses: Number of held-out Courses to check the lookup table on
+    :param int seed: Base seed for the held-out Courses
+    """
+    app_config = config["app"]
+    network = PolicyNetwork.load(filepath)
+    lows, highs = observation_bounds(app_config["width"], app_config["height"], config["genetic_algorithm"]["bird_x"])
+    table = LookupPolicy.distill(network, lows, highs, np.array(bins), app_config["height"])
+    agreement = decision_agreement(network, table, held_out_world(config, courses, seed))
+
+    table.save(output)
+    print(f"Cells: {table.num_cells} ({table._bits.nbytes} bytes)")
+    print(f"Decision agreement on {courses} held-out courses: {agreement:.2%}")
+
+
+def run() -> None:
+    """Run the Flappy Bird neuroevolution application."""
+    parser = argparse.ArgumentParser(
+        prog="flappy-bird", description="Train AI to play Flappy Bird using neuroevolution."
+    )
+    parser.add_argument("--config", default=CONFIG_FILEPATH, help="Path to app configuration file")
+    subparsers = parser.add_subparsers(dest="command")
+
+    sweep_parser = subparsers.add_parser("sweep", help="Run a hyperparameter sweep over headless training runs")
+    sweep_parser.add_argument("--sweep-config", default=SWEEP_CONFIG_FILEPATH, help="Path to sweep configuration file")
+
+    worker_parser = subparsers.add_parser("worker", help="Play batches of Birds for a distributed training run")
+    worker_parser.add_argument("--connect", required=True, metavar="HOST:PORT", help="Address of the coordinator")
+
+    replay_parser = subparsers.add_parser("replay", help="Watch a recorded replay")
+    replay_parser.add_argument("filepath", help="Path to replay file")
+    replay_parser.add_argument(
+        "--headless", action="store_true", help="Rebuild the replay without a display and print the final scores"
+    )
+
+    play_parser = subparsers.add_parser("play", help="Play an exported neural network with a single Bird")
+    play_parser.add_argument("--model", required=True, help="Path to network or lookup table file")
+    play_parser.add_argument(
+        "--headless", action="store_true", help="Play without a display and print the score of each game"
+    )
+    play_parser.add_argument("--games", type=int, default=10, help="Number of games to play without a display")
+
+    prune_parser = subparsers.add_parser("prune", help="Prune an exported neural network")
+    prune_parser.add_argument("--model", required=True, help="Path to network file")
+    prune_parser.add_argument("--output", required=True, help="Path to save the pruned network to")
+    prune_parser.add_argument("--threshold", type=float, default=0.05, help="Smallest weight magnitude to keep")
+    prune_parser.add_argument("--courses", type=int, default=20, help="Number of held-out courses to check on")
+    prune_parser.add_argument("--seed", type=int, default=0, help="Base seed for the held-out courses")
+
+    distill_parser = subparsers.add_parser("distill", help="Distill an exported neural network into a lookup table")
+    distill_parser.add_argument("--model", required=True, help="Path to network file")
+    distill_parser.add_argument("--output", required=True, help="Path to save the lookup table to")
+    distill_parser.add_argument(
+        "--bins",
+        type=int,
+        nargs=4,
+        default=[32, 32, 16, 32],
+        metavar=("Y", "VELOCITY", "TOP_HEIGHT", "PIPE_X"),
+        help="Number of cells along each observation axis",
+    )
+    distill_parser.add_argument("--courses", type=int, default=20, help="Number of held-out courses to check on")
+    distill_parser.add_argument("--seed", type=int, default=0, help="Base seed for the held-out courses")
+
+    args = parser.parse_args()
+
+    # Workers are sent every setting by the coordinator, so they run on machines without a configuration file
+    if args.command == "worker":
+        worker(args.connect)
+        return
+
+    config = load_config(args.config)
+
+    if args.command == "sweep":
+        sweep(config, load_config(args.sweep_config))
+        return
+
+    if args.command == "play":
+        play(config, args.model, headless=args.headless, games=args.games)
+        return
+
+    if args.command == "prune":
+        prune(config, args.model, args.output, args.threshold, args.courses, args.seed)
+        return
+
+    if args.command == "distill":
+        distill(config, args.model, args.output, args.bins, args.courses, args.seed)
+        return
+
+    if args.command == "replay":
+        replay(config, args.filepath, headless=args.headless)
+        return
+
+    train(config)
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
-import pygame
 from numpy.typing import NDArray
 
 from neuroevolution_flappy_bird.ga.bird_member import BirdMember
+from neuroevolution_flappy_bird.objects.collision import swept_collision
 from neuroevolution_flappy_bird.objects.pipe import Pipe
 
+# pygame is only needed for drawing and rectangles, so it is imported on first use to keep the simulation importable
+# without it
+if TYPE_CHECKING:
+    import pygame
+
 rng = np.random.default_rng()
 
 
@@ -59,6 +66,7 @@ class Bird(BirdMember):
         self._closest_pipe: Pipe | None = None
 
         self._alive = True
+        self._jumped = False
         self._colour = rng.integers(low=0, high=256, size=3)
         super().__init__(hidden_layer_sizes, weights_range, bias_range)
 
@@ -75,6 +83,8 @@ class Bird(BirdMember):
     @property
     def rect(self) -> pygame.Rect:
         """Get Bird's rectangle for collision detection."""
+        import pygame  # noqa: PLC0415
+
         return pygame.Rect(self._x, self._y, self._size, self._size)
 
     @property
@@ -121,12 +131,44 @@ class Bird(BirdMember):
         self.velocity += self.GRAV
         self._y += self.velocity
 
+    def _sweep(self, timestep: int, pipes: list[Pipe]) -> None:
+        """Move Bird over several frames, and kill it on the first frame it collides with a Pipe.
+
+        :param int timestep: Number of frames to move Bird by
+        :param list[Pipe] pipes: Pipes on screen, already moved by the same number of frames
+        """
+        _frames = np.arange(1, timestep + 1)
+        _ys = self._y + _frames * self.velocity + self.GRAV * _frames * (_frames + 1) // 2
+        _hit_frame = int(
+            swept_collision(
+                self._x,
+                _ys,
+                self._size,
+                self._y_lim,
+                np.array([_pipe._prev_x for _pipe in pipes]),
+                np.array([_pipe._x for _pipe in pipes]),
+                np.array([_pipe._top_height for _pipe in pipes]),
+            )
+        )
+
+        _frames_moved = _hit_frame or timestep
+        self.velocity += self.GRAV * _frames_moved
+        self._y = int(_ys[_frames_moved - 1])
+
+        if _hit_frame:
+            self._alive = False
+            self._score += _hit_frame - 1
+            return
+
+        self._score += timestep
+
     def reset(self) -> None:
         """Reset to start positions."""
         self.velocity = 0
         self._y = self._start_y
         self._score = 0
         self._alive = True
+        self._jumped = False
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw Bird on the display.
@@ -135,12 +177,20 @@ class Bird(BirdMember):
         """
         if not self._alive:
             return
+
+        import pygame  # noqa: PLC0415
+
         pygame.draw.rect(screen, self._colour.tolist(), self.rect)
 
-    def update(self, closest_pipe: Pipe) -> None:
+    def update(self, closest_pipe: Pipe | None, timestep: int = 1, pipes: list[Pipe] | None = None) -> None:
         """Use neural network to determine whether or not Bird should jump, and kill if it collides with a Pipe.
 
-        :param Pipe closest_pipe: Pipe closest to Bird
+        With a timestep above 1 the jump decision is held for the whole step, and collisions with every Pipe are
+        checked on each frame of the step.
+
+        :param Pipe | None closest_pipe: Pipe closest to Bird
+        :param int timestep: Number of frames to simulate
+        :param list[Pipe] | None pipes: Pipes on screen, required for swept collisions when timestep is above 1
         """
         if not self._alive:
             return
@@ -148,9 +198,14 @@ class Bird(BirdMember):
         self._closest_pipe = closest_pipe
         output = self._nn.feedforward(self.nn_input)
 
-        if output[0] < output[1]:
+        self._jumped = bool(output[0] < output[1])
+        if self._jumped:
             self._jump()
 
+        if timestep > 1:
+            self._sweep(timestep, pipes or [])
+            return
+
         self._move()
 
         if self.offscreen or self.collide_with_closest_pipe:
@@ -0,0 +1,44 @@
+"""Swept collision detection for Flappy Bird game."""
+
+import numpy as np
+from numpy.typing import NDArray
+
+from neuroevolution_flappy_bird.objects.pipe import Pipe
+
+
+def swept_collision(
+    bird_x: float,
+    bird_ys: NDArray,
+    size: int,
+    y_lim: int,
+    pipe_start_xs: NDArray,
+    pipe_end_xs: NDArray,
+    top_heights: NDArray,
+) -> NDArray:
+    """Find the first frame of a step on which each Bird hits a Pipe or leaves the screen.
+
+    Each Pipe is swept from its position at the start of the step to its position at the end, and tested against the
+    Bird's position on every frame in between. A Bird cannot tunnel through a Pipe however far either travels in a step.
+    Pipe coordinates are truncated to integers in the same way as the rectangles used for single frame collisions.
+
+    :param float bird_x: x coordinate of Birds
+    :param NDArray bird_ys: y coordinate of each Bird on each frame of the step, with frames along the last axis
+    :param int size: Size of Birds
+    :param int y_lim: Screen height
+    :param NDArray pipe_start_xs: x coordinate of each Pipe at the start of the step
+    :param NDArray pipe_end_xs: x coordinate of each Pipe at the end of the step
+    :param NDArray top_heights: Height of each top Pipe, with a leading axis per Bird if Birds are on different Courses
+    :return NDArray: First colliding frame of the step for each Bird counting from 1, or 0 if the Bird survives
+    """
+    _num_frames = bird_ys.shape[-1]
+    _frames_left = (_num_frames - np.arange(1, _num_frames + 1)) / _num_frames
+    _pipe_xs = np.trunc(pipe_end_xs[:, None] + (pipe_start_xs - pipe_end_xs)[:, None] * _frames_left)
+    _overlap_x = (_pipe_xs < bird_x + size) & (_pipe_xs + Pipe.WIDTH > bird_x)
+
+    _ys = bird_ys[..., None, :]
+    _tops = np.trunc(top_heights)[..., None]
+    _bottoms = np.trunc(top_heights + Pipe.SPACING)[..., None]
+    _outside_gap = (_ys < _tops) | (_ys + size > _bottoms)
+    _hits = np.any(_overlap_x & _outside_gap, axis=-2) | (bird_ys < 0) | (bird_ys + size > y_lim)
+
+    return np.where(np.any(_hits, axis=-1), np.argmax(_hits, axis=-1) + 1, 0)
@@ -0,0 +1,94 @@
+"""Pipe course for Flappy Bird game."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+from neuroevolution_flappy_bird.objects.pipe import Pipe
+
+
+class Course:
+    """This class holds the full schedule of Pipes for a generation.
+
+    The spawn frame, speed and top height of every Pipe are generated up front from a seed so the game loop can consume
+    them by index without branching on spawn timers or drawing random numbers every frame. Courses generated from the
+    same seed and screen settings are identical, so workers can share a course by sharing its seed.
+    """
+
+    def __init__(self, seed: int, spawn_frames: NDArray, speeds: NDArray, top_heights: NDArray) -> None:
+        """Initialise Course with the Pipe schedule.
+
+        :param int seed: Seed used to generate the Course
+        :param NDArray spawn_frames: Frame on which each Pipe spawns
+        :param NDArray speeds: Speed of each Pipe in pixels per frame
+        :param NDArray top_heights: Height of each top Pipe
+        """
+        self._seed = seed
+        self._spawn_frames = spawn_frames
+        self._speeds = speeds
+        self._top_heights = top_heights
+
+    def __len__(self) -> int:
+        """Get number of Pipes in the Course."""
+        return int(self._spawn_frames.size)
+
+    @property
+    def seed(self) -> int:
+        """Get seed used to generate the Course."""
+        return self._seed
+
+    @property
+    def spawn_frames(self) -> NDArray:
+        """Get frame on which each Pipe spawns."""
+        return self._spawn_frames
+
+    @property
+    def speeds(self) -> NDArray:
+        """Get speed of each Pipe in pixels per frame."""
+        return self._speeds
+
+    @property
+    def top_heights(self) -> NDArray:
+        """Get height of each top Pipe."""
+        return self._top_heights
+
+    @staticmethod
+    def generation_seed(seed: int, generation: int, index: int = 0) -> int:
+        """Derive the seed of one of a generation's Courses from a base seed.
+
+        :param int seed: Base seed for the run
+        :param int generation: Generation number
+        :param int index: Index of the Course within the generation
+        :return int: Course seed for the generation
+        """
+        _entropy = [seed, generation, index] if index else [seed, generation]
+        return int(np.random.SeedSequence(_entropy).generate_state(1)[0])
+
+    @classmethod
+    def generate(cls, seed: int, y_lim: int, fps: int, num_frames: int) -> Course:
+        """Generate the Pipe schedule for a number of frames.
+
+        Pipe `k` spawns `Pipe.get_spawn_time(k)` frames after Pipe `k - 1` and moves at `Pipe.get_speed(k) / fps`
+        pixels per frame, matching the spawn rules used by the game.
+
+        :param int seed: Seed for the Pipe heights
+        :param int y_lim: Screen height
+        :param int fps: Game FPS
+        :param int num_frames: Number of frames the Course must cover
+        :return Course: Generated Course
+        """
+        _max_pipes = num_frames // Pipe.MIN_SPAWNTIME + 1
+        _pipes_spawned = np.arange(_max_pipes)
+
+        _spawn_times = np.maximum(Pipe.START_SPAWNTIME - _pipes_spawned * Pipe.ACC_SPAWNTIME, Pipe.MIN_SPAWNTIME)
+        _spawn_times[0] = 0
+        _spawn_frames = np.cumsum(_spawn_times)
+        _num_pipes = int(np.searchsorted(_spawn_frames, num_frames))
+
+        _speeds = np.minimum(Pipe.START_SPEED + _pipes_spawned * Pipe.ACC_SPEED, Pipe.MAX_SPEED) / fps
+        _top_heights = np.random.default_rng(seed).uniform(
+            low=Pipe.SPACING, high=(y_lim - (2 * Pipe.SPACING)), size=_num_pipes
+        )
+
+        return cls(seed, _spawn_frames[:_num_pipes], _speeds[:_num_pipes], _top_heights)
@@ -1,9 +1,15 @@
 """Pipe object for Flappy Bird game."""
 
-from typing import ClassVar
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
 
 import numpy as np
-import pygame
+
+# pygame is only needed for drawing and rectangles, so it is imported on first use to keep the simulation importable
+# without it
+if TYPE_CHECKING:
+    import pygame
 
 rng = np.random.default_rng()
 
@@ -27,21 +33,27 @@ class Pipe:
     ACC_SPAWNTIME = 2
     COLOUR: ClassVar = [0, 200, 0]
 
-    def __init__(self, x_lim: int, y_lim: int, speed: float) -> None:
+    def __init__(self, x_lim: int, y_lim: int, speed: float, top_height: float | None = None) -> None:
         """Initialise Pipe with speed to move across the screen.
 
         :param int x_lim: Screen width
         :param int y_lim: Screen height
         :param float speed: Pipe movement speed
+        :param float | None top_height: Height of top Pipe, random if not provided
         """
         self._x: float = x_lim
-        self._top_height = rng.uniform(low=Pipe.SPACING, high=(y_lim - (2 * Pipe.SPACING)))
+        self._prev_x: float = x_lim
+        self._top_height = (
+            rng.uniform(low=Pipe.SPACING, high=(y_lim - (2 * Pipe.SPACING))) if top_height is None else top_height
+        )
         self._bottom_height = y_lim - self._top_height + Pipe.SPACING
         self._speed = speed
 
     @property
     def rects(self) -> list[pygame.Rect]:
         """Get Pipe's rectangles for collision detection."""
+        import pygame  # noqa: PLC0415
+
         _top_pipe = pygame.Rect(self.top_pos[0], self.top_pos[1], Pipe.WIDTH, self._top_height)
         _bottom_pipe = pygame.Rect(self.bottom_pos[0], self.bottom_pos[1], Pipe.WIDTH, self._bottom_height)
         return [_top_pipe, _bottom_pipe]
@@ -73,14 +85,21 @@ class Pipe:
         """
         if self.offscreen:
             return
+
+        import pygame  # noqa: PLC0415
+
         pygame.draw.rect(screen, Pipe.COLOUR, self.rects[0])
         pygame.draw.rect(screen, Pipe.COLOUR, self.rects[1])
 
-    def update(self) -> None:
-        """Move Pipe."""
+    def update(self, steps: int = 1) -> None:
+        """Move Pipe.
+
+        :param int steps: Number of frames to move Pipe by
+        """
+        self._prev_x = self._x
         if self.offscreen:
             return
-        self._x -= self._speed
+        self._x -= self._speed * steps
 
     @staticmethod
     def get_speed(pipes_spawned: int) -> float:
@@ -0,0 +1,202 @@
+"""Vectorised Flappy Bird game world."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from neuroevolution_flappy_bird.objects.collision import swept_collision
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.objects.pipe import Pipe
+
+# Bird physics constants, kept in sync with `Bird` which cannot be imported here without the neural network library
+GRAV = 1
+LIFT = -25
+MIN_VELOCITY = -15
+# Slice selecting every Bird in the World
+ALL_BIRDS = slice(None)
+
+
+class World:
+    """This class runs games of Flappy Bird for a batch of Birds on one or more Courses at once.
+
+    The state of every Bird on every Course is held in arrays with shape (num_courses, num_birds) and stepped at once,
+    following the same spawn, movement and collision rules as `FlappyBirdApp`, `Bird` and `Pipe`. Given the same jump
+    decisions, a World reproduces a game exactly without needing any neural networks.
+
+    Courses generated for the same frame rate and number of frames share their spawn schedule and only differ in Pipe
+    heights, so the Pipes move together on every Course.
+    """
+
+    def __init__(
+        self,
+        courses: list[Course],
+        num_birds: int,
+        x_lim: int,
+        y_lim: int,
+        num_frames: int,
+        bird_x: int,
+        bird_y: int,
+        bird_size: int,
+        timestep: int = 1,
+        precision: str = "float64",
+    ) -> None:
+        """Initialise World with Courses and a batch of Birds at their start position on each Course.
+
+        :param list[Course] courses: Courses of Pipes, generated for the same frame rate and number of frames
+        :param int num_birds: Number of Birds on each Course
+        :param int x_lim: Screen width
+        :param int y_lim: Screen height
+        :param int num_frames: Number of frames in the game
+        :param int bird_x: x coordinate of Birds' start position
+        :param int bird_y: y coordinate of Birds' start position
+        :param int bird_size: Size of Birds
+        :param int timestep: Number of frames simulated per step
+        :param str precision: Floating point precision of observations, either "float32" or "float64"
+        """
+        self._courses = courses
+        self._schedule = courses[0]
+        self._top_heights = np.array([_course.top_heights for _course in courses])
+        self._x_lim = x_lim
+        self._y_lim = y_lim
+        self._num_frames = num_frames
+        self._bird_x = bird_x
+        self._bird_size = bird_size
+        self._timestep = timestep
+        self._precision = precision
+
+        self._frame = 0
+        self._num_pipes = 0
+        self._pipe_xs = np.zeros(len(self._schedule))
+        self._pipe_prev_xs = np.zeros(len(self._schedule))
+
+        _shape = (len(courses), num_birds)
+        self._y = np.full(_shape, bird_y)
+        self._velocity = np.zeros(_shape, dtype=int)
+        self._alive = np.ones(_shape, dtype=bool)
+        self._score = np.zeros(_shape, dtype=int)
+
+    @property
+    def done(self) -> bool:
+        """Check if the game has finished on every Course."""
+        return self._frame >= self._num_frames or not self._alive.any()
+
+    @property
+    def pipe_xs(self) -> NDArray:
+        """Get x coordinate of each spawned Pipe."""
+        return self._pipe_xs[: self._num_pipes]
+
+    @property
+    def top_heights(self) -> NDArray:
+        """Get height of each spawned top Pipe on each Course."""
+        return self._top_heights[:, : self._num_pipes]
+
+    @property
+    def closest_pipe(self) -> int:
+        """Get index of the Pipe closest to and in front of the Birds, or -1 if there is none."""
+        _dists = self.pipe_xs + Pipe.WIDTH - self._bird_x
+        _dists = np.where((_dists > 0) & (_dists < self._x_lim), _dists, np.inf)
+        if not _dists.size or np.isinf(_dists.min()):
+            return -1
+        return int(np.argmin(_dists))
+
+    def observe(self, birds: slice = ALL_BIRDS) -> NDArray:
+        """Get neural network inputs for every Bird, normalised in the same way as `Bird.nn_input`.
+
+        :param slice birds: Birds to observe, all of them by default
+        :return NDArray: Neural network inputs with shape (num_courses, num_birds, 5)
+        """
+        _y = self._y[:, birds]
+        _observations = np.zeros((*_y.shape, 5), dtype=self._precision)
+        _observations[..., 0] = _y / self._y_lim
+        _observations[..., 1] = self._velocity[:, birds] / MIN_VELOCITY
+        if (_closest := self.closest_pipe) >= 0:
+            _top_heights = self._top_heights[:, _closest, None]
+            _observations[..., 2] = _top_heights / self._y_lim
+            _observations[..., 3] = (self._y_lim - _top_heights + Pipe.SPACING) / self._y_lim
+            _observations[..., 4] = self._pipe_xs[_closest] / self._x_lim
+        return _observations
+
+    def update_pipes(self) -> int:
+        """Spawn the Pipes due in the next step and move every Pipe.
+
+        :return int: Number of frames in the step
+        """
+        _timestep = min(self._timestep, self._num_frames - self._frame)
+        while self._num_pipes < len(self._schedule) and self._schedule.spawn_frames[self._num_pipes] < (
+            self._frame + _timestep
+        ):
+            _frames_early = int(self._schedule.spawn_frames[self._num_pipes]) - self._frame
+            self._pipe_xs[self._num_pipes] = self._x_lim + _frames_early * self._schedule.speeds[self._num_pipes]
+            self._num_pipes += 1
+
+        _pipe_xs = self.pipe_xs
+        self._pipe_prev_xs[: self._num_pipes] = _pipe_xs
+        _moving = _pipe_xs > -Pipe.WIDTH
+        _pipe_xs[_moving] -= self._schedule.speeds[: self._num_pipes][_moving] * _timestep
+        return _timestep
+
+    def update_birds(self, jumps: NDArray, timestep: int) -> None:
+        """Apply jump decisions and move every alive Bird, killing those that collide with a Pipe.
+
+        :param NDArray jumps: Whether each Bird jumps on each Course, with shape (num_courses, num_birds)
+        :param int timestep: Number of frames in the step
+        """
+        self.move_birds(jumps, timestep)
+        self._frame += timestep
+
+    def move_birds(self, jumps: NDArray, timestep: int, birds: slice = ALL_BIRDS) -> None:
+        """Apply jump decisions and move a range of alive Birds without advancing the frame.
+
+        Each range of Birds only writes its own slice of the state arrays, so disjoint ranges can be moved at once on
+        separate threads.
+
+        :param NDArray jumps: Whether each Bird in the range jumps on each Course, with shape (num_courses, range size)
+        :param int timestep: Number of frames in the step
+        :param slice birds: Birds to move, all of them by default
+        """
+        _y = self._y[:, birds]
+        _velocities = self._velocity[:, birds]
+        _alive_birds = self._alive[:, birds]
+        _scores = self._score[:, birds]
+        _alive = np.nonzero(_alive_birds)
+        _velocity = _velocities[_alive]
+        _velocity = np.where(jumps[_alive], np.maximum(_velocity + LIFT, MIN_VELOCITY), _velocity)
+
+        _frames = np.arange(1, timestep + 1)
+        _ys = _y[_alive][:, None] + _frames * _velocity[:, None] + GRAV * _frames * (_frames + 1) // 2
+        _hit_frames = swept_collision(
+            self._bird_x,
+            _ys,
+            self._bird_size,
+            self._y_lim,
+            self._pipe_prev_xs[: self._num_pipes],
+            self.pipe_xs,
+            self.top_heights[_alive[0]],
+        )
+
+        _frames_moved = np.where(_hit_frames > 0, _hit_frames, timestep)
+        _velocities[_alive] = _velocity + GRAV * _frames_moved
+        _y[_alive] = _ys[np.arange(_ys.shape[0]), _frames_moved - 1]
+        _scores[_alive] += np.where(_hit_frames > 0, _hit_frames - 1, timestep)
+        _alive_birds[_alive] = _hit_frames == 0
+
+    def step(self, jumps: NDArray) -> None:
+        """Advance the game by one step with the given jump decisions.
+
+        :param NDArray jumps: Whether each Bird jumps on each Course, with shape (num_courses, num_birds)
+        """
+        self.update_birds(jumps, self.update_pipes())
+
+    def step_policy(self, policy: Callable[[NDArray], NDArray]) -> NDArray:
+        """Advance the game by one step, deciding jumps from observations taken after the Pipes move as `Bird` does.
+
+        :param Callable[[NDArray], NDArray] policy: Maps observations to whether each Bird jumps
+        :return NDArray: Whether each Bird jumped
+        """
+        _timestep = self.update_pipes()
+        _jumps = policy(self.observe())
+        self.update_birds(_jumps, _timestep)
+        return _jumps
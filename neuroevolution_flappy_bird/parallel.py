@@ -0,0 +1,104 @@
+"""Multithreaded stepping of batched Worlds, splitting the population into chunks of Birds."""
+
+from __future__ import annotations
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import pairwise
+
+import numpy as np
+from numpy.typing import NDArray
+
+from neuroevolution_flappy_bird.inference.network import PopulationNetwork
+from neuroevolution_flappy_bird.objects.world import World
+
+# Largest number of threads used by default when the GIL is enabled, as only the NumPy kernels run in parallel then
+GIL_THREADS = 2
+
+
+def free_threaded() -> bool:
+    """Check if the interpreter is a free-threaded CPython build running without the GIL.
+
+    :return bool: Whether Python threads run in parallel
+    """
+    _is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return _is_gil_enabled is not None and not _is_gil_enabled()
+
+
+def default_threads() -> int:
+    """Get the number of threads to step a World on, using every CPU on free-threaded builds.
+
+    :return int: Number of threads
+    """
+    _cpus = os.cpu_count() or 1
+    return _cpus if free_threaded() else min(_cpus, GIL_THREADS)
+
+
+def chunk_slices(num_birds: int, num_chunks: int) -> list[slice]:
+    """Split a population into contiguous chunks of nearly equal size.
+
+    :param int num_birds: Number of Birds
+    :param int num_chunks: Number of chunks
+    :return list[slice]: Birds in each non-empty chunk
+    """
+    _bounds = np.linspace(0, num_birds, min(num_chunks, num_birds) + 1).astype(int)
+    return [slice(int(_start), int(_end)) for _start, _end in pairwise(_bounds)]
+
+
+class ChunkedStepper:
+    """This class steps a World's inference, physics and collisions in chunks of Birds on a persistent thread pool.
+
+    The Pipes are moved once per frame on the calling thread. Each chunk then observes, decides and moves its own Birds,
+    only touching its own slice of the World's arrays, and the frame ends once every chunk has finished. Chunks run in
+    parallel while NumPy releases the GIL, and fully in parallel on free-threaded builds.
+    """
+
+    def __init__(self, num_threads: int) -> None:
+        """Initialise ChunkedStepper with a thread pool.
+
+        :param int num_threads: Number of threads, or 0 to pick from the CPUs and whether the GIL is enabled
+        """
+        self._num_threads = num_threads or default_threads()
+        self._executor = ThreadPoolExecutor(max_workers=self._num_threads, thread_name_prefix="world-chunk")
+
+    @property
+    def num_threads(self) -> int:
+        """Get number of threads."""
+        return self._num_threads
+
+    @staticmethod
+    def _step_chunk(world: World, network: PopulationNetwork, birds: slice, timestep: int, jumps: NDArray) -> None:
+        """Decide the jumps of a chunk of Birds and move them.
+
+        :param World world: World to step
+        :param PopulationNetwork network: Networks of the Birds in the chunk
+        :param slice birds: Birds in the chunk
+        :param int timestep: Number of frames in the step
+        :param NDArray jumps: Jump decisions of every Bird, written for the chunk
+        """
+        jumps[:, birds] = network.jumps(world.observe(birds))
+        world.move_birds(jumps[:, birds], timestep, birds)
+
+    def step(self, world: World, networks: list[PopulationNetwork], chunks: list[slice]) -> NDArray:
+        """Advance a World by one step in the same way as `World.step_policy`.
+
+        :param World world: World to step
+        :param list[PopulationNetwork] networks: Networks of the Birds in each chunk
+        :param list[slice] chunks: Birds in each chunk
+        :return NDArray: Whether each Bird jumped
+        """
+        _timestep = world.update_pipes()
+        _jumps = np.zeros(world._alive.shape, dtype=bool)
+        _futures = [
+            self._executor.submit(self._step_chunk, world, _network, _birds, _timestep, _jumps)
+            for _network, _birds in zip(networks, chunks, strict=True)
+        ]
+        for _future in _futures:
+            _future.result()
+        world._frame += _timestep
+        return _jumps
+
+    def shutdown(self) -> None:
+        """Stop the thread pool."""
+        self._executor.shutdown()
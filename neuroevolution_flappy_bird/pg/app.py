@@ -2,8 +2,30 @@
 
 from __future__ import annotations
 
-import pygame
-from pygame.locals import QUIT
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+# pygame is only needed once an app opens a display, so it is imported on first use to keep headless training, sweep
+# and worker processes from loading it
+if TYPE_CHECKING:
+    import pygame
+
+
+@lru_cache
+def resolve_font(font: str) -> str | None:
+    """Resolve a font name to a font file, only scanning the system fonts if it is not a file or the default font.
+
+    :param str font: Font file or system font name
+    :return str | None: Path to font file, or None to use the default font
+    """
+    import pygame  # noqa: PLC0415
+
+    if os.path.isfile(font):
+        return font
+    if font == pygame.font.get_default_font():
+        return None
+    return pygame.font.match_font(font)
 
 
 class App:
@@ -42,11 +64,19 @@ class App:
         :param int font_size: Font size
         :return App: Pygame application
         """
-        pygame.init()
+        import pygame  # noqa: PLC0415
+
+        pygame.display.init()
+        pygame.font.init()
         app = cls(name, width, height, fps, font, font_size)
         app._configure()
         return app
 
+    @property
+    def frame_rate(self) -> float:
+        """Get the number of frames per second the application runs at."""
+        return self._fps
+
     @property
     def screen(self) -> pygame.Surface:
         """Get the Pygame display surface."""
@@ -54,9 +84,11 @@ class App:
 
     def _configure(self) -> None:
         """Configure Pygame application."""
+        import pygame  # noqa: PLC0415
+
         pygame.display.set_caption(self._name)
         self._display_surf = pygame.display.set_mode((self._width, self._height))
-        self._pg_font = pygame.font.SysFont(self._font, self._font_size)
+        self._pg_font = pygame.font.Font(resolve_font(self._font), self._font_size)
         self._clock = pygame.time.Clock()
 
     def write_text(self, text: str, x: float, y: float) -> None:
@@ -83,10 +115,12 @@ class App:
 
     def run(self) -> None:
         """Run the application and handle events."""
+        import pygame  # noqa: PLC0415
+
         self._running = True
         while self._running:
             for event in pygame.event.get():
-                if event.type == QUIT:
+                if event.type == pygame.QUIT:
                     pygame.quit()
                     self._running = False
                     return
@@ -95,4 +129,4 @@ class App:
 
             self.update()
             pygame.display.update()
-            self._clock.tick(self._fps)
+            self._clock.tick(self.frame_rate)
@@ -0,0 +1,159 @@
+"""Flappy Bird application to play an exported neural network."""
+
+from __future__ import annotations
+
+from typing import cast
+
+import numpy as np
+import pygame
+
+from neuroevolution_flappy_bird.inference.lookup import LookupPolicy
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.objects.pipe import Pipe
+from neuroevolution_flappy_bird.objects.world import World
+from neuroevolution_flappy_bird.pg.app import App
+
+rng = np.random.default_rng()
+
+
+def play_game(network: PolicyNetwork | LookupPolicy, world: World) -> int:
+    """Play a game to the end without a display.
+
+    :param PolicyNetwork | LookupPolicy network: Network or lookup table deciding when the Bird jumps
+    :param World world: World with a single Bird
+    :return int: Bird's score
+    """
+    while not world.done:
+        world.step_policy(network.jumps)
+    return int(world._score[0, 0])
+
+
+class PlayApp(App):
+    """This class plays Flappy Bird with a single Bird controlled by an exported neural network.
+
+    Each game uses a new Course and runs until the Bird dies or the lifetime is reached. No genetic algorithm is
+    involved, so the app only needs NumPy and Pygame.
+    """
+
+    def __init__(self, name: str, width: int, height: int, fps: int, font: str, font_size: int) -> None:
+        """Initialise PlayApp.
+
+        :param str name: App name
+        :param int width: Screen width
+        :param int height: Screen height
+        :param int fps: Game FPS
+        :param str font: Font style
+        :param int font_size: Font size
+        """
+        super().__init__(name, width, height, fps, font, font_size)
+        self._network: PolicyNetwork | LookupPolicy
+        self._world: World
+        self._lifetime: int
+        self._bird_x: int
+        self._bird_y: int
+        self._bird_size: int
+        self._course_seed: int
+        self._game = 0
+        self._best_score = 0
+
+    @property
+    def max_count(self) -> int:
+        """Maximum game counter value before starting a new game."""
+        return self._lifetime * self._fps
+
+    @classmethod
+    def create_game(cls, name: str, width: int, height: int, fps: int, font: str, font_size: int) -> PlayApp:
+        """Create App to play a neural network.
+
+        :param str name: Application name
+        :param int width: Screen width
+        :param int height: Screen height
+        :param int fps: Application FPS
+        :param str font: Font style
+        :param int font_size: Font size
+        :return PlayApp: Play application
+        """
+        return cast(PlayApp, super().create_app(name, width, height, fps, font, font_size))
+
+    def add_network(
+        self,
+        network: PolicyNetwork | LookupPolicy,
+        lifetime: int,
+        bird_x: int,
+        bird_y: int,
+        bird_size: int,
+        course_seed: int | None = None,
+    ) -> None:
+        """Add neural network to app and start the first game.
+
+        :param PolicyNetwork | LookupPolicy network: Network or lookup table deciding when the Bird jumps
+        :param int lifetime: Time of each game in seconds
+        :param int bird_x: x coordinate of Bird's start position
+        :param int bird_y: y coordinate of Bird's start position
+        :param int bird_size: Size of Bird
+        :param int | None course_seed: Base seed for each game's Course, random if not provided
+        """
+        self._network = network
+        self._lifetime = lifetime
+        self._bird_x = bird_x
+        self._bird_y = bird_y
+        self._bird_size = bird_size
+        self._course_seed = int(rng.integers(2**32)) if course_seed is None else course_seed
+        self._new_game()
+
+    def create_world(self, game: int) -> World:
+        """Create a World with a single Bird for a game.
+
+        :param int game: Game number
+        :return World: World at the start of the game
+        """
+        return World(
+            [Course.generate(Course.generation_seed(self._course_seed, game), self._height, self._fps, self.max_count)],
+            1,
+            self._width,
+            self._height,
+            self.max_count,
+            self._bird_x,
+            self._bird_y,
+            self._bird_size,
+            precision=self._network.precision,
+        )
+
+    def _new_game(self) -> None:
+        """Start a new game on a new Course."""
+        self._game += 1
+        self._world = self.create_world(self._game)
+
+    def _write_stats(self) -> None:
+        """Write game statistics to screen."""
+        _start_x = 20
+        _start_y = 30
+        self.write_text(f"Game: {self._game}", _start_x, _start_y)
+        self.write_text(f"Best score: {int(self._best_score / self._fps)}", _start_x, _start_y * 3)
+        self.write_text(f"Score: {int(self._world._frame / self._fps)}", _start_x, _start_y * 4)
+
+    def update(self) -> None:
+        """Step the World with the network's jump decision and draw to screen."""
+        if self._world.done:
+            self._best_score = max(self._best_score, int(self._world._score[0, 0]))
+            self._new_game()
+
+        self._world.step_policy(self._network.jumps)
+
+        for _x, _top_height in zip(self._world.pipe_xs, self._world.top_heights[0], strict=True):
+            pygame.draw.rect(self.screen, Pipe.COLOUR, pygame.Rect(_x, 0, Pipe.WIDTH, _top_height))
+            pygame.draw.rect(
+                self.screen,
+                Pipe.COLOUR,
+                pygame.Rect(_x, _top_height + Pipe.SPACING, Pipe.WIDTH, self._height - _top_height + Pipe.SPACING),
+            )
+
+        if self._world._alive[0, 0]:
+            pygame.draw.rect(
+                self.screen,
+                [255, 255, 0],
+                pygame.Rect(self._bird_x, self._world._y[0, 0], self._bird_size, self._bird_size),
+            )
+
+        self._write_stats()
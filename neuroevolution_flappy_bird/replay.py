@@ -0,0 +1,215 @@
+"""Compact replays of Flappy Bird generations stored as jump decisions."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.objects.world import World
+
+
+class Replay:
+    """This class holds a replay of a generation as the Course seed and one jump bit per Bird per step.
+
+    Replaying rebuilds the exact trajectories of the Birds by re-applying the game physics in a `World`, without running
+    any neural networks. The jump decisions are stored as a packed bit array, so replays of thousands of Birds take
+    kilobytes.
+    """
+
+    def __init__(
+        self,
+        jumps: NDArray,
+        course_seed: int,
+        x_lim: int,
+        y_lim: int,
+        fps: int,
+        num_frames: int,
+        timestep: int,
+        bird_x: int,
+        bird_y: int,
+        bird_size: int,
+        scores: NDArray,
+        generation: int,
+    ) -> None:
+        """Initialise Replay with the recorded jump decisions and the game settings.
+
+        :param NDArray jumps: Whether each Bird jumped on each step, with shape (num_steps, num_birds)
+        :param int course_seed: Seed of the generation's Course
+        :param int x_lim: Screen width
+        :param int y_lim: Screen height
+        :param int fps: Game FPS
+        :param int num_frames: Number of frames in the generation
+        :param int timestep: Number of frames simulated per step
+        :param int bird_x: x coordinate of Birds' start position
+        :param int bird_y: y coordinate of Birds' start position
+        :param int bird_size: Size of Birds
+        :param NDArray scores: Score of each Bird at the end of the generation
+        :param int generation: Generation number
+        """
+        self._jumps = jumps
+        self._course_seed = course_seed
+        self._x_lim = x_lim
+        self._y_lim = y_lim
+        self._fps = fps
+        self._num_frames = num_frames
+        self._timestep = timestep
+        self._bird_x = bird_x
+        self._bird_y = bird_y
+        self._bird_size = bird_size
+        self._scores = scores
+        self._generation = generation
+
+    @property
+    def num_steps(self) -> int:
+        """Get number of recorded steps."""
+        return int(self._jumps.shape[0])
+
+    @property
+    def num_birds(self) -> int:
+        """Get number of recorded Birds."""
+        return int(self._jumps.shape[1])
+
+    @classmethod
+    def load(cls, filepath: str) -> Replay:
+        """Load Replay from file.
+
+        :param str filepath: Path to replay file
+        :return Replay: Loaded Replay
+        """
+        with np.load(filepath) as replay_file:
+            _shape = tuple(replay_file["shape"])
+            return cls(
+                np.unpackbits(replay_file["jumps"], count=_shape[0] * _shape[1]).reshape(_shape).astype(bool),
+                int(replay_file["course_seed"]),
+                int(replay_file["x_lim"]),
+                int(replay_file["y_lim"]),
+                int(replay_file["fps"]),
+                int(replay_file["num_frames"]),
+                int(replay_file["timestep"]),
+                int(replay_file["bird_x"]),
+                int(replay_file["bird_y"]),
+                int(replay_file["bird_size"]),
+                replay_file["scores"],
+                int(replay_file["generation"]),
+            )
+
+    def save(self, filepath: str) -> None:
+        """Save Replay to file.
+
+        :param str filepath: Path to replay file
+        """
+        np.savez_compressed(
+            filepath,
+            jumps=np.packbits(self._jumps),
+            shape=np.array(self._jumps.shape),
+            course_seed=self._course_seed,
+            x_lim=self._x_lim,
+            y_lim=self._y_lim,
+            fps=self._fps,
+            num_frames=self._num_frames,
+            timestep=self._timestep,
+            bird_x=self._bird_x,
+            bird_y=self._bird_y,
+            bird_size=self._bird_size,
+            scores=self._scores,
+            generation=self._generation,
+        )
+
+    def create_world(self) -> World:
+        """Create a World at the start of the replayed generation.
+
+        :return World: World with the recorded Course and Birds
+        """
+        return World(
+            [Course.generate(self._course_seed, self._y_lim, self._fps, self._num_frames)],
+            self.num_birds,
+            self._x_lim,
+            self._y_lim,
+            self._num_frames,
+            self._bird_x,
+            self._bird_y,
+            self._bird_size,
+            self._timestep,
+        )
+
+    def simulate(self) -> tuple[NDArray, NDArray, NDArray]:
+        """Rebuild the trajectories of the recorded Birds.
+
+        :return tuple[NDArray, NDArray, NDArray]: y coordinate and alive state of each Bird after each step, with shape
+            (num_steps, num_birds), and the final score of each Bird
+        """
+        world = self.create_world()
+        _ys = np.zeros(self._jumps.shape, dtype=int)
+        _alive = np.zeros(self._jumps.shape, dtype=bool)
+        for _step, _jumps in enumerate(self._jumps):
+            world.step(_jumps[None])
+            _ys[_step] = world._y[0]
+            _alive[_step] = world._alive[0]
+        return _ys, _alive, world._score[0]
+
+
+class ReplayRecorder:
+    """This class records the jump decisions of a population during a generation so it can be saved as a Replay."""
+
+    def __init__(self) -> None:
+        """Initialise ReplayRecorder with no recorded steps."""
+        self._jumps: list[NDArray] = []
+
+    def reset(self) -> None:
+        """Clear the recorded steps."""
+        self._jumps = []
+
+    def record(self, jumps: NDArray) -> None:
+        """Record the jump decisions of every Bird for a step.
+
+        :param NDArray jumps: Whether each Bird jumped
+        """
+        self._jumps.append(np.packbits(jumps))
+
+    def create_replay(
+        self,
+        birds: NDArray,
+        course: Course,
+        x_lim: int,
+        y_lim: int,
+        fps: int,
+        num_frames: int,
+        timestep: int,
+        bird_x: int,
+        bird_y: int,
+        bird_size: int,
+        scores: NDArray,
+        generation: int,
+    ) -> Replay:
+        """Create a Replay of the recorded steps for a selection of Birds.
+
+        :param NDArray birds: Indices of the Birds to include
+        :param Course course: Course of the recorded generation
+        :param int x_lim: Screen width
+        :param int y_lim: Screen height
+        :param int fps: Game FPS
+        :param int num_frames: Number of frames in the generation
+        :param int timestep: Number of frames simulated per step
+        :param int bird_x: x coordinate of Birds' start position
+        :param int bird_y: y coordinate of Birds' start position
+        :param int bird_size: Size of Birds
+        :param NDArray scores: Score of every Bird at the end of the generation
+        :param int generation: Generation number
+        :return Replay: Replay of the selected Birds
+        """
+        _jumps = np.unpackbits(np.array(self._jumps), axis=1, count=scores.size).astype(bool)
+        return Replay(
+            _jumps[:, birds],
+            course.seed,
+            x_lim,
+            y_lim,
+            fps,
+            num_frames,
+            timestep,
+            bird_x,
+            bird_y,
+            bird_size,
+            scores[birds],
+            generation,
+        )
@@ -0,0 +1,98 @@
+"""Flappy Bird application to watch recorded replays."""
+
+from __future__ import annotations
+
+from typing import cast
+
+import numpy as np
+import pygame
+
+from neuroevolution_flappy_bird.objects.pipe import Pipe
+from neuroevolution_flappy_bird.objects.world import World
+from neuroevolution_flappy_bird.pg.app import App
+from neuroevolution_flappy_bird.replay import Replay
+
+rng = np.random.default_rng()
+
+
+class ReplayApp(App):
+    """This class plays back a Replay of a generation by stepping a World with the recorded jump decisions."""
+
+    def __init__(self, name: str, width: int, height: int, fps: int, font: str, font_size: int) -> None:
+        """Initialise ReplayApp.
+
+        :param str name: App name
+        :param int width: Screen width
+        :param int height: Screen height
+        :param int fps: Game FPS
+        :param str font: Font style
+        :param int font_size: Font size
+        """
+        super().__init__(name, width, height, fps, font, font_size)
+        self._replay: Replay
+        self._world: World
+        self._step = 0
+        self._colours: list[list[int]] = []
+
+    @classmethod
+    def create_game(cls, name: str, width: int, height: int, fps: int, font: str, font_size: int) -> ReplayApp:
+        """Create App to watch replays.
+
+        :param str name: Application name
+        :param int width: Screen width
+        :param int height: Screen height
+        :param int fps: Application FPS
+        :param str font: Font style
+        :param int font_size: Font size
+        :return ReplayApp: Replay application
+        """
+        return cast(ReplayApp, super().create_app(name, width, height, fps, font, font_size))
+
+    def add_replay(self, replay: Replay) -> None:
+        """Add Replay to app and start it from the beginning.
+
+        :param Replay replay: Replay to play back
+        """
+        self._replay = replay
+        self._colours = rng.integers(low=0, high=256, size=(replay.num_birds, 3)).tolist()
+        self._restart()
+
+    def _restart(self) -> None:
+        """Restart the Replay from the beginning."""
+        self._world = self._replay.create_world()
+        self._step = 0
+
+    def _write_stats(self) -> None:
+        """Write replay statistics to screen."""
+        _start_x = 20
+        _start_y = 30
+        self.write_text(f"Generation: {self._replay._generation}", _start_x, _start_y)
+        self.write_text(f"Birds alive: {int(np.sum(self._world._alive))}", _start_x, _start_y * 3)
+        self.write_text(f"Score: {int(self._world._frame / self._replay._fps)}", _start_x, _start_y * 4)
+
+    def update(self) -> None:
+        """Step the World with the next recorded jump decisions and draw to screen."""
+        if self._step >= self._replay.num_steps:
+            self._restart()
+
+        self._world.step(self._replay._jumps[self._step, None])
+        self._step += 1
+
+        for _x, _top_height in zip(self._world.pipe_xs, self._world.top_heights[0], strict=True):
+            pygame.draw.rect(self.screen, Pipe.COLOUR, pygame.Rect(_x, 0, Pipe.WIDTH, _top_height))
+            pygame.draw.rect(
+                self.screen,
+                Pipe.COLOUR,
+                pygame.Rect(_x, _top_height + Pipe.SPACING, Pipe.WIDTH, self._height - _top_height + Pipe.SPACING),
+            )
+
+        for _bird in np.flatnonzero(self._world._alive[0]):
+            pygame.draw.rect(
+                self.screen,
+                self._colours[_bird],
+                pygame.Rect(
+                    self._world._bird_x, self._world._y[0, _bird], self._world._bird_size, self._world._bird_size
+                ),
+            )
+
+        self._write_stats()
@@ -0,0 +1,225 @@
+"""Live export of the simulation state through shared memory, for plotting training from another process."""
+
+from __future__ import annotations
+
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Header of the shared memory segment, one int64 per field
+HEADER_FIELDS = [
+    "magic",
+    "version",
+    "sequence",
+    "population_size",
+    "max_pipes",
+    "generation",
+    "frame",
+    "num_birds",
+    "num_pipes",
+    "fitness_generation",
+]
+HEADER_INDEX = {_field: _index for _index, _field in enumerate(HEADER_FIELDS)}
+MAGIC = int.from_bytes(b"FLAPPYSM", "little")
+VERSION = 1
+# Arrays after the header: name, data type and the header field counting its current entries. Birds played in a frame
+# can be fewer than the population when some scores are cached. The boolean array is last so every other array stays
+# aligned to 8 bytes
+ARRAYS = [
+    ("y", np.float64, "num_birds"),
+    ("velocity", np.float64, "num_birds"),
+    ("score", np.int64, "num_birds"),
+    ("fitness", np.float64, "population_size"),
+    ("pipe_x", np.float64, "num_pipes"),
+    ("pipe_top_height", np.float64, "num_pipes"),
+    ("alive", np.bool_, "num_birds"),
+]
+
+
+def segment_views(memory: SharedMemory, population_size: int, max_pipes: int) -> tuple[NDArray, dict[str, NDArray]]:
+    """Lay out the header and arrays of a shared memory segment over its buffer without copying.
+
+    :param SharedMemory memory: Shared memory segment
+    :param int population_size: Number of Birds the segment holds
+    :param int max_pipes: Number of Pipes the segment holds
+    :return tuple[NDArray, dict[str, NDArray]]: Header and array views
+    """
+    _header = np.ndarray((len(HEADER_FIELDS),), dtype=np.int64, buffer=memory.buf)
+    _offset = _header.nbytes
+    _arrays = {}
+    for _name, _dtype, _count in ARRAYS:
+        _length = max_pipes if _count == "num_pipes" else population_size
+        _arrays[_name] = np.ndarray((_length,), dtype=_dtype, buffer=memory.buf, offset=_offset)
+        _offset += _arrays[_name].nbytes
+    return _header, _arrays
+
+
+def segment_size(population_size: int, max_pipes: int) -> int:
+    """Get the number of bytes of a shared memory segment.
+
+    :param int population_size: Number of Birds the segment holds
+    :param int max_pipes: Number of Pipes the segment holds
+    :return int: Segment size
+    """
+    return len(HEADER_FIELDS) * np.dtype(np.int64).itemsize + sum(
+        (max_pipes if _count == "num_pipes" else population_size) * np.dtype(_dtype).itemsize
+        for _, _dtype, _count in ARRAYS
+    )
+
+
+class SharedStateWriter:
+    """This class mirrors the state of each frame and the fitness of each generation into a shared memory segment.
+
+    Updates are written straight into NumPy views of the segment, so exporting a frame costs a few array assignments
+    and no serialisation. A sequence counter in the header works as a seqlock: it is odd while an update is being
+    written and even once it is complete, so readers in other processes can tell a consistent snapshot from a torn one
+    without any lock that could block training.
+    """
+
+    def __init__(self, name: str, population_size: int, max_pipes: int) -> None:
+        """Initialise SharedStateWriter by creating the shared memory segment.
+
+        :param str name: Name of the shared memory segment
+        :param int population_size: Number of Birds in the population
+        :param int max_pipes: Maximum number of Pipes on screen to export
+        """
+        self._memory = SharedMemory(name, create=True, size=segment_size(population_size, max_pipes))
+        self._header, self._arrays = segment_views(self._memory, population_size, max_pipes)
+        self._header[:] = 0
+        self._header[HEADER_INDEX["magic"]] = MAGIC
+        self._header[HEADER_INDEX["version"]] = VERSION
+        self._header[HEADER_INDEX["population_size"]] = population_size
+        self._header[HEADER_INDEX["max_pipes"]] = max_pipes
+
+    @property
+    def name(self) -> str:
+        """Get name of the shared memory segment."""
+        return self._memory.name
+
+    @property
+    def sequence(self) -> int:
+        """Get number of updates written, counting each update twice."""
+        return int(self._header[HEADER_INDEX["sequence"]])
+
+    def _begin(self) -> None:
+        """Mark the segment as being written."""
+        self._header[HEADER_INDEX["sequence"]] += 1
+
+    def _end(self) -> None:
+        """Mark the segment as consistent again."""
+        self._header[HEADER_INDEX["sequence"]] += 1
+
+    def write_frame(
+        self,
+        generation: int,
+        frame: int,
+        y: NDArray,
+        velocity: NDArray,
+        alive: NDArray,
+        score: NDArray,
+        pipe_x: NDArray,
+        pipe_top_height: NDArray,
+    ) -> None:
+        """Write the state of every Bird and the Pipes on screen.
+
+        Pipes beyond the segment's capacity are left out, keeping the ones closest to the Birds.
+
+        :param int generation: Current generation
+        :param int frame: Current frame of the generation
+        :param NDArray y: y coordinate of each Bird
+        :param NDArray velocity: Velocity of each Bird
+        :param NDArray alive: Whether each Bird is alive
+        :param NDArray score: Score of each Bird
+        :param NDArray pipe_x: x coordinate of each Pipe on screen
+        :param NDArray pipe_top_height: Height of each top Pipe on screen
+        """
+        _num_birds = len(y)
+        _num_pipes = min(len(pipe_x), len(self._arrays["pipe_x"]))
+        self._begin()
+        self._header[HEADER_INDEX["generation"]] = generation
+        self._header[HEADER_INDEX["frame"]] = frame
+        self._header[HEADER_INDEX["num_birds"]] = _num_birds
+        self._header[HEADER_INDEX["num_pipes"]] = _num_pipes
+        self._arrays["y"][:_num_birds] = y
+        self._arrays["velocity"][:_num_birds] = velocity
+        self._arrays["alive"][:_num_birds] = alive
+        self._arrays["score"][:_num_birds] = score
+        self._arrays["pipe_x"][:_num_pipes] = pipe_x[:_num_pipes]
+        self._arrays["pipe_top_height"][:_num_pipes] = pipe_top_height[:_num_pipes]
+        self._end()
+
+    def write_fitness(self, generation: int, fitness: NDArray) -> None:
+        """Write the fitness of every Bird in a finished generation.
+
+        :param int generation: Finished generation
+        :param NDArray fitness: Fitness of each Bird
+        """
+        self._begin()
+        self._header[HEADER_INDEX["fitness_generation"]] = generation
+        self._arrays["fitness"][: len(fitness)] = fitness
+        self._end()
+
+    def close(self) -> None:
+        """Release the views and remove the shared memory segment."""
+        del self._header, self._arrays
+        self._memory.close()
+        self._memory.unlink()
+
+
+class SharedStateReader:
+    """This class attaches to a segment written by `SharedStateWriter` and takes consistent snapshots of it.
+
+    The segment is only read: the array views are marked read-only and the segment is not removed when the reader
+    closes, so analysis code in a notebook cannot disturb training.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialise SharedStateReader by attaching to an existing shared memory segment.
+
+        :param str name: Name of the shared memory segment
+        """
+        self._memory = SharedMemory(name, track=False)
+        _header = np.ndarray((len(HEADER_FIELDS),), dtype=np.int64, buffer=self._memory.buf).tolist()
+        if _header[HEADER_INDEX["magic"]] != MAGIC or _header[HEADER_INDEX["version"]] != VERSION:
+            self._memory.close()
+            msg = f"Shared memory segment {name} was not written by SharedStateWriter version {VERSION}"
+            raise ValueError(msg)
+        self._header, self._arrays = segment_views(
+            self._memory, _header[HEADER_INDEX["population_size"]], _header[HEADER_INDEX["max_pipes"]]
+        )
+        for _view in (self._header, *self._arrays.values()):
+            _view.flags.writeable = False
+
+    @property
+    def sequence(self) -> int:
+        """Get the writer's sequence counter, which is odd while an update is being written."""
+        return int(self._header[HEADER_INDEX["sequence"]])
+
+    def snapshot(self) -> dict[str, int | NDArray]:
+        """Copy a consistent state out of the segment, retrying while the writer is part way through an update.
+
+        :return dict[str, int | NDArray]: Header fields, and the Birds' and Pipes' arrays trimmed to their current
+            length
+        """
+        while True:
+            _sequence = self.sequence
+            if _sequence % 2:
+                time.sleep(0)
+                continue
+            _header = self._header.copy()
+            _arrays = {_name: _view.copy() for _name, _view in self._arrays.items()}
+            if self.sequence == _sequence:
+                break
+
+        _fields = {_field: int(_value) for _field, _value in zip(HEADER_FIELDS, _header, strict=True)}
+        _snapshot: dict[str, int | NDArray] = dict(_fields)
+        for _name, _, _count in ARRAYS:
+            _snapshot[_name] = _arrays[_name][: _fields[_count]]
+        return _snapshot
+
+    def close(self) -> None:
+        """Release the views and detach from the shared memory segment without removing it."""
+        del self._header, self._arrays
+        self._memory.close()
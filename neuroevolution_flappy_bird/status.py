@@ -0,0 +1,233 @@
+"""Local HTTP status endpoint for monitoring and controlling long training runs."""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, ClassVar
+from urllib.parse import parse_qs, urlparse
+
+# Peak memory is read from the resource module, which is only available on Unix
+if sys.platform != "win32":
+    import resource
+
+METRIC_PREFIX = "flappy_bird"
+# Label of the samples of each metric with several values, by default "key"
+METRIC_LABELS = {"phase_seconds": "phase", "diversity_layer_variance": "layer"}
+
+
+def peak_memory() -> int:
+    """Get the peak resident memory of the process in bytes, or 0 if it is not available.
+
+    :return int: Peak resident memory in bytes
+    """
+    if sys.platform == "win32":
+        return 0
+    _peak = int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    # macOS reports the peak in bytes, Linux and the BSDs in kilobytes
+    return _peak if sys.platform == "darwin" else _peak * 1024
+
+
+class PhaseTimer:
+    """This class adds up the time spent in each phase of a generation, such as updating Birds or breeding."""
+
+    def __init__(self) -> None:
+        """Initialise PhaseTimer with no recorded phases."""
+        self._totals: dict[str, float] = {}
+
+    @property
+    def totals(self) -> dict[str, float]:
+        """Get a copy of the seconds spent in each phase."""
+        return dict(self._totals)
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None]:
+        """Time a block of code as part of a phase.
+
+        :param str name: Phase name
+        """
+        _start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._totals[name] = self._totals.get(name, 0.0) + time.perf_counter() - _start
+
+    def reset(self) -> None:
+        """Clear the recorded phases."""
+        self._totals = {}
+
+
+class TrainingStatus:
+    """This class shares the latest training metrics and the pause and speed controls between threads.
+
+    The training loop publishes a new metrics dictionary by replacing a reference, and the server only reads that
+    reference, so neither side ever waits on a lock held by the other.
+    """
+
+    def __init__(self) -> None:
+        """Initialise TrainingStatus with no metrics, running at normal speed."""
+        self._metrics: dict[str, Any] = {}
+        self._resumed = threading.Event()
+        self._resumed.set()
+        self.speed = 1.0
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get the latest published metrics."""
+        return self._metrics
+
+    @property
+    def paused(self) -> bool:
+        """Check if training is paused."""
+        return not self._resumed.is_set()
+
+    def publish(self, metrics: dict[str, Any]) -> None:
+        """Publish the latest training metrics.
+
+        :param dict[str, Any] metrics: Metrics, with numbers or dictionaries of numbers as values
+        """
+        self._metrics = metrics
+
+    def pause(self) -> None:
+        """Pause training."""
+        self._resumed.clear()
+
+    def resume(self) -> None:
+        """Resume training."""
+        self._resumed.set()
+
+    def wait_until_resumed(self) -> None:
+        """Block until training is resumed, returning at once if it is not paused."""
+        self._resumed.wait()
+
+    def to_prometheus(self) -> str:
+        """Format the latest metrics in the Prometheus text exposition format.
+
+        :return str: Metrics with one sample per line
+        """
+        _lines = []
+        for _name, _value in self._metrics.items():
+            _metric = f"{METRIC_PREFIX}_{_name}"
+            _lines.append(f"# TYPE {_metric} gauge")
+            if isinstance(_value, dict):
+                _label = METRIC_LABELS.get(_name, "key")
+                _lines.extend(f'{_metric}{{{_label}="{_key}"}} {_sample}' for _key, _sample in _value.items())
+            else:
+                _lines.append(f"{_metric} {_value}")
+        _lines.append(f"# TYPE {METRIC_PREFIX}_paused gauge")
+        _lines.append(f"{METRIC_PREFIX}_paused {int(self.paused)}")
+        _lines.append(f"# TYPE {METRIC_PREFIX}_speed gauge")
+        _lines.append(f"{METRIC_PREFIX}_speed {self.speed}")
+        return "\n".join(_lines) + "\n"
+
+
+class StatusRequestHandler(BaseHTTPRequestHandler):
+    """This class answers status requests and applies control requests to the server's TrainingStatus.
+
+    `GET /status` returns the metrics as JSON and `GET /metrics` in the Prometheus text format. `POST /pause`,
+    `POST /resume` and `POST /speed?multiplier=2` control the training run.
+    """
+
+    server: StatusServer
+    CONTENT_TYPES: ClassVar[dict[str, str]] = {
+        "json": "application/json",
+        "prometheus": "text/plain; version=0.0.4",
+    }
+
+    def _send(self, code: HTTPStatus, body: str, content_type: str) -> None:
+        """Send a response.
+
+        :param HTTPStatus code: HTTP status code
+        :param str body: Response body
+        :param str content_type: Content type of the body
+        """
+        _body = body.encode()
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(_body)))
+        self.end_headers()
+        self.wfile.write(_body)
+
+    def _send_json(self, code: HTTPStatus, data: dict[str, Any]) -> None:
+        """Send a JSON response.
+
+        :param HTTPStatus code: HTTP status code
+        :param dict[str, Any] data: Response data
+        """
+        self._send(code, json.dumps(data), self.CONTENT_TYPES["json"])
+
+    def do_GET(self) -> None:
+        """Answer status requests."""
+        _status = self.server.status
+        _path = urlparse(self.path).path
+        if _path == "/status":
+            self._send_json(HTTPStatus.OK, {**_status.metrics, "paused": _status.paused, "speed": _status.speed})
+        elif _path == "/metrics":
+            self._send(HTTPStatus.OK, _status.to_prometheus(), self.CONTENT_TYPES["prometheus"])
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {_path}"})
+
+    def do_POST(self) -> None:
+        """Apply control requests."""
+        _status = self.server.status
+        _url = urlparse(self.path)
+        if _url.path == "/pause":
+            _status.pause()
+        elif _url.path == "/resume":
+            _status.resume()
+        elif _url.path == "/speed":
+            try:
+                _speed = float(parse_qs(_url.query)["multiplier"][0])
+            except (KeyError, ValueError):
+                self._send_json(
+                    HTTPStatus.BAD_REQUEST, {"error": "Expected a numeric multiplier, e.g. /speed?multiplier=2"}
+                )
+                return
+            if _speed <= 0:
+                self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Multiplier must be positive"})
+                return
+            _status.speed = _speed
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {_url.path}"})
+            return
+        self._send_json(HTTPStatus.OK, {"paused": _status.paused, "speed": _status.speed})
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Silence request logging so the training output stays readable."""
+
+
+class StatusServer(ThreadingHTTPServer):
+    """This class serves the status of a training run over HTTP from a background thread, bound to localhost."""
+
+    daemon_threads = True
+
+    def __init__(self, status: TrainingStatus, port: int, host: str = "127.0.0.1") -> None:
+        """Initialise StatusServer and bind it to a local port.
+
+        :param TrainingStatus status: Status of the training run
+        :param int port: Port to listen on, or 0 to pick a free port
+        :param str host: Host to bind to
+        """
+        super().__init__((host, port), StatusRequestHandler)
+        self.status = status
+        self._thread = threading.Thread(target=self.serve_forever, name="status-server", daemon=True)
+
+    @property
+    def port(self) -> int:
+        """Get the port the server is listening on."""
+        return int(self.server_address[1])
+
+    def start(self) -> None:
+        """Start serving requests on a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving requests and close the socket."""
+        self.shutdown()
+        self.server_close()
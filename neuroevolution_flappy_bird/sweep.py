@@ -0,0 +1,165 @@
+"""Hyperparameter sweeps over headless Flappy Bird training runs."""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+
+from neuroevolution_flappy_bird.flappy_bird_app import FlappyBirdApp, add_ga_kwargs
+
+SWEEP_PARAMETERS = [
+    "population_size",
+    "mutation_rate",
+    "hidden_layer_sizes",
+    "weights_range",
+    "bias_range",
+    "optimiser",
+]
+SUMMARY_FIELDS = [
+    *SWEEP_PARAMETERS,
+    "best_score",
+    "best_generation",
+    "final_best_score",
+    "final_mean_score",
+    "seconds",
+]
+
+
+def grid_search(parameters: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Get every combination of the candidate values for each parameter.
+
+    :param dict[str, list[Any]] parameters: Candidate values for each parameter
+    :return list[dict[str, Any]]: Parameter values for each run
+    """
+    _names = list(parameters)
+    return [dict(zip(_names, _values, strict=True)) for _values in itertools.product(*parameters.values())]
+
+
+def random_search(
+    parameters: dict[str, list[Any] | dict[str, float]], num_samples: int, seed: int | None
+) -> list[dict[str, Any]]:
+    """Sample parameter values at random.
+
+    Parameters given as a list of candidates are chosen uniformly from the list, and parameters given as a dictionary
+    with `low` and `high` keys are drawn uniformly from that range. A range with integer bounds, such as one for
+    `population_size`, gives integers up to and including `high`.
+
+    :param dict[str, list[Any] | dict[str, float]] parameters: Candidates or range for each parameter
+    :param int num_samples: Number of runs to sample
+    :param int | None seed: Seed for the sampler
+    :return list[dict[str, Any]]: Parameter values for each run
+    """
+    _rng = np.random.default_rng(seed)
+    runs: list[dict[str, Any]] = []
+    for _ in range(num_samples):
+        _run: dict[str, Any] = {}
+        for _name, _space in parameters.items():
+            if isinstance(_space, dict) and isinstance(_space["low"], int) and isinstance(_space["high"], int):
+                _run[_name] = int(_rng.integers(_space["low"], _space["high"], endpoint=True))
+            elif isinstance(_space, dict):
+                _run[_name] = float(_rng.uniform(low=_space["low"], high=_space["high"]))
+            else:
+                _run[_name] = _space[int(_rng.integers(len(_space)))]
+        runs.append(_run)
+    return runs
+
+
+def train_run(
+    app_config: dict[str, Any], ga_config: dict[str, Any], parameters: dict[str, Any], generations: int
+) -> dict[str, Any]:
+    """Train a headless Flappy Bird app with a set of parameters and summarise the run.
+
+    :param dict[str, Any] app_config: App configuration
+    :param dict[str, Any] ga_config: Base genetic algorithm configuration
+    :param dict[str, Any] parameters: Genetic algorithm parameters overriding the base configuration
+    :param int generations: Number of generations to train for
+    :return dict[str, Any]: Summary of the run
+    """
+    _ga_config = {**ga_config, **parameters}
+    _start_time = time.perf_counter()
+
+    fba = FlappyBirdApp(
+        name=app_config["name"],
+        width=app_config["width"],
+        height=app_config["height"],
+        fps=app_config["fps"],
+        font=app_config["font"],
+        font_size=app_config["font_size"],
+    )
+    fba.add_ga(**add_ga_kwargs(_ga_config))
+    fba.run_headless(generations)
+    fba.close_stepper()
+
+    return {
+        **{_name: _ga_config.get(_name) for _name in SWEEP_PARAMETERS},
+        "best_score": max(fba._best_scores),
+        "best_generation": int(np.argmax(fba._best_scores)) + 1,
+        "final_best_score": fba._best_scores[-1],
+        "final_mean_score": fba._mean_scores[-1],
+        "seconds": time.perf_counter() - _start_time,
+    }
+
+
+def run_sweep(
+    app_config: dict[str, Any],
+    ga_config: dict[str, Any],
+    runs: list[dict[str, Any]],
+    generations: int,
+    workers: int | None,
+) -> list[dict[str, Any]]:
+    """Train every run on a pool of worker processes.
+
+    :param dict[str, Any] app_config: App configuration
+    :param dict[str, Any] ga_config: Base genetic algorithm configuration
+    :param list[dict[str, Any]] runs: Parameter values for each run
+    :param int generations: Number of generations to train each run for
+    :param int | None workers: Number of worker processes, defaults to the number of CPUs
+    :return list[dict[str, Any]]: Summary of each run, best first
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                train_run,
+                itertools.repeat(app_config),
+                itertools.repeat(ga_config),
+                runs,
+                itertools.repeat(generations),
+            )
+        )
+    return sorted(results, key=lambda result: result["best_score"], reverse=True)
+
+
+def write_summary(results: list[dict[str, Any]], filepath: str) -> None:
+    """Write the summary of each run to a CSV file.
+
+    :param list[dict[str, Any]] results: Summary of each run
+    :param str filepath: Path to CSV file
+    """
+    with open(filepath, "w", newline="") as summary_file:
+        writer = csv.DictWriter(summary_file, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def format_summary(results: list[dict[str, Any]]) -> str:
+    """Format the summary of each run as a table.
+
+    :param list[dict[str, Any]] results: Summary of each run
+    :return str: Summary table
+    """
+    _rows = [SUMMARY_FIELDS] + [
+        [
+            f"{_result[_field]:.4g}" if isinstance(_result[_field], float) else str(_result[_field])
+            for _field in SUMMARY_FIELDS
+        ]
+        for _result in results
+    ]
+    _widths = [max(len(_row[_column]) for _row in _rows) for _column in range(len(SUMMARY_FIELDS))]
+    return "\n".join(
+        "  ".join(_cell.ljust(_width) for _cell, _width in zip(_row, _widths, strict=True)) for _row in _rows
+    )
@@ -1,10 +1,14 @@
 """Unit tests for the neuroevolution_flappy_bird.ga.bird_ga module."""
 
+import itertools
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from neuroevolution_flappy_bird.ga.bird_ga import FlappyBirdGA
+from neuroevolution_flappy_bird.ga.evolution_strategies import flatten_network
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork
 from neuroevolution_flappy_bird.objects.bird import Bird
 
 MOCK_POPULATION_SIZE = 5
@@ -19,6 +23,14 @@ MOCK_HIDDEN_LAYER_SIZES = [5, 5]
 MOCK_WEIGHTS_RANGE = (-1.0, 1.0)
 MOCK_BIAS_RANGE = (-1.0, 1.0)
 MOCK_NUM_ALIVE = 3
+MOCK_COURSE_SCORES = np.array([[10, 20, 30, 40, 50], [0, 20, 35, 40, 45]])
+MOCK_NUM_PAIRS = 1000
+MOCK_FITNESS = np.array([0.0, 1.0, 0.0, 3.0, 0.0])
+MOCK_TOURNAMENT_SIZE = 3
+MOCK_ELITE_COUNT = 2
+MOCK_LAYER_SIZES = [5, 3, 2]
+MOCK_SIGMA = 0.1
+MOCK_LEARNING_RATE = 0.03
 
 
 @pytest.fixture
@@ -28,10 +40,22 @@ def mock_birds() -> list[MagicMock]:
     for i in range(MOCK_POPULATION_SIZE):
         bird = MagicMock(spec=Bird)
         bird._alive = i < MOCK_NUM_ALIVE
+        bird._score = i
+        bird.fitness = i**2
         birds.append(bird)
     return birds
 
 
+@pytest.fixture
+def network() -> PolicyNetwork:
+    """Mock PolicyNetwork instance."""
+    return PolicyNetwork(
+        [np.ones((_out, _in)) for _in, _out in itertools.pairwise(MOCK_LAYER_SIZES)],
+        [np.zeros(_out) for _out in MOCK_LAYER_SIZES[1:]],
+        ["relu", "linear"],
+    )
+
+
 @pytest.fixture
 def bird_ga(mock_birds: list[MagicMock]) -> FlappyBirdGA:
     """Mock FlappyBirdGA instance."""
@@ -54,14 +78,68 @@ class TestFlappyBirdGA:
         assert bird_ga.num_alive == MOCK_NUM_ALIVE
 
         # Test when all birds are alive
-        for bird in bird_ga._population._members:
-            bird._alive = True
+        bird_ga.reset()
         assert bird_ga.num_alive == MOCK_POPULATION_SIZE
 
-        # Test when all birds are dead
-        for bird in bird_ga._population._members:
-            bird._alive = False
-        assert bird_ga.num_alive == 0
+    def test_alive_birds(self, bird_ga: FlappyBirdGA, mock_birds: list[MagicMock]) -> None:
+        """Test alive_birds property."""
+        assert bird_ga.alive_birds == mock_birds[:MOCK_NUM_ALIVE]
+
+    def test_update_birds(self, bird_ga: FlappyBirdGA, mock_birds: list[MagicMock]) -> None:
+        """Test update_birds method only updates alive Birds and drops the ones that die."""
+        mock_pipe = MagicMock()
+
+        def die() -> None:
+            mock_birds[0]._alive = False
+
+        mock_birds[0].update.side_effect = lambda *_: die()
+
+        bird_ga.update_birds(mock_pipe, 1, [mock_pipe])
+
+        for bird in mock_birds[:MOCK_NUM_ALIVE]:
+            bird.update.assert_called_once_with(mock_pipe, 1, [mock_pipe])
+        for bird in mock_birds[MOCK_NUM_ALIVE:]:
+            bird.update.assert_not_called()
+        assert bird_ga.alive_birds == mock_birds[1:MOCK_NUM_ALIVE]
+        assert bird_ga.num_alive == MOCK_NUM_ALIVE - 1
+        assert bird_ga._dead_indices == [0]
+
+    def test_replace_dead(self, bird_ga: FlappyBirdGA, mock_birds: list[MagicMock]) -> None:
+        """Test replace_dead method respawns each Bird that died in the last update with a new chromosome."""
+        for bird in mock_birds:
+            bird._new_chromosome = MagicMock()
+        mock_birds[1].update.side_effect = lambda *_: setattr(mock_birds[1], "_alive", False)
+        bird_ga.update_birds(None, 1, [])
+        generation = bird_ga._generation
+
+        children = bird_ga.replace_dead()
+
+        assert children.tolist() == [1]
+        assert mock_birds[1].crossover.call_count + mock_birds[1].clone.call_count == 1
+        assert mock_birds[1].chromosome == mock_birds[1]._new_chromosome
+        mock_birds[1].reset.assert_called_once()
+        assert mock_birds[0].chromosome != mock_birds[0]._new_chromosome
+        assert bird_ga.num_alive == MOCK_NUM_ALIVE
+        assert bird_ga._dead_indices == []
+        assert bird_ga._num_births == 1
+        assert bird_ga._generation == generation
+
+    def test_replace_dead_no_deaths(self, bird_ga: FlappyBirdGA, mock_birds: list[MagicMock]) -> None:
+        """Test replace_dead method breeds nothing when no Bird died."""
+        children = bird_ga.replace_dead()
+
+        assert children.size == 0
+        for bird in mock_birds:
+            bird.clone.assert_not_called()
+            bird.crossover.assert_not_called()
+
+    def test_scores(self, bird_ga: FlappyBirdGA) -> None:
+        """Test scores property."""
+        assert np.array_equal(bird_ga.scores, np.arange(MOCK_POPULATION_SIZE))
+
+    def test_fitness(self, bird_ga: FlappyBirdGA) -> None:
+        """Test fitness property."""
+        assert np.array_equal(bird_ga.fitness, np.arange(MOCK_POPULATION_SIZE) ** 2)
 
     @patch("neuroevolution_flappy_bird.ga.bird_ga.Bird")
     def test_create(self, mock_bird_class: MagicMock, mock_birds: list[MagicMock]) -> None:
@@ -110,3 +188,170 @@ class TestFlappyBirdGA:
         # Verify reset was called on each bird
         for bird in mock_birds:
             bird.reset.assert_called_once()
+
+    def test_seed_network(self, bird_ga: FlappyBirdGA, mock_birds: list[MagicMock]) -> None:
+        """Test seed_network method loads the network into the first Bird."""
+        mock_network = MagicMock()
+
+        bird_ga.seed_network(mock_network)
+
+        mock_birds[0].load_network.assert_called_once_with(mock_network)
+
+    @pytest.mark.parametrize(
+        ("aggregation", "expected_scores"),
+        [("mean", [5, 20, 32, 40, 48]), ("min", [0, 20, 30, 40, 45])],
+    )
+    def test_set_scores(self, bird_ga: FlappyBirdGA, aggregation: str, expected_scores: list[int]) -> None:
+        """Test set_scores method aggregates each Bird's scores on several Courses."""
+        bird_ga.set_scores(MOCK_COURSE_SCORES, aggregation)
+        assert bird_ga.scores.tolist() == expected_scores
+
+    @patch("neuroevolution_flappy_bird.ga.bird_ga.PopulationNetwork")
+    @patch("neuroevolution_flappy_bird.ga.bird_ga.PolicyNetwork")
+    def test_population_network(
+        self,
+        mock_policy_network: MagicMock,
+        mock_population_network: MagicMock,
+        bird_ga: FlappyBirdGA,
+        mock_birds: list[MagicMock],
+    ) -> None:
+        """Test population_network property stacks the network of every Bird."""
+        network = bird_ga.population_network
+
+        assert network == mock_population_network.from_networks.return_value
+        assert [call.args[0] for call in mock_policy_network.from_member.call_args_list] == mock_birds
+
+    def test_roulette_selection(self) -> None:
+        """Test roulette_selection method only picks Birds with fitness, in proportion to it."""
+        parents = FlappyBirdGA.roulette_selection(MOCK_FITNESS, MOCK_NUM_PAIRS)
+
+        assert parents.shape == (MOCK_NUM_PAIRS, 2)
+        assert set(np.unique(parents)) == {1, 3}
+        assert np.mean(parents == np.argmax(MOCK_FITNESS)) > np.mean(parents == 1)
+
+    def test_roulette_selection_no_fitness(self) -> None:
+        """Test roulette_selection method picks uniformly when no Bird has any fitness."""
+        parents = FlappyBirdGA.roulette_selection(np.zeros(MOCK_POPULATION_SIZE), MOCK_NUM_PAIRS)
+
+        assert parents.shape == (MOCK_NUM_PAIRS, 2)
+        assert np.all((parents >= 0) & (parents < MOCK_POPULATION_SIZE))
+
+    def test_tournament_selection(self) -> None:
+        """Test tournament_selection method picks the fittest contender of each tournament."""
+        # Tournaments large enough that every one of them draws the fittest Bird all but surely
+        parents = FlappyBirdGA.tournament_selection(MOCK_FITNESS, MOCK_NUM_PAIRS, MOCK_POPULATION_SIZE * 40)
+
+        assert parents.shape == (MOCK_NUM_PAIRS, 2)
+        assert np.all(parents == np.argmax(MOCK_FITNESS))
+
+    @pytest.mark.parametrize("selection", ["roulette", "tournament"])
+    def test_select_parents(self, bird_ga: FlappyBirdGA, selection: str) -> None:
+        """Test select_parents method uses the configured selection method."""
+        bird_ga._selection = selection
+        bird_ga._tournament_size = MOCK_TOURNAMENT_SIZE
+
+        with patch.object(FlappyBirdGA, f"{selection}_selection") as mock_selection:
+            parents = bird_ga.select_parents(MOCK_FITNESS, MOCK_NUM_PAIRS)
+
+        assert parents == mock_selection.return_value
+
+    def test_breed(self, bird_ga: FlappyBirdGA, mock_birds: list[MagicMock]) -> None:
+        """Test breed method crosses over parents for the Birds outside the elite without replacing chromosomes."""
+        bird_ga._elite_count = MOCK_ELITE_COUNT
+        chromosomes = [bird.chromosome for bird in mock_birds]
+
+        children = bird_ga.breed(bird_ga.fitness)
+
+        assert sorted(children.tolist()) == list(range(MOCK_POPULATION_SIZE - MOCK_ELITE_COUNT))
+        for bird, chromosome in zip(mock_birds, chromosomes, strict=True):
+            assert bird.chromosome == chromosome
+
+    def test_breed_clones(self, bird_ga: FlappyBirdGA, mock_birds: list[MagicMock]) -> None:
+        """Test breed method clones every child without crossover when the crossover rate is 0."""
+        bird_ga._crossover_rate = 0
+
+        bird_ga.breed(bird_ga.fitness)
+
+        for bird in mock_birds:
+            bird.clone.assert_called_once()
+            bird.crossover.assert_not_called()
+
+    def test_replace_chromosomes(self, bird_ga: FlappyBirdGA, mock_birds: list[MagicMock]) -> None:
+        """Test replace_chromosomes method gives the children their new chromosomes."""
+        for bird in mock_birds:
+            bird._new_chromosome = MagicMock()
+        generation = bird_ga._generation
+
+        bird_ga.replace_chromosomes(np.array([0]))
+
+        assert mock_birds[0].chromosome == mock_birds[0]._new_chromosome
+        assert mock_birds[1].chromosome != mock_birds[1]._new_chromosome
+        assert bird_ga._generation == generation + 1
+
+    def test_evolve(self, bird_ga: FlappyBirdGA, mock_birds: list[MagicMock]) -> None:
+        """Test _evolve method keeps the elite unchanged and breeds every other Bird."""
+        bird_ga._elite_count = MOCK_ELITE_COUNT
+        for bird in mock_birds:
+            bird._new_chromosome = MagicMock()
+        generation = bird_ga._generation
+
+        bird_ga._evolve()
+
+        for bird in mock_birds[-MOCK_ELITE_COUNT:]:
+            bird.crossover.assert_not_called()
+        for bird in mock_birds[:-MOCK_ELITE_COUNT]:
+            assert bird.crossover.call_count + bird.clone.call_count == 1
+            assert bird.chromosome == bird._new_chromosome
+        assert bird_ga._generation == generation + 1
+
+    def test_evolve_steady_state(self, bird_ga: FlappyBirdGA, mock_birds: list[MagicMock]) -> None:
+        """Test _evolve method only moves on the generation number in a steady state."""
+        bird_ga._steady_state = True
+        generation = bird_ga._generation
+
+        bird_ga._evolve()
+
+        for bird in mock_birds:
+            bird.clone.assert_not_called()
+            bird.crossover.assert_not_called()
+        assert bird_ga._generation == generation + 1
+
+    @pytest.mark.parametrize("strategy", ["openai_es", "sep_cma_es"])
+    @patch("neuroevolution_flappy_bird.ga.bird_ga.PolicyNetwork")
+    def test_use_strategy(
+        self,
+        mock_policy_network: MagicMock,
+        bird_ga: FlappyBirdGA,
+        mock_birds: list[MagicMock],
+        network: PolicyNetwork,
+        strategy: str,
+    ) -> None:
+        """Test use_strategy method gives every Bird a sample around the first Bird's network."""
+        mock_policy_network.from_member.return_value = network
+
+        bird_ga.use_strategy(strategy, MOCK_SIGMA, MOCK_LEARNING_RATE)
+
+        assert bird_ga._strategy is not None
+        assert np.array_equal(bird_ga._strategy.mean, flatten_network(network))
+        for bird in mock_birds:
+            loaded = bird.load_network.call_args[0][0]
+            assert [weights.shape for weights in loaded._weights] == [weights.shape for weights in network._weights]
+
+    @patch("neuroevolution_flappy_bird.ga.bird_ga.PolicyNetwork")
+    def test_evolve_strategy(
+        self, mock_policy_network: MagicMock, bird_ga: FlappyBirdGA, mock_birds: list[MagicMock], network: PolicyNetwork
+    ) -> None:
+        """Test _evolve method updates the evolution strategy and samples new networks instead of breeding."""
+        mock_policy_network.from_member.return_value = network
+        bird_ga.use_strategy("openai_es", MOCK_SIGMA, MOCK_LEARNING_RATE)
+        assert bird_ga._strategy is not None
+        mean = bird_ga._strategy.mean.copy()
+        generation = bird_ga._generation
+
+        bird_ga._evolve()
+
+        assert not np.array_equal(bird_ga._strategy.mean, mean)
+        for bird in mock_birds:
+            assert bird.load_network.call_count == 2  # noqa: PLR2004
+            bird.crossover.assert_not_called()
+        assert bird_ga._generation == generation + 1
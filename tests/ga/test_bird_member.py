@@ -5,6 +5,8 @@ import pytest
 from neural_network.neural_network import NeuralNetwork
 
 from neuroevolution_flappy_bird.ga.bird_member import BirdMember
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork
+from neuroevolution_flappy_bird.inference.prune import remove_dead_units
 
 rng = np.random.default_rng()
 
@@ -87,6 +89,19 @@ class TestBirdMember:
         for bias_a, bias_b in zip(bird_member_a._nn.bias, bird_member_b._nn.bias, strict=False):
             assert np.array_equal(bias_a.vals, bias_b.vals)
 
+    def test_load_network(self, bird_member_a: BirdMember, bird_member_b: BirdMember) -> None:
+        """Test load_network method copies a pruned network with the same outputs."""
+        network = PolicyNetwork.from_member(bird_member_b)
+        network._weights[1][:, 0] = 0
+        pruned = remove_dead_units(network)
+        observations = rng.random((MOCK_HIDDEN_LAYER_SIZE, NUM_INPUTS))
+
+        bird_member_a.load_network(pruned)
+
+        loaded = PolicyNetwork.from_member(bird_member_a)
+        assert loaded.layer_sizes == network.layer_sizes
+        assert np.allclose(loaded.feedforward(observations), pruned.feedforward(observations))
+
     def test_fitness(self, bird_member_a: BirdMember) -> None:
         """Test fitness property."""
         bird_member_a._score = 10
@@ -107,6 +122,27 @@ class TestBirdMember:
         assert MOCK_WEIGHTS_RANGE[0] <= result <= MOCK_WEIGHTS_RANGE[1]
         assert result not in (element, other_element)
 
+    def test_mutate_matrix(self, bird_member_a: BirdMember) -> None:
+        """Test mutate_matrix static method only copies a matrix when a gene is mutated."""
+        matrix = bird_member_a.chromosome[0][1]
+
+        assert BirdMember.mutate_matrix(matrix, 0, MOCK_WEIGHTS_RANGE) is matrix
+
+        mutated = BirdMember.mutate_matrix(matrix, 1, MOCK_WEIGHTS_RANGE)
+        assert mutated is not matrix
+        assert np.shape(mutated.vals) == np.shape(matrix.vals)
+        assert not np.any(np.asarray(mutated.vals) == np.asarray(matrix.vals))
+
+    def test_clone(self, bird_member_a: BirdMember, bird_member_b: BirdMember) -> None:
+        """Test clone method reuses every matrix of the parent when no gene is mutated."""
+        bird_member_b.clone(bird_member_a, 0)
+        bird_member_b.chromosome = bird_member_b._new_chromosome
+
+        for weights_a, weights_b in zip(bird_member_a._nn.weights, bird_member_b._nn.weights, strict=True):
+            assert weights_a is weights_b
+        for bias_a, bias_b in zip(bird_member_a._nn.bias, bird_member_b._nn.bias, strict=True):
+            assert bias_a is bias_b
+
     def test_crossover(self, bird_member_a: BirdMember, bird_member_b: BirdMember, bird_member_c: BirdMember) -> None:
         """Test crossover method."""
         bird_member_c.crossover(bird_member_a, bird_member_b, MOCK_MUTATION_RATE)
@@ -0,0 +1,63 @@
+"""Unit tests for the neuroevolution_flappy_bird.ga.diversity module."""
+
+import itertools
+from typing import cast
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.ga.diversity import flatten_chromosomes, mean_pairwise_distance, population_diversity
+from neuroevolution_flappy_bird.inference.network import PopulationNetwork
+
+MOCK_SEED = 123
+MOCK_POPULATION_SIZE = 12
+MOCK_LAYER_SIZES = [5, 4, 2]
+MOCK_SAMPLE_SIZE = 6
+MOCK_OFFSET = 1000.0
+
+
+@pytest.fixture
+def network() -> PopulationNetwork:
+    """Mock PopulationNetwork instance."""
+    _rng = np.random.default_rng(MOCK_SEED)
+    return PopulationNetwork(
+        [
+            _rng.uniform(-1, 1, size=(MOCK_POPULATION_SIZE, _out, _in))
+            for _in, _out in itertools.pairwise(MOCK_LAYER_SIZES)
+        ],
+        [_rng.uniform(-1, 1, size=(MOCK_POPULATION_SIZE, _out)) for _out in MOCK_LAYER_SIZES[1:]],
+        ["relu", "linear"],
+    )
+
+
+def test_flatten_chromosomes(network: PopulationNetwork) -> None:
+    """Test flatten_chromosomes function keeps every weight and bias of each Bird in one row."""
+    chromosomes, layer_sizes = flatten_chromosomes(network)
+
+    assert layer_sizes == [(_in + 1) * _out for _in, _out in itertools.pairwise(MOCK_LAYER_SIZES)]
+    assert chromosomes.shape == (MOCK_POPULATION_SIZE, sum(layer_sizes))
+    assert np.array_equal(chromosomes[0, : network._weights[0][0].size], network._weights[0][0].ravel())
+
+
+@pytest.mark.parametrize("offset", [0.0, MOCK_OFFSET])
+def test_mean_pairwise_distance(network: PopulationNetwork, offset: float) -> None:
+    """Test mean_pairwise_distance function matches a loop over pairs, even far from the origin."""
+    chromosomes = flatten_chromosomes(network)[0]
+    expected = np.mean([np.linalg.norm(_first - _second) for _first, _second in itertools.combinations(chromosomes, 2)])
+
+    assert mean_pairwise_distance(chromosomes + offset) == pytest.approx(expected)
+    assert mean_pairwise_distance(chromosomes[:1]) == 0.0
+
+
+def test_population_diversity(network: PopulationNetwork) -> None:
+    """Test population_diversity function measures every layer and samples large populations."""
+    chromosomes = flatten_chromosomes(network)[0]
+
+    diversity = population_diversity(network, MOCK_POPULATION_SIZE)
+    sampled = population_diversity(network, MOCK_SAMPLE_SIZE)
+
+    assert diversity["pairwise_distance"] == pytest.approx(mean_pairwise_distance(chromosomes))
+    assert diversity["centroid_distance"] == sampled["centroid_distance"]
+    assert 0 < cast(float, diversity["centroid_distance"]) < cast(float, diversity["pairwise_distance"])
+    assert diversity["layer_variance"] == sampled["layer_variance"]
+    assert list(cast(dict[str, float], diversity["layer_variance"])) == ["0", "1"]
@@ -0,0 +1,130 @@
+"""Unit tests for the neuroevolution_flappy_bird.ga.evolution_strategies module."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.ga.diversity import flatten_chromosomes
+from neuroevolution_flappy_bird.ga.evolution_strategies import (
+    OpenAIES,
+    SepCMAES,
+    centred_ranks,
+    create_strategy,
+    flatten_network,
+    unflatten_network,
+)
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork, PopulationNetwork
+
+MOCK_SEED = 123
+MOCK_LAYER_SIZES = [5, 4, 2]
+MOCK_DIMENSION = 20
+MOCK_POPULATION_SIZE = 20
+MOCK_SIGMA = 0.3
+MOCK_LEARNING_RATE = 0.1
+MOCK_GENERATIONS = 150
+MOCK_FITNESS = np.array([3.0, -1.0, 10.0, 3.0])
+RANK_RANGE = 0.5
+
+
+@pytest.fixture
+def network() -> PolicyNetwork:
+    """Mock PolicyNetwork instance."""
+    _rng = np.random.default_rng(MOCK_SEED)
+    return PolicyNetwork(
+        [_rng.uniform(-1, 1, size=(_out, _in)) for _in, _out in itertools.pairwise(MOCK_LAYER_SIZES)],
+        [_rng.uniform(-1, 1, size=_out) for _out in MOCK_LAYER_SIZES[1:]],
+        ["relu", "linear"],
+    )
+
+
+def sphere_fitness(samples: np.ndarray) -> np.ndarray:
+    """Get fitness of samples that is highest at a target vector.
+
+    :param np.ndarray samples: Samples with shape (number of samples, dimension)
+    :return np.ndarray: Negative squared distance of each sample from the target
+    """
+    _target = np.linspace(-1, 1, MOCK_DIMENSION)
+    _fitness: np.ndarray = -np.sum((samples - _target) ** 2, axis=1)
+    return _fitness
+
+
+def test_flatten_network(network: PolicyNetwork) -> None:
+    """Test flatten_network function orders parameters as flatten_chromosomes does and unflatten_network inverts it."""
+    parameters = flatten_network(network)
+    restored = unflatten_network(parameters, network)
+
+    assert np.array_equal(parameters, flatten_chromosomes(PopulationNetwork.from_networks([network]))[0][0])
+    for weights, restored_weights in zip(network._weights, restored._weights, strict=True):
+        assert np.array_equal(weights, restored_weights)
+    for biases, restored_biases in zip(network._biases, restored._biases, strict=True):
+        assert np.array_equal(biases, restored_biases)
+
+
+def test_centred_ranks() -> None:
+    """Test centred_ranks function spreads ranks evenly from -0.5 to 0.5."""
+    shaped = centred_ranks(MOCK_FITNESS)
+
+    assert shaped.min() == -RANK_RANGE
+    assert shaped.max() == RANK_RANGE
+    assert np.argmax(shaped) == np.argmax(MOCK_FITNESS)
+    assert np.sum(shaped) == pytest.approx(0)
+
+
+class TestOpenAIES:
+    """Unit tests for the OpenAIES class."""
+
+    @pytest.mark.parametrize("population_size", [MOCK_POPULATION_SIZE, MOCK_POPULATION_SIZE + 1])
+    def test_ask(self, population_size: int) -> None:
+        """Test ask method samples antithetic pairs, followed by the mean for an odd population size."""
+        strategy = OpenAIES(np.zeros(MOCK_DIMENSION), population_size, MOCK_SIGMA, MOCK_LEARNING_RATE)
+        num_pairs = population_size // 2
+
+        samples = strategy.ask()
+
+        assert samples.shape == (population_size, MOCK_DIMENSION)
+        assert np.allclose(samples[:num_pairs], -samples[num_pairs : 2 * num_pairs])
+        assert np.all(samples[2 * num_pairs :] == 0)
+
+    def test_tell(self) -> None:
+        """Test the mean approaches the fittest parameters."""
+        strategy = OpenAIES(np.zeros(MOCK_DIMENSION), MOCK_POPULATION_SIZE, MOCK_SIGMA, MOCK_LEARNING_RATE)
+        start_fitness = sphere_fitness(strategy.mean[None])[0]
+
+        for _ in range(MOCK_GENERATIONS):
+            strategy.tell(sphere_fitness(strategy.ask()))
+
+        assert sphere_fitness(strategy.mean[None])[0] > start_fitness / 10
+
+
+class TestSepCMAES:
+    """Unit tests for the SepCMAES class."""
+
+    def test_ask(self) -> None:
+        """Test ask method samples around the mean."""
+        strategy = SepCMAES(np.ones(MOCK_DIMENSION), MOCK_POPULATION_SIZE, MOCK_SIGMA)
+
+        samples = strategy.ask()
+
+        assert samples.shape == (MOCK_POPULATION_SIZE, MOCK_DIMENSION)
+        assert np.allclose(samples, 1 + MOCK_SIGMA * strategy._steps)
+
+    def test_tell(self) -> None:
+        """Test the mean approaches the fittest parameters while the step size shrinks."""
+        strategy = SepCMAES(np.zeros(MOCK_DIMENSION), MOCK_POPULATION_SIZE, MOCK_SIGMA)
+        start_fitness = sphere_fitness(strategy.mean[None])[0]
+
+        for _ in range(MOCK_GENERATIONS):
+            strategy.tell(sphere_fitness(strategy.ask()))
+
+        assert sphere_fitness(strategy.mean[None])[0] > start_fitness / 100
+        assert strategy.sigma < MOCK_SIGMA
+        assert np.all(strategy._variances > 0)
+
+
+@pytest.mark.parametrize(("name", "expected_class"), [("openai_es", OpenAIES), ("sep_cma_es", SepCMAES)])
+def test_create_strategy(name: str, expected_class: type) -> None:
+    """Test create_strategy function creates the named evolution strategy."""
+    strategy = create_strategy(name, np.zeros(MOCK_DIMENSION), MOCK_POPULATION_SIZE, MOCK_SIGMA, MOCK_LEARNING_RATE)
+
+    assert isinstance(strategy, expected_class)
@@ -0,0 +1,64 @@
+"""Unit tests for the neuroevolution_flappy_bird.ga.fitness_cache module."""
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.ga.fitness_cache import FitnessCache
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork
+
+MOCK_MAX_SIZE = 2
+MOCK_COURSE_SEEDS = [1, 2]
+MOCK_SCORES = np.array([10, 20])
+
+
+def create_network(value: float) -> PolicyNetwork:
+    """Create a PolicyNetwork with every parameter set to a value."""
+    return PolicyNetwork([np.full((2, 5), value)], [np.full(2, value)], ["linear"])
+
+
+@pytest.fixture
+def fitness_cache() -> FitnessCache:
+    """Mock FitnessCache instance."""
+    return FitnessCache(MOCK_MAX_SIZE)
+
+
+class TestFitnessCache:
+    """Unit tests for the FitnessCache class."""
+
+    def test_initialization(self, fitness_cache: FitnessCache) -> None:
+        """Test FitnessCache initialization."""
+        assert len(fitness_cache) == 0
+        assert fitness_cache.hit_rate == 0
+
+    def test_key(self) -> None:
+        """Test key static method depends on the genome and the Course seeds."""
+        key = FitnessCache.key(create_network(0.5), MOCK_COURSE_SEEDS)
+
+        assert FitnessCache.key(create_network(0.5), MOCK_COURSE_SEEDS) == key
+        assert FitnessCache.key(create_network(0.25), MOCK_COURSE_SEEDS) != key
+        assert FitnessCache.key(create_network(0.5), MOCK_COURSE_SEEDS[:1]) != key
+
+    def test_get_and_put(self, fitness_cache: FitnessCache) -> None:
+        """Test get method finds cached scores and counts hits and misses."""
+        key = FitnessCache.key(create_network(0.5), MOCK_COURSE_SEEDS)
+        assert fitness_cache.get(key) is None
+
+        fitness_cache.put(key, MOCK_SCORES)
+
+        scores = fitness_cache.get(key)
+        assert scores is not None
+        assert np.array_equal(scores, MOCK_SCORES)
+        assert fitness_cache.hit_rate == 1 / 2
+
+    def test_lru_eviction(self, fitness_cache: FitnessCache) -> None:
+        """Test put method evicts the least recently used genome once the cache is full."""
+        keys = [FitnessCache.key(create_network(_value), MOCK_COURSE_SEEDS) for _value in range(MOCK_MAX_SIZE + 1)]
+        fitness_cache.put(keys[0], MOCK_SCORES)
+        fitness_cache.put(keys[1], MOCK_SCORES)
+        fitness_cache.get(keys[0])
+
+        fitness_cache.put(keys[2], MOCK_SCORES)
+
+        assert len(fitness_cache) == MOCK_MAX_SIZE
+        assert fitness_cache.get(keys[0]) is not None
+        assert fitness_cache.get(keys[1]) is None
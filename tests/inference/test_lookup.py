@@ -0,0 +1,116 @@
+"""Unit tests for the neuroevolution_flappy_bird.inference.lookup module."""
+
+import itertools
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.inference.lookup import LookupPolicy, load_policy, observation_bounds
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork
+from neuroevolution_flappy_bird.objects.pipe import Pipe
+
+MOCK_SEED = 123
+MOCK_LAYER_SIZES = [5, 6, 2]
+MOCK_X_LIM = 500
+MOCK_Y_LIM = 800
+MOCK_BIRD_X = 40
+MOCK_BINS = np.array([4, 5, 3, 6])
+MOCK_NUM_OBSERVATIONS = 1000
+
+
+@pytest.fixture
+def network() -> PolicyNetwork:
+    """Mock PolicyNetwork instance."""
+    _rng = np.random.default_rng(MOCK_SEED)
+    return PolicyNetwork(
+        [_rng.uniform(-1, 1, size=(_out, _in)) for _in, _out in itertools.pairwise(MOCK_LAYER_SIZES)],
+        [_rng.uniform(-1, 1, size=_out) for _out in MOCK_LAYER_SIZES[1:]],
+        ["relu", "linear"],
+    )
+
+
+@pytest.fixture
+def bounds() -> tuple[np.ndarray, np.ndarray]:
+    """Observation bounds of the mock screen."""
+    return observation_bounds(MOCK_X_LIM, MOCK_Y_LIM, MOCK_BIRD_X)
+
+
+@pytest.fixture
+def table(network: PolicyNetwork, bounds: tuple[np.ndarray, np.ndarray]) -> LookupPolicy:
+    """Mock LookupPolicy distilled from the mock network."""
+    return LookupPolicy.distill(network, *bounds, MOCK_BINS, MOCK_Y_LIM, batch_size=7)
+
+
+@pytest.fixture
+def observations() -> np.ndarray:
+    """Mock observations, a third of them before the first Pipe has spawned and some outside the grid."""
+    _observations = np.random.default_rng(MOCK_SEED).uniform(-0.5, 1.5, size=(MOCK_NUM_OBSERVATIONS, 5))
+    _observations[::3, 2:] = 0
+    return _observations
+
+
+def test_observation_bounds(bounds: tuple[np.ndarray, np.ndarray]) -> None:
+    """Test observation_bounds function covers every Pipe height and a fall after a jump."""
+    lows, highs = bounds
+
+    assert np.all(lows < highs)
+    assert lows[2] * MOCK_Y_LIM == Pipe.SPACING
+    assert highs[2] * MOCK_Y_LIM == MOCK_Y_LIM - 2 * Pipe.SPACING
+    assert highs[1] == 1
+
+
+class TestLookupPolicy:
+    """Unit tests for the LookupPolicy class."""
+
+    def test_distill(self, table: LookupPolicy, network: PolicyNetwork) -> None:
+        """Test distill method stores the network's decision at the centre of every cell."""
+        centres = LookupPolicy.cell_centres(table._lows, table._highs, table._bins)
+        observations = np.zeros((len(centres), 5))
+        observations[:, [0, 1, 2, 4]] = centres
+        observations[:, 3] = 1 - centres[:, 2] + Pipe.SPACING / MOCK_Y_LIM
+
+        assert table.num_cells == np.prod(MOCK_BINS)
+        assert table._bits.nbytes == -(-(table.num_cells + MOCK_BINS[0] * MOCK_BINS[1]) // 8)
+        assert np.array_equal(table.jumps(observations), network.jumps(observations))
+
+    def test_jumps_without_pipe(self, table: LookupPolicy, network: PolicyNetwork) -> None:
+        """Test jumps method uses the table without Pipe inputs before the first Pipe has spawned."""
+        centres = LookupPolicy.cell_centres(table._lows[:2], table._highs[:2], table._bins[:2])
+        observations = np.zeros((len(centres), 5))
+        observations[:, :2] = centres
+
+        assert np.array_equal(table.jumps(observations), network.jumps(observations))
+
+    def test_cell_indices(self, table: LookupPolicy, observations: np.ndarray) -> None:
+        """Test cell_indices method keeps observations outside the grid in the nearest cell."""
+        cells = table.cell_indices(observations)
+
+        assert np.all(cells >= 0)
+        assert np.all(cells < table.num_cells + MOCK_BINS[0] * MOCK_BINS[1])
+        assert np.all(cells[::3] >= table.num_cells)
+
+    def test_jump(self, table: LookupPolicy, observations: np.ndarray) -> None:
+        """Test jump method decides single observations in the same way as jumps method."""
+        expected = table.jumps(observations)
+
+        assert [table.jump(_observation.tolist()) for _observation in observations] == expected.tolist()
+        assert table.jumps(observations[0]) == expected[0]
+
+    def test_save_and_load(self, table: LookupPolicy, observations: np.ndarray, tmp_path: Path) -> None:
+        """Test lookup tables are saved and loaded without changing decisions."""
+        filepath = tmp_path / "table.npz"
+
+        table.save(str(filepath))
+        loaded = LookupPolicy.load(str(filepath))
+
+        assert np.array_equal(loaded.jumps(observations), table.jumps(observations))
+
+
+def test_load_policy(table: LookupPolicy, network: PolicyNetwork, tmp_path: Path) -> None:
+    """Test load_policy function loads networks and lookup tables."""
+    network.save(str(tmp_path / "network.npz"))
+    table.save(str(tmp_path / "table.npz"))
+
+    assert isinstance(load_policy(str(tmp_path / "network.npz")), PolicyNetwork)
+    assert isinstance(load_policy(str(tmp_path / "table.npz")), LookupPolicy)
@@ -0,0 +1,167 @@
+"""Unit tests for the neuroevolution_flappy_bird.inference.network module."""
+
+import itertools
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork, PopulationNetwork
+
+MOCK_SEED = 123
+MOCK_LAYER_SIZES = [5, 4, 3, 2]
+MOCK_NUM_BIRDS = 8
+MOCK_NUM_COURSES = 3
+MOCK_CORPUS_SIZE = 100000
+MOCK_DECISION_TOLERANCE = 1e-4
+
+
+def random_network(seed: int) -> PolicyNetwork:
+    """Create a PolicyNetwork with random parameters."""
+    _rng = np.random.default_rng(seed)
+    return PolicyNetwork(
+        [_rng.uniform(-1, 1, size=(_out, _in)) for _in, _out in itertools.pairwise(MOCK_LAYER_SIZES)],
+        [_rng.uniform(-1, 1, size=_out) for _out in MOCK_LAYER_SIZES[1:]],
+        ["relu", "relu", "linear"],
+    )
+
+
+@pytest.fixture
+def network() -> PolicyNetwork:
+    """Mock PolicyNetwork instance."""
+    return random_network(MOCK_SEED)
+
+
+@pytest.fixture
+def observations() -> np.ndarray:
+    """Mock observations for a batch of Birds."""
+    return np.random.default_rng(MOCK_SEED).random((MOCK_NUM_BIRDS, MOCK_LAYER_SIZES[0]))
+
+
+class TestPolicyNetwork:
+    """Unit tests for the PolicyNetwork class."""
+
+    def test_layer_sizes(self, network: PolicyNetwork) -> None:
+        """Test layer_sizes property."""
+        assert network.layer_sizes == MOCK_LAYER_SIZES
+
+    def test_from_member(self, network: PolicyNetwork) -> None:
+        """Test from_member class method skips the input layer and flattens biases."""
+        mock_member = MagicMock()
+        mock_member._hidden_layer_sizes = MOCK_LAYER_SIZES[1:-1]
+        mock_member.chromosome = (
+            [MagicMock(vals=np.zeros((0, 0))), *[MagicMock(vals=_weights) for _weights in network._weights]],
+            [MagicMock(vals=np.zeros((0, 0))), *[MagicMock(vals=_biases[:, None]) for _biases in network._biases]],
+        )
+
+        member_network = PolicyNetwork.from_member(mock_member)
+
+        assert member_network.layer_sizes == MOCK_LAYER_SIZES
+        assert member_network._activations == ["relu", "relu", "linear"]
+        for biases, expected_biases in zip(member_network._biases, network._biases, strict=True):
+            assert np.array_equal(biases, expected_biases)
+
+    def test_feedforward(self, network: PolicyNetwork, observations: np.ndarray) -> None:
+        """Test feedforward method matches a layer by layer calculation."""
+        expected = observations[0]
+        for weights, biases, activation in zip(network._weights, network._biases, network._activations, strict=True):
+            expected = weights @ expected + biases
+            if activation == "relu":
+                expected = np.maximum(expected, 0)
+
+        assert np.allclose(network.feedforward(observations[0]), expected)
+
+    def test_feedforward_batch(self, network: PolicyNetwork, observations: np.ndarray) -> None:
+        """Test feedforward method gives the same outputs for a batch as for each observation."""
+        outputs = network.feedforward(observations)
+        assert outputs.shape == (MOCK_NUM_BIRDS, MOCK_LAYER_SIZES[-1])
+        for observation, output in zip(observations, outputs, strict=True):
+            assert np.allclose(network.feedforward(observation), output)
+
+    def test_jumps(self, network: PolicyNetwork, observations: np.ndarray) -> None:
+        """Test jumps method compares the two outputs."""
+        outputs = network.feedforward(observations)
+        assert np.array_equal(network.jumps(observations), outputs[:, 0] < outputs[:, 1])
+
+    def test_save_and_load(self, network: PolicyNetwork, observations: np.ndarray, tmp_path: Path) -> None:
+        """Test a saved PolicyNetwork loads with the same outputs."""
+        filepath = str(tmp_path / "champion.npz")
+        network.save(filepath)
+        loaded = PolicyNetwork.load(filepath)
+
+        assert loaded.layer_sizes == MOCK_LAYER_SIZES
+        assert loaded._activations == network._activations
+        assert np.array_equal(loaded.feedforward(observations), network.feedforward(observations))
+
+    def test_astype(self, network: PolicyNetwork, observations: np.ndarray, tmp_path: Path) -> None:
+        """Test astype method converts the parameters and the forward pass, and the precision is kept when saved."""
+        filepath = str(tmp_path / "champion.npz")
+        float32_network = network.astype("float32")
+        float32_network.save(filepath)
+
+        assert network.precision == "float64"
+        assert float32_network.precision == "float32"
+        assert float32_network.feedforward(observations).dtype == np.float32
+        assert PolicyNetwork.load(filepath).precision == "float32"
+
+    def test_float32_decisions(self, network: PolicyNetwork) -> None:
+        """Test float32 jump decisions match float64 ones on a corpus, apart from near ties in the outputs."""
+        corpus = np.random.default_rng(MOCK_SEED).uniform(-1, 2, size=(MOCK_CORPUS_SIZE, MOCK_LAYER_SIZES[0]))
+        outputs = network.feedforward(corpus)
+        decided = np.abs(outputs[:, 0] - outputs[:, 1]) > MOCK_DECISION_TOLERANCE
+
+        jumps = network.jumps(corpus)
+        float32_jumps = network.astype("float32").jumps(corpus.astype(np.float32))
+
+        assert np.array_equal(float32_jumps[decided], jumps[decided])
+
+
+class TestPopulationNetwork:
+    """Unit tests for the PopulationNetwork class."""
+
+    def test_feedforward(self) -> None:
+        """Test feedforward method gives each Bird the outputs of its own network on every Course."""
+        networks = [random_network(_seed) for _seed in range(MOCK_NUM_BIRDS)]
+        population_network = PopulationNetwork.from_networks(networks)
+        observations = np.random.default_rng(MOCK_SEED).random((MOCK_NUM_COURSES, MOCK_NUM_BIRDS, MOCK_LAYER_SIZES[0]))
+
+        outputs = population_network.feedforward(observations)
+
+        assert outputs.shape == (MOCK_NUM_COURSES, MOCK_NUM_BIRDS, MOCK_LAYER_SIZES[-1])
+        for bird, network in enumerate(networks):
+            assert np.allclose(outputs[:, bird], network.feedforward(observations[:, bird]))
+
+    def test_jumps(self) -> None:
+        """Test jumps method matches each Bird's network."""
+        networks = [random_network(_seed) for _seed in range(MOCK_NUM_BIRDS)]
+        population_network = PopulationNetwork.from_networks(networks)
+        observations = np.random.default_rng(MOCK_SEED).random((MOCK_NUM_COURSES, MOCK_NUM_BIRDS, MOCK_LAYER_SIZES[0]))
+
+        jumps = population_network.jumps(observations)
+
+        for bird, network in enumerate(networks):
+            assert np.array_equal(jumps[:, bird], network.jumps(observations[:, bird]))
+
+    def test_select(self) -> None:
+        """Test select method gives the networks of a range of Birds."""
+        population_network = PopulationNetwork.from_networks([random_network(_seed) for _seed in range(MOCK_NUM_BIRDS)])
+        observations = np.random.default_rng(MOCK_SEED).random((MOCK_NUM_COURSES, MOCK_NUM_BIRDS, MOCK_LAYER_SIZES[0]))
+        birds = slice(2, 5)
+
+        selected_network = population_network.select(birds)
+
+        assert np.array_equal(
+            selected_network.jumps(observations[:, birds]), population_network.jumps(observations)[:, birds]
+        )
+        assert np.shares_memory(selected_network._weights[0], population_network._weights[0])
+
+    def test_astype(self) -> None:
+        """Test astype method converts the stacked parameters of every Bird."""
+        population_network = PopulationNetwork.from_networks([random_network(_seed) for _seed in range(MOCK_NUM_BIRDS)])
+        observations = np.random.default_rng(MOCK_SEED).random((MOCK_NUM_COURSES, MOCK_NUM_BIRDS, MOCK_LAYER_SIZES[0]))
+
+        float32_network = population_network.astype("float32")
+
+        assert float32_network.precision == "float32"
+        assert np.array_equal(float32_network.jumps(observations), population_network.jumps(observations))
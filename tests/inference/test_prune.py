@@ -0,0 +1,131 @@
+"""Unit tests for the neuroevolution_flappy_bird.inference.prune module."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork
+from neuroevolution_flappy_bird.inference.prune import (
+    decision_agreement,
+    expand,
+    prune,
+    prune_weights,
+    remove_dead_units,
+)
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.objects.world import World
+
+MOCK_SEED = 123
+MOCK_LAYER_SIZES = [5, 6, 4, 2]
+MOCK_THRESHOLD = 0.3
+MOCK_NUM_OBSERVATIONS = 1000
+MOCK_NUM_COURSES = 4
+MOCK_X_LIM = 500
+MOCK_Y_LIM = 800
+MOCK_FPS = 60
+MOCK_NUM_FRAMES = 600
+MOCK_BIRD_X = 40
+MOCK_BIRD_Y = 250
+MOCK_BIRD_SIZE = 40
+
+
+@pytest.fixture
+def network() -> PolicyNetwork:
+    """Mock PolicyNetwork instance."""
+    _rng = np.random.default_rng(MOCK_SEED)
+    return PolicyNetwork(
+        [_rng.uniform(-1, 1, size=(_out, _in)) for _in, _out in itertools.pairwise(MOCK_LAYER_SIZES)],
+        [_rng.uniform(-1, 1, size=_out) for _out in MOCK_LAYER_SIZES[1:]],
+        ["relu", "relu", "linear"],
+    )
+
+
+@pytest.fixture
+def observations() -> np.ndarray:
+    """Mock observations for a batch of Birds."""
+    return np.random.default_rng(MOCK_SEED).uniform(-1, 2, size=(MOCK_NUM_OBSERVATIONS, MOCK_LAYER_SIZES[0]))
+
+
+def create_world() -> World:
+    """Create a World with one Bird on each of several Courses."""
+    return World(
+        [
+            Course.generate(Course.generation_seed(MOCK_SEED, 1, _index), MOCK_Y_LIM, MOCK_FPS, MOCK_NUM_FRAMES)
+            for _index in range(MOCK_NUM_COURSES)
+        ],
+        1,
+        MOCK_X_LIM,
+        MOCK_Y_LIM,
+        MOCK_NUM_FRAMES,
+        MOCK_BIRD_X,
+        MOCK_BIRD_Y,
+        MOCK_BIRD_SIZE,
+    )
+
+
+def test_prune_weights(network: PolicyNetwork) -> None:
+    """Test prune_weights function only zeroes small weights and leaves the original network unchanged."""
+    pruned = prune_weights(network, MOCK_THRESHOLD)
+
+    for weights, pruned_weights in zip(network._weights, pruned._weights, strict=True):
+        small = np.abs(weights) < MOCK_THRESHOLD
+        assert np.all(pruned_weights[small] == 0)
+        assert np.array_equal(pruned_weights[~small], weights[~small])
+        assert np.any(weights[small])
+
+
+def test_remove_dead_units(network: PolicyNetwork, observations: np.ndarray) -> None:
+    """Test remove_dead_units function removes units without weights and keeps the outputs exactly."""
+    network._weights[0][1] = 0
+    network._biases[0][1] = 0.5
+    network._weights[1][:, 3] = 0
+
+    pruned = remove_dead_units(network)
+
+    assert pruned.layer_sizes == [5, 4, 4, 2]
+    assert np.allclose(pruned.feedforward(observations), network.feedforward(observations))
+
+
+def test_remove_dead_units_cascade(network: PolicyNetwork, observations: np.ndarray) -> None:
+    """Test remove_dead_units function removes units left without weights by earlier removals."""
+    network._weights[2][:, 0] = 0
+    network._weights[1][1:] = 0
+    network._biases[1][1:] = 0
+
+    pruned = remove_dead_units(network)
+
+    assert pruned.layer_sizes == [5, 0, 0, 2]
+    assert np.allclose(pruned.feedforward(observations), network.feedforward(observations))
+
+
+def test_prune(network: PolicyNetwork, observations: np.ndarray) -> None:
+    """Test prune function gives the same outputs as only pruning the weights."""
+    pruned = prune(network, MOCK_THRESHOLD)
+
+    assert np.allclose(
+        pruned.feedforward(observations), prune_weights(network, MOCK_THRESHOLD).feedforward(observations)
+    )
+
+
+def test_expand(network: PolicyNetwork, observations: np.ndarray) -> None:
+    """Test expand function pads a pruned network back to its layer sizes with the same outputs."""
+    network._weights[1][:, 2] = 0
+    pruned = remove_dead_units(network)
+
+    expanded = expand(pruned, MOCK_LAYER_SIZES)
+
+    assert expanded.layer_sizes == MOCK_LAYER_SIZES
+    assert np.allclose(expanded.feedforward(observations), pruned.feedforward(observations))
+
+
+def test_decision_agreement(network: PolicyNetwork) -> None:
+    """Test decision_agreement function for an unchanged and an inverted network."""
+    inverted = PolicyNetwork(
+        [*network._weights[:-1], network._weights[-1][::-1]],
+        [*network._biases[:-1], network._biases[-1][::-1]],
+        network._activations,
+    )
+
+    assert decision_agreement(network, remove_dead_units(network), create_world()) == 1
+    assert decision_agreement(network, inverted, create_world()) < 1
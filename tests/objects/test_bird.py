@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
+from neuroevolution_flappy_bird.objects import world
 from neuroevolution_flappy_bird.objects.bird import Bird
 from neuroevolution_flappy_bird.objects.pipe import Pipe
 
@@ -91,6 +92,7 @@ class TestBird:
         assert bird._size == MOCK_SIZE
         assert bird._closest_pipe is None
         assert bird._alive is True
+        assert bird._jumped is False
         assert bird._hidden_layer_sizes == MOCK_HIDDEN_LAYER_SIZES
         assert bird._weights_range == MOCK_WEIGHTS_RANGE
         assert bird._bias_range == MOCK_BIAS_RANGE
@@ -181,17 +183,19 @@ class TestBird:
         bird._y = 100
         bird._score = 50
         bird._alive = False
+        bird._jumped = True
 
         bird.reset()
         assert bird.velocity == 0
         assert bird._y == MOCK_Y
         assert bird._score == 0
         assert bird._alive is True
+        assert bird._jumped is False
 
     def test_draw(self, bird: Bird) -> None:
         """Test draw method."""
         with patch("pygame.draw.rect") as mock_draw:
-            mock_screen = patch("pygame.Surface").start()
+            mock_screen = MagicMock()
             bird.draw(mock_screen)
             mock_draw.assert_called_once()
 
@@ -216,6 +220,7 @@ class TestBird:
         assert bird._y > initial_y
         assert bird._score == 1
         assert bird._alive is True
+        assert bird._jumped is False
 
     def test_update_jump(
         self,
@@ -233,6 +238,44 @@ class TestBird:
         assert bird._y == expected_y
         assert bird._score == 1
         assert bird._alive is True
+        assert bird._jumped is True
+
+    def test_sweep(self, bird: Bird, pipe: Pipe) -> None:
+        """Test _sweep method when Bird survives the step."""
+        timestep = 4
+        pipe._x = MOCK_X_LIM
+        pipe._prev_x = MOCK_X_LIM
+        initial_y = bird._y
+
+        bird._sweep(timestep, [pipe])
+
+        expected_velocity = Bird.GRAV * timestep
+        assert bird.velocity == expected_velocity
+        assert bird._y == initial_y + sum(Bird.GRAV * frame for frame in range(1, timestep + 1))
+        assert bird._score == timestep
+        assert bird._alive is True
+
+    def test_sweep_collision(self, bird: Bird, pipe: Pipe) -> None:
+        """Test _sweep method kills Bird when a Pipe moves past it within the step."""
+        timestep = 4
+        pipe._top_height = MOCK_Y_LIM
+        pipe._prev_x = MOCK_X + MOCK_SIZE + 1
+        pipe._x = MOCK_X - Pipe.WIDTH - 1
+
+        bird._sweep(timestep, [pipe])
+
+        assert bird._alive is False
+        assert bird._score < timestep
+
+    def test_update_coarse_timestep(self, bird: Bird, pipe: Pipe, mock_nn_no_jump: MagicMock) -> None:
+        """Test update method sweeping Bird over several frames."""
+        timestep = 4
+        pipe._x = MOCK_X_LIM
+        pipe._prev_x = MOCK_X_LIM
+        bird.update(pipe, timestep, [pipe])
+        assert bird._closest_pipe == pipe
+        assert bird._score == timestep
+        assert bird._alive is True
 
     def test_update_offscreen_death(self, bird: Bird, pipe: Pipe, mock_nn_no_jump: MagicMock) -> None:
         """Test update method when Bird goes offscreen and dies."""
@@ -258,3 +301,9 @@ class TestBird:
         bird.update(pipe)
         assert bird._y == initial_y
         assert bird._score == initial_score
+
+    def test_physics_match_world(self) -> None:
+        """Test Bird physics constants match those used by World."""
+        assert Bird.GRAV == world.GRAV
+        assert Bird.LIFT == world.LIFT
+        assert Bird.MIN_VELOCITY == world.MIN_VELOCITY
@@ -0,0 +1,75 @@
+"""Unit tests for the neuroevolution_flappy_bird.objects.collision module."""
+
+import numpy as np
+
+from neuroevolution_flappy_bird.objects.collision import swept_collision
+from neuroevolution_flappy_bird.objects.pipe import Pipe
+
+MOCK_BIRD_X = 40
+MOCK_SIZE = 40
+MOCK_Y_LIM = 800
+MOCK_TOP_HEIGHT = 300
+MOCK_GAP_Y = MOCK_TOP_HEIGHT + 50
+
+
+def bird_ys(y: float, num_frames: int) -> np.ndarray:
+    """Get y coordinates of a Bird holding its height for a number of frames."""
+    return np.full(num_frames, y)
+
+
+class TestSweptCollision:
+    """Unit tests for the swept_collision function."""
+
+    def test_no_pipes(self) -> None:
+        """Test Bird on screen with no Pipes survives."""
+        hit = swept_collision(
+            MOCK_BIRD_X, bird_ys(MOCK_GAP_Y, 4), MOCK_SIZE, MOCK_Y_LIM, np.array([]), np.array([]), np.array([])
+        )
+        assert hit == 0
+
+    def test_through_gap(self) -> None:
+        """Test Bird inside the gap survives a Pipe passing."""
+        hit = swept_collision(
+            MOCK_BIRD_X,
+            bird_ys(MOCK_GAP_Y, 4),
+            MOCK_SIZE,
+            MOCK_Y_LIM,
+            np.array([MOCK_BIRD_X + MOCK_SIZE + 10.0]),
+            np.array([MOCK_BIRD_X - Pipe.WIDTH - 10.0]),
+            np.array([MOCK_TOP_HEIGHT]),
+        )
+        assert hit == 0
+
+    def test_tunnelling_pipe(self) -> None:
+        """Test Pipe jumping past the Bird within a step is still detected."""
+        hit = swept_collision(
+            MOCK_BIRD_X,
+            bird_ys(0, 4),
+            MOCK_SIZE,
+            MOCK_Y_LIM,
+            np.array([MOCK_BIRD_X + MOCK_SIZE + 40.0]),
+            np.array([MOCK_BIRD_X - 80.0]),
+            np.array([MOCK_TOP_HEIGHT]),
+        )
+        expected_hit_frame = 2
+        assert hit == expected_hit_frame
+
+    def test_offscreen(self) -> None:
+        """Test Bird leaving the screen is detected on the first frame offscreen."""
+        ys = np.array([MOCK_Y_LIM - MOCK_SIZE - 10, MOCK_Y_LIM - MOCK_SIZE, MOCK_Y_LIM - MOCK_SIZE + 10])
+        hit = swept_collision(MOCK_BIRD_X, ys, MOCK_SIZE, MOCK_Y_LIM, np.array([]), np.array([]), np.array([]))
+        expected_hit_frame = 3
+        assert hit == expected_hit_frame
+
+    def test_batch_of_birds(self) -> None:
+        """Test each Bird in a batch gets its own first colliding frame."""
+        hits = swept_collision(
+            MOCK_BIRD_X,
+            np.array([bird_ys(MOCK_GAP_Y, 4), bird_ys(0, 4), np.array([MOCK_GAP_Y, -1, -2, -3])]),
+            MOCK_SIZE,
+            MOCK_Y_LIM,
+            np.array([MOCK_BIRD_X + MOCK_SIZE + 10.0]),
+            np.array([MOCK_BIRD_X - Pipe.WIDTH - 10.0]),
+            np.array([MOCK_TOP_HEIGHT]),
+        )
+        assert hits.tolist() == [0, 1, 2]
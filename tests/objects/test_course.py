@@ -0,0 +1,66 @@
+"""Unit tests for the neuroevolution_flappy_bird.objects.course module."""
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.objects.pipe import Pipe
+
+MOCK_SEED = 123
+MOCK_HEIGHT = 800
+MOCK_FPS = 60
+MOCK_NUM_FRAMES = 6000
+
+
+@pytest.fixture
+def course() -> Course:
+    """Mock Course instance."""
+    return Course.generate(MOCK_SEED, MOCK_HEIGHT, MOCK_FPS, MOCK_NUM_FRAMES)
+
+
+class TestCourse:
+    """Unit tests for the Course class."""
+
+    def test_generate(self, course: Course) -> None:
+        """Test Course.generate class method."""
+        assert course.seed == MOCK_SEED
+        assert len(course) == course.spawn_frames.size == course.speeds.size == course.top_heights.size
+        assert course.spawn_frames[0] == 0
+        assert course.spawn_frames[-1] < MOCK_NUM_FRAMES
+        assert np.all(Pipe.SPACING <= course.top_heights)
+        assert np.all(course.top_heights < MOCK_HEIGHT - (2 * Pipe.SPACING))
+
+    def test_generate_matches_spawn_rules(self, course: Course) -> None:
+        """Test Course follows the Pipe spawn time and speed rules."""
+        for pipes_spawned in range(1, len(course)):
+            expected_gap = Pipe.get_spawn_time(pipes_spawned)
+            assert course.spawn_frames[pipes_spawned] - course.spawn_frames[pipes_spawned - 1] == expected_gap
+
+        for pipes_spawned in range(len(course)):
+            assert course.speeds[pipes_spawned] == Pipe.get_speed(pipes_spawned) / MOCK_FPS
+
+        next_spawn_frame = course.spawn_frames[-1] + Pipe.get_spawn_time(len(course))
+        assert next_spawn_frame >= MOCK_NUM_FRAMES
+
+    def test_generate_same_seed(self, course: Course) -> None:
+        """Test Courses generated from the same seed are identical."""
+        other_course = Course.generate(MOCK_SEED, MOCK_HEIGHT, MOCK_FPS, MOCK_NUM_FRAMES)
+        assert np.array_equal(course.spawn_frames, other_course.spawn_frames)
+        assert np.array_equal(course.speeds, other_course.speeds)
+        assert np.array_equal(course.top_heights, other_course.top_heights)
+
+    def test_generate_no_frames(self) -> None:
+        """Test Course.generate with no frames to cover."""
+        assert len(Course.generate(MOCK_SEED, MOCK_HEIGHT, MOCK_FPS, 0)) == 0
+
+    def test_generation_seed(self) -> None:
+        """Test generation_seed static method."""
+        assert Course.generation_seed(MOCK_SEED, 1) == Course.generation_seed(MOCK_SEED, 1)
+        assert Course.generation_seed(MOCK_SEED, 1) != Course.generation_seed(MOCK_SEED, 2)
+        assert Course.generation_seed(MOCK_SEED, 1) != Course.generation_seed(MOCK_SEED + 1, 1)
+
+    def test_generation_seed_index(self) -> None:
+        """Test each Course within a generation gets its own seed, with the first matching the generation seed."""
+        assert Course.generation_seed(MOCK_SEED, 1, 0) == Course.generation_seed(MOCK_SEED, 1)
+        assert Course.generation_seed(MOCK_SEED, 1, 1) != Course.generation_seed(MOCK_SEED, 1)
+        assert Course.generation_seed(MOCK_SEED, 1, 1) != Course.generation_seed(MOCK_SEED, 1, 2)
@@ -1,6 +1,6 @@
 """Unit tests for the neuroevolution_flappy_bird.objects.pipe module."""
 
-from unittest.mock import call, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
@@ -27,6 +27,13 @@ class TestPipe:
         assert pipe._bottom_height == MOCK_HEIGHT - pipe._top_height + pipe.SPACING
         assert pipe._speed == MOCK_SPEED
 
+    def test_initialization_top_height(self) -> None:
+        """Test Pipe initialization with a given top height."""
+        top_height = 300.0
+        pipe = Pipe(MOCK_WIDTH, MOCK_HEIGHT, MOCK_SPEED, top_height)
+        assert pipe._top_height == top_height
+        assert pipe._bottom_height == MOCK_HEIGHT - top_height + pipe.SPACING
+
     def test_rects(self, pipe: Pipe) -> None:
         """Test rects property."""
         rects = pipe.rects
@@ -62,7 +69,7 @@ class TestPipe:
     def test_draw(self, pipe: Pipe) -> None:
         """Test draw method."""
         with patch("pygame.draw.rect") as mock_draw:
-            mock_screen = patch("pygame.Surface").start()
+            mock_screen = MagicMock()
             pipe.draw(mock_screen)
             mock_draw.assert_has_calls(
                 [
@@ -74,7 +81,7 @@ class TestPipe:
     def test_draw_offscreen(self, pipe: Pipe) -> None:
         """Test draw method when Pipe is offscreen."""
         with patch("pygame.draw.rect") as mock_draw:
-            mock_screen = patch("pygame.Surface").start()
+            mock_screen = MagicMock()
             pipe._x = -Pipe.WIDTH
             pipe.draw(mock_screen)
             mock_draw.assert_not_called()
@@ -84,6 +91,15 @@ class TestPipe:
         initial_x = pipe._x
         pipe.update()
         assert pipe._x == initial_x - pipe._speed
+        assert pipe._prev_x == initial_x
+
+    def test_update_steps(self, pipe: Pipe) -> None:
+        """Test update method moving Pipe by several frames."""
+        steps = 4
+        initial_x = pipe._x
+        pipe.update(steps)
+        assert pipe._x == initial_x - (pipe._speed * steps)
+        assert pipe._prev_x == initial_x
 
     def test_update_offscreen(self, pipe: Pipe) -> None:
         """Test update method when Pipe is offscreen."""
@@ -91,6 +107,7 @@ class TestPipe:
         initial_x = pipe._x
         pipe.update()
         assert pipe._x == initial_x
+        assert pipe._prev_x == initial_x
 
     def test_get_speed(self) -> None:
         """Test get_speed static method."""
@@ -0,0 +1,251 @@
+"""Unit tests for the neuroevolution_flappy_bird.objects.world module."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.objects.pipe import Pipe
+from neuroevolution_flappy_bird.objects.world import LIFT, MIN_VELOCITY, World
+
+MOCK_SEED = 123
+MOCK_NUM_COURSES = 2
+MOCK_NUM_BIRDS = 3
+MOCK_X_LIM = 500
+MOCK_Y_LIM = 800
+MOCK_FPS = 60
+MOCK_NUM_FRAMES = 600
+MOCK_BIRD_X = 40
+MOCK_BIRD_Y = 250
+MOCK_BIRD_SIZE = 40
+MOCK_TIMESTEP = 4
+MOCK_SHAPE = (MOCK_NUM_COURSES, MOCK_NUM_BIRDS)
+MOCK_JUMP_PROBABILITY = 0.1
+MOCK_NUM_STEPS = 300
+MOCK_PIPE_X = 200
+
+
+@pytest.fixture
+def courses() -> list[Course]:
+    """Mock Courses."""
+    return [
+        Course.generate(Course.generation_seed(MOCK_SEED, 1, _index), MOCK_Y_LIM, MOCK_FPS, MOCK_NUM_FRAMES)
+        for _index in range(MOCK_NUM_COURSES)
+    ]
+
+
+@pytest.fixture
+def world(courses: list[Course]) -> World:
+    """Mock World instance."""
+    return World(
+        courses, MOCK_NUM_BIRDS, MOCK_X_LIM, MOCK_Y_LIM, MOCK_NUM_FRAMES, MOCK_BIRD_X, MOCK_BIRD_Y, MOCK_BIRD_SIZE
+    )
+
+
+def no_jumps() -> np.ndarray:
+    """Get jump decisions for no Birds jumping."""
+    return np.zeros(MOCK_SHAPE, dtype=bool)
+
+
+class TestWorld:
+    """Unit tests for the World class."""
+
+    def test_initialization(self, world: World) -> None:
+        """Test World initialization."""
+        assert world._frame == 0
+        assert world._num_pipes == 0
+        assert world._y.shape == MOCK_SHAPE
+        assert np.all(world._y == MOCK_BIRD_Y)
+        assert np.all(world._velocity == 0)
+        assert np.all(world._alive)
+        assert np.all(world._score == 0)
+        assert not world.done
+
+    def test_observe_precision(self, courses: list[Course]) -> None:
+        """Test observe method returns observations in the World's precision."""
+        world = World(
+            courses,
+            MOCK_NUM_BIRDS,
+            MOCK_X_LIM,
+            MOCK_Y_LIM,
+            MOCK_NUM_FRAMES,
+            MOCK_BIRD_X,
+            MOCK_BIRD_Y,
+            MOCK_BIRD_SIZE,
+            precision="float32",
+        )
+        assert world.observe().dtype == np.float32
+
+    def test_closest_pipe_no_pipes(self, world: World) -> None:
+        """Test closest_pipe property with no Pipes."""
+        assert world.closest_pipe == -1
+
+    def test_closest_pipe_with_pipes(self, world: World) -> None:
+        """Test closest_pipe property skips Pipes behind the Birds."""
+        world._num_pipes = 2
+        world._pipe_xs[:2] = [MOCK_BIRD_X - Pipe.WIDTH - 1, MOCK_BIRD_X + 100]
+        assert world.closest_pipe == 1
+
+    def test_observe_no_pipes(self, world: World) -> None:
+        """Test observe method with no Pipes."""
+        observations = world.observe()
+        assert observations.shape == (*MOCK_SHAPE, 5)
+        assert np.all(observations[..., 0] == MOCK_BIRD_Y / MOCK_Y_LIM)
+        assert np.all(observations[..., 1:] == 0)
+
+    def test_observe_with_pipe(self, world: World, courses: list[Course]) -> None:
+        """Test observe method uses the Pipe heights of each Course."""
+        while world.closest_pipe < 0:
+            world.step(np.ones(MOCK_SHAPE, dtype=bool))
+        observations = world.observe()
+        for index, course in enumerate(courses):
+            top_height = course.top_heights[0]
+            assert np.all(observations[index, :, 2] == top_height / MOCK_Y_LIM)
+            assert np.all(observations[index, :, 3] == (MOCK_Y_LIM - top_height + Pipe.SPACING) / MOCK_Y_LIM)
+        assert np.all(observations[..., 4] == world._pipe_xs[0] / MOCK_X_LIM)
+
+    def test_observe_birds(self, world: World) -> None:
+        """Test observe method with a range of Birds only observes those Birds."""
+        world._y[:, 1] = MOCK_BIRD_Y + 1
+        observations = world.observe(slice(1, 2))
+        assert observations.shape == (MOCK_NUM_COURSES, 1, 5)
+        assert np.all(observations[..., 0] == (MOCK_BIRD_Y + 1) / MOCK_Y_LIM)
+
+    def test_move_birds(self, world: World) -> None:
+        """Test move_birds method only moves the given Birds and does not advance the frame."""
+        world.move_birds(np.ones((MOCK_NUM_COURSES, 1), dtype=bool), 1, slice(1, 2))
+        assert np.all(world._velocity[:, 1] == max(LIFT, MIN_VELOCITY) + 1)
+        assert np.all(world._score[:, 1] == 1)
+        assert np.all(world._velocity[:, [0, 2]] == 0)
+        assert np.all(world._score[:, [0, 2]] == 0)
+        assert world._frame == 0
+
+    def test_update_pipes(self, world: World, courses: list[Course]) -> None:
+        """Test update_pipes method spawns and moves Pipes."""
+        assert world.update_pipes() == 1
+        assert world._num_pipes == 1
+        assert world._pipe_prev_xs[0] == MOCK_X_LIM
+        assert world._pipe_xs[0] == MOCK_X_LIM - courses[0].speeds[0]
+        assert world.top_heights.shape == (MOCK_NUM_COURSES, 1)
+
+    def test_step_no_jump(self, world: World) -> None:
+        """Test step method when no Birds jump."""
+        world.step(no_jumps())
+        assert np.all(world._velocity == 1)
+        assert np.all(world._y == MOCK_BIRD_Y + 1)
+        assert np.all(world._score == 1)
+        assert world._frame == 1
+
+    def test_step_jump(self, world: World) -> None:
+        """Test step method applies jumps only to the Birds that jump."""
+        jumps = no_jumps()
+        jumps[1, 0] = True
+        world.step(jumps)
+        expected_velocity = max(LIFT, MIN_VELOCITY) + 1
+        assert world._velocity.tolist() == [[1, 1, 1], [expected_velocity, 1, 1]]
+        assert world._y[1, 0] == MOCK_BIRD_Y + expected_velocity
+
+    def test_step_policy(self, world: World, courses: list[Course]) -> None:
+        """Test step_policy method observes the Birds after the Pipes move, as Birds do in the game."""
+        world.update_pipes()
+        world._pipe_xs[0] = MOCK_PIPE_X
+        policy = MagicMock(return_value=np.ones(MOCK_SHAPE, dtype=bool))
+
+        jumps = world.step_policy(policy)
+
+        observations = policy.call_args.args[0]
+        assert np.all(observations[..., 4] == (MOCK_PIPE_X - courses[0].speeds[0]) / MOCK_X_LIM)
+        assert np.all(jumps)
+        assert np.all(world._velocity == max(LIFT, MIN_VELOCITY) + 1)
+
+    def test_step_offscreen_death(self, world: World) -> None:
+        """Test Birds die when they leave the screen and stop scoring."""
+        world._y[0, 0] = MOCK_Y_LIM - MOCK_BIRD_SIZE
+        world.step(no_jumps())
+        assert world._alive.tolist() == [[False, True, True], [True, True, True]]
+        assert world._score.tolist() == [[0, 1, 1], [1, 1, 1]]
+
+        world.step(no_jumps())
+        assert world._score.tolist() == [[0, 2, 2], [2, 2, 2]]
+
+    def test_step_pipe_collision(self, world: World, courses: list[Course]) -> None:
+        """Test Birds at the same height die only on the Courses where they are outside the gap."""
+        world.update_pipes()
+        world._pipe_xs[0] = world._pipe_prev_xs[0] = MOCK_BIRD_X
+        bird_y = int(courses[0].top_heights[0] + Pipe.SPACING) - MOCK_BIRD_SIZE - 10
+        world._y[:] = bird_y
+        world._velocity[:] = -1
+
+        world.update_birds(no_jumps(), 1)
+
+        for index, course in enumerate(courses):
+            top_height = int(course.top_heights[0])
+            inside_gap = top_height <= bird_y and bird_y + MOCK_BIRD_SIZE <= top_height + Pipe.SPACING
+            assert np.all(world._alive[index] == inside_gap)
+        assert world._alive[0].all()
+        assert not world._alive[1].any()
+
+    def test_done(self, world: World) -> None:
+        """Test done property."""
+        world._frame = MOCK_NUM_FRAMES
+        assert world.done
+
+        world._frame = 0
+        world._alive[:] = False
+        assert world.done
+
+    def test_courses_are_independent(self, courses: list[Course]) -> None:
+        """Test each Course plays out the same as a World with only that Course."""
+        jumps = np.random.default_rng(MOCK_SEED).random((MOCK_NUM_STEPS, *MOCK_SHAPE)) < MOCK_JUMP_PROBABILITY
+        batch_world = World(
+            courses, MOCK_NUM_BIRDS, MOCK_X_LIM, MOCK_Y_LIM, MOCK_NUM_FRAMES, MOCK_BIRD_X, MOCK_BIRD_Y, MOCK_BIRD_SIZE
+        )
+        single_worlds = [
+            World(
+                [_course],
+                MOCK_NUM_BIRDS,
+                MOCK_X_LIM,
+                MOCK_Y_LIM,
+                MOCK_NUM_FRAMES,
+                MOCK_BIRD_X,
+                MOCK_BIRD_Y,
+                MOCK_BIRD_SIZE,
+            )
+            for _course in courses
+        ]
+
+        for step_jumps in jumps:
+            batch_world.step(step_jumps)
+            for index, single_world in enumerate(single_worlds):
+                single_world.step(step_jumps[index, None])
+
+        for index, single_world in enumerate(single_worlds):
+            assert np.array_equal(batch_world._y[index], single_world._y[0])
+            assert np.array_equal(batch_world._score[index], single_world._score[0])
+
+    def test_coarse_timestep(self, courses: list[Course]) -> None:
+        """Test a coarse timestep moves Birds and Pipes to the same place as single frames."""
+        fine_world = World(
+            courses, MOCK_NUM_BIRDS, MOCK_X_LIM, MOCK_Y_LIM, MOCK_NUM_FRAMES, MOCK_BIRD_X, 0, MOCK_BIRD_SIZE
+        )
+        coarse_world = World(
+            courses,
+            MOCK_NUM_BIRDS,
+            MOCK_X_LIM,
+            MOCK_Y_LIM,
+            MOCK_NUM_FRAMES,
+            MOCK_BIRD_X,
+            0,
+            MOCK_BIRD_SIZE,
+            MOCK_TIMESTEP,
+        )
+        for _ in range(MOCK_TIMESTEP):
+            fine_world.step(no_jumps())
+        coarse_world.step(no_jumps())
+
+        assert coarse_world._frame == fine_world._frame
+        assert np.array_equal(coarse_world._y, fine_world._y)
+        assert np.array_equal(coarse_world._velocity, fine_world._velocity)
+        assert np.array_equal(coarse_world._score, fine_world._score)
+        assert np.allclose(coarse_world.pipe_xs, fine_world.pipe_xs)
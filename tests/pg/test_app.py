@@ -1,11 +1,13 @@
 """Unit tests for the neuroevolution_flappy_bird.    module."""
 
 from collections.abc import Generator
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pygame
 import pytest
 
-from neuroevolution_flappy_bird.pg.app import App
+from neuroevolution_flappy_bird.pg.app import App, resolve_font
 
 MOCK_NAME = "Test App"
 MOCK_WIDTH = 800
@@ -13,6 +15,7 @@ MOCK_HEIGHT = 600
 MOCK_FPS = 60
 MOCK_FONT = "Arial"
 MOCK_FONT_SIZE = 20
+MOCK_FONT_PATH = "/fonts/arial.ttf"
 
 
 @pytest.fixture
@@ -43,27 +46,61 @@ def mock_display_set_caption() -> Generator[MagicMock]:
 
 
 @pytest.fixture
-def mock_sys_font() -> Generator[MagicMock]:
-    """Mock pygame.font.SysFont function."""
-    with patch("pygame.font.SysFont", return_value=MagicMock()) as mock:
+def mock_font() -> Generator[MagicMock]:
+    """Mock pygame.font.Font class."""
+    with patch("pygame.font.Font", return_value=MagicMock()) as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_pygame_init() -> Generator[MagicMock]:
-    """Mock pygame.init function."""
-    with patch("pygame.init") as mock:
+def mock_resolve_font() -> Generator[MagicMock]:
+    """Mock resolve_font function."""
+    with patch("neuroevolution_flappy_bird.pg.app.resolve_font", return_value=MOCK_FONT_PATH) as mock:
         yield mock
 
 
 @pytest.fixture
-def configured_app(app: App, mock_display_set_mode: MagicMock, mock_sys_font: MagicMock) -> App:
+def mock_pygame_init() -> Generator[tuple[MagicMock, MagicMock]]:
+    """Mock pygame.display.init and pygame.font.init functions."""
+    with patch("pygame.display.init") as mock_display_init, patch("pygame.font.init") as mock_font_init:
+        yield mock_display_init, mock_font_init
+
+
+@pytest.fixture
+def configured_app(
+    app: App, mock_display_set_mode: MagicMock, mock_font: MagicMock, mock_resolve_font: MagicMock
+) -> App:
     """Configured App instance."""
     app._configure()
     app._clock = MagicMock()
     return app
 
 
+class TestResolveFont:
+    """Unit tests for the resolve_font function."""
+
+    def test_font_file(self, tmp_path: Path) -> None:
+        """Test resolving a font file returns its path."""
+        font_file = tmp_path / "font.ttf"
+        font_file.touch()
+        assert resolve_font(str(font_file)) == str(font_file)
+
+    def test_default_font(self) -> None:
+        """Test resolving the default font does not scan the system fonts."""
+        with patch("pygame.font.match_font") as mock_match_font:
+            assert resolve_font(pygame.font.get_default_font()) is None
+            mock_match_font.assert_not_called()
+
+    def test_system_font(self) -> None:
+        """Test resolving a system font is cached after the first scan."""
+        resolve_font.cache_clear()
+        with patch("pygame.font.match_font", return_value=MOCK_FONT_PATH) as mock_match_font:
+            assert resolve_font(MOCK_FONT) == MOCK_FONT_PATH
+            assert resolve_font(MOCK_FONT) == MOCK_FONT_PATH
+            mock_match_font.assert_called_once_with(MOCK_FONT)
+        resolve_font.cache_clear()
+
+
 class TestApp:
     """Unit tests for the App class."""
 
@@ -78,7 +115,11 @@ class TestApp:
         assert app._running is False
 
     def test_create_app(
-        self, mock_pygame_init: MagicMock, mock_display_set_mode: MagicMock, mock_sys_font: MagicMock
+        self,
+        mock_pygame_init: tuple[MagicMock, MagicMock],
+        mock_display_set_mode: MagicMock,
+        mock_font: MagicMock,
+        mock_resolve_font: MagicMock,
     ) -> None:
         """Test App.create_app class method."""
         app = App.create_app(
@@ -90,9 +131,10 @@ class TestApp:
             font_size=MOCK_FONT_SIZE,
         )
 
-        mock_pygame_init.assert_called_once()
+        for mock_init in mock_pygame_init:
+            mock_init.assert_called_once()
         mock_display_set_mode.assert_called_once_with((MOCK_WIDTH, MOCK_HEIGHT))
-        mock_sys_font.assert_called_once_with(MOCK_FONT, MOCK_FONT_SIZE)
+        mock_font.assert_called_once_with(MOCK_FONT_PATH, MOCK_FONT_SIZE)
 
         assert app._name == MOCK_NAME
         assert app._width == MOCK_WIDTH
@@ -106,14 +148,20 @@ class TestApp:
         assert configured_app.screen is configured_app._display_surf
 
     def test_configure(
-        self, app: App, mock_display_set_mode: MagicMock, mock_display_set_caption: MagicMock, mock_sys_font: MagicMock
+        self,
+        app: App,
+        mock_display_set_mode: MagicMock,
+        mock_display_set_caption: MagicMock,
+        mock_font: MagicMock,
+        mock_resolve_font: MagicMock,
     ) -> None:
         """Test _configure method."""
         app._configure()
 
         mock_display_set_caption.assert_called_once_with(MOCK_NAME)
         mock_display_set_mode.assert_called_once_with((MOCK_WIDTH, MOCK_HEIGHT))
-        mock_sys_font.assert_called_once_with(MOCK_FONT, MOCK_FONT_SIZE)
+        mock_resolve_font.assert_called_once_with(MOCK_FONT)
+        mock_font.assert_called_once_with(MOCK_FONT_PATH, MOCK_FONT_SIZE)
 
     def test_write_text(self, configured_app: App) -> None:
         """Test write_text method."""
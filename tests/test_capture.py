@@ -0,0 +1,130 @@
+"""Unit tests for the neuroevolution_flappy_bird.capture module."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pygame
+import pytest
+
+from neuroevolution_flappy_bird.capture import FrameRecorder, rgb_to_ycbcr
+
+MOCK_WIDTH = 8
+MOCK_HEIGHT = 6
+MOCK_FPS = 30
+MOCK_QUEUE_SIZE = 4
+MOCK_NUM_FRAMES = 3
+MOCK_COLOUR = (200, 40, 90)
+Y4M_HEADER = f"YUV4MPEG2 W{MOCK_WIDTH} H{MOCK_HEIGHT} F{MOCK_FPS}:1 Ip A1:1 C444\n".encode()
+FRAME_SIZE = len(b"FRAME\n") + 3 * MOCK_WIDTH * MOCK_HEIGHT
+
+
+@pytest.fixture
+def surface() -> pygame.Surface:
+    """Offscreen surface filled with a colour."""
+    _surface = pygame.Surface((MOCK_WIDTH, MOCK_HEIGHT))
+    _surface.fill(MOCK_COLOUR)
+    return _surface
+
+
+def create_recorder(path: Path, output_format: str) -> FrameRecorder:
+    """Create a FrameRecorder for small frames.
+
+    :param Path path: Output path
+    :param str output_format: Output format
+    :return FrameRecorder: Frame recorder
+    """
+    return FrameRecorder(str(path), MOCK_WIDTH, MOCK_HEIGHT, MOCK_FPS, output_format, MOCK_QUEUE_SIZE)
+
+
+@pytest.mark.parametrize(
+    ("rgb", "expected_ycbcr"),
+    [
+        ((0, 0, 0), (16, 128, 128)),
+        ((255, 255, 255), (235, 128, 128)),
+        ((255, 0, 0), (81, 90, 240)),
+    ],
+)
+def test_rgb_to_ycbcr(rgb: tuple[int, int, int], expected_ycbcr: tuple[int, int, int]) -> None:
+    """Test rgb_to_ycbcr function against BT.601 reference values."""
+    frame = np.full((MOCK_HEIGHT, MOCK_WIDTH, 3), rgb, dtype=np.uint8)
+
+    planes = rgb_to_ycbcr(frame)
+
+    assert planes.shape == (3, MOCK_HEIGHT, MOCK_WIDTH)
+    assert np.all(planes == np.array(expected_ycbcr)[:, None, None])
+
+
+class TestFrameRecorder:
+    """Unit tests for the FrameRecorder class."""
+
+    def test_y4m(self, surface: pygame.Surface, tmp_path: Path) -> None:
+        """Test recording frames to a Y4M video."""
+        path = tmp_path / "training.y4m"
+        recorder = create_recorder(path, "y4m")
+        recorder.start()
+
+        for _ in range(MOCK_NUM_FRAMES):
+            assert recorder.capture(surface)
+        recorder.close()
+
+        data = path.read_bytes()
+        assert data.startswith(Y4M_HEADER)
+        assert len(data) == len(Y4M_HEADER) + MOCK_NUM_FRAMES * FRAME_SIZE
+        assert recorder.written == MOCK_NUM_FRAMES
+        assert recorder.dropped == 0
+
+    def test_y4m_fractional_fps(self, tmp_path: Path) -> None:
+        """Test the Y4M header stores a fractional frame rate as an exact ratio."""
+        path = tmp_path / "training.y4m"
+        recorder = FrameRecorder(str(path), MOCK_WIDTH, MOCK_HEIGHT, MOCK_FPS / 7, "y4m", MOCK_QUEUE_SIZE)
+        recorder.start()
+        recorder.close()
+
+        assert path.read_bytes() == f"YUV4MPEG2 W{MOCK_WIDTH} H{MOCK_HEIGHT} F{MOCK_FPS}:7 Ip A1:1 C444\n".encode()
+
+    def test_png(self, surface: pygame.Surface, tmp_path: Path) -> None:
+        """Test recording frames to a PNG image sequence."""
+        recorder = create_recorder(tmp_path / "frames", "png")
+        recorder.start()
+
+        for _ in range(MOCK_NUM_FRAMES):
+            recorder.capture(surface)
+        recorder.close()
+
+        images = sorted((tmp_path / "frames").iterdir())
+        assert len(images) == MOCK_NUM_FRAMES
+        assert pygame.image.load(images[0]).get_at((0, 0))[:3] == MOCK_COLOUR
+
+    def test_capture_drops_frames_when_full(self, surface: pygame.Surface, tmp_path: Path) -> None:
+        """Test capture method drops frames instead of blocking when the writer falls behind."""
+        recorder = create_recorder(tmp_path / "training.y4m", "y4m")
+
+        with patch.object(recorder._thread, "start"):
+            recorder.start()
+        captured = [recorder.capture(surface) for _ in range(MOCK_QUEUE_SIZE + MOCK_NUM_FRAMES)]
+
+        assert sum(captured) == MOCK_QUEUE_SIZE
+        assert recorder.dropped == MOCK_NUM_FRAMES
+        assert recorder._video is not None
+        recorder._video.close()
+
+    def test_close_after_writer_error(self, surface: pygame.Surface, tmp_path: Path) -> None:
+        """Test close method raises the writer thread's error instead of waiting on a full queue."""
+        recorder = create_recorder(tmp_path / "training.y4m", "y4m")
+        recorder.start()
+
+        with patch("pygame.image.tobytes", side_effect=OSError("disk full")):
+            recorder.capture(surface)
+            recorder._thread.join(timeout=10)
+        for _ in range(MOCK_QUEUE_SIZE):
+            recorder.capture(surface)
+
+        with pytest.raises(OSError, match="disk full"):
+            recorder.close()
+        assert recorder.written == 0
+
+    def test_unknown_format(self, tmp_path: Path) -> None:
+        """Test an unknown output format is rejected."""
+        with pytest.raises(KeyError):
+            create_recorder(tmp_path / "training.mp4", "mp4")
@@ -0,0 +1,276 @@
+"""Unit tests for the neuroevolution_flappy_bird.distributed module."""
+
+import contextlib
+import itertools
+import multiprocessing
+import socket
+import threading
+from collections.abc import Generator
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.distributed import (
+    RESULT,
+    Coordinator,
+    decode_result,
+    decode_task,
+    encode_result,
+    encode_task,
+    play_task,
+    receive_message,
+    run_worker,
+    send_message,
+)
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork, PopulationNetwork
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.objects.world import World
+
+MOCK_SEED = 123
+MOCK_SEEDS = [Course.generation_seed(MOCK_SEED, 1, _index) for _index in range(2)]
+MOCK_NUM_BIRDS = 10
+MOCK_LAYER_SIZES = [5, 4, 2]
+MOCK_BATCH_SIZE = 3
+MOCK_NUM_WORKERS = 3
+MOCK_TIMEOUT = 0.5
+MOCK_TASK_ID = 7
+MOCK_SETTINGS = {
+    "x_lim": 500,
+    "y_lim": 800,
+    "fps": 60,
+    "num_frames": 600,
+    "bird_x": 40,
+    "bird_y": 250,
+    "bird_size": 40,
+    "timestep": 2,
+}
+
+
+@pytest.fixture
+def network() -> PopulationNetwork:
+    """Mock PopulationNetwork with random networks."""
+    _rng = np.random.default_rng(MOCK_SEED)
+    return PopulationNetwork.from_networks(
+        [
+            PolicyNetwork(
+                [_rng.uniform(-1, 1, size=(_out, _in)) for _in, _out in itertools.pairwise(MOCK_LAYER_SIZES)],
+                [_rng.uniform(-1, 1, size=_out) for _out in MOCK_LAYER_SIZES[1:]],
+                ["relu", "linear"],
+            )
+            for _ in range(MOCK_NUM_BIRDS)
+        ]
+    )
+
+
+@pytest.fixture
+def coordinator() -> Generator[Coordinator]:
+    """Mock Coordinator listening on a free port."""
+    _coordinator = Coordinator(0, batch_size=MOCK_BATCH_SIZE, timeout=MOCK_TIMEOUT)
+    yield _coordinator
+    _coordinator.close()
+
+
+def start_worker_thread(port: int) -> threading.Thread:
+    """Run a worker on a background thread.
+
+    :param int port: Port of the coordinator
+    :return threading.Thread: Worker thread
+    """
+    _thread = threading.Thread(target=run_worker, args=("127.0.0.1", port), daemon=True)
+    _thread.start()
+    return _thread
+
+
+def test_task_round_trip(network: PopulationNetwork) -> None:
+    """Test a task decodes to the networks, seeds and settings it was encoded from."""
+    task_id, seeds, decoded_network, settings = decode_task(
+        encode_task(MOCK_TASK_ID, MOCK_SEEDS, network, MOCK_SETTINGS)
+    )
+
+    assert task_id == MOCK_TASK_ID
+    assert seeds == MOCK_SEEDS
+    assert settings == MOCK_SETTINGS
+    assert decoded_network._activations == network._activations
+    for weights, decoded_weights in zip(network._weights, decoded_network._weights, strict=True):
+        assert np.array_equal(weights, decoded_weights)
+
+
+def test_task_float32(network: PopulationNetwork) -> None:
+    """Test float32 networks are sent in float32."""
+    float32_network = network.astype("float32")
+
+    payload = encode_task(MOCK_TASK_ID, MOCK_SEEDS, float32_network, MOCK_SETTINGS)
+
+    assert decode_task(payload)[2].precision == "float32"
+    assert len(payload) < len(encode_task(MOCK_TASK_ID, MOCK_SEEDS, network, MOCK_SETTINGS))
+
+
+def test_result_round_trip() -> None:
+    """Test a result decodes to the scores it was encoded from."""
+    scores = np.arange(len(MOCK_SEEDS) * MOCK_NUM_BIRDS).reshape(len(MOCK_SEEDS), MOCK_NUM_BIRDS)
+
+    task_id, decoded_scores, end = decode_result(encode_result(MOCK_TASK_ID, scores, "extinct"))
+
+    assert task_id == MOCK_TASK_ID
+    assert np.array_equal(decoded_scores, scores)
+    assert end == "extinct"
+
+
+def test_play_task(network: PopulationNetwork) -> None:
+    """Test play_task plays the same game as World.step_policy."""
+    world = World(
+        [
+            Course.generate(_seed, MOCK_SETTINGS["y_lim"], MOCK_SETTINGS["fps"], MOCK_SETTINGS["num_frames"])
+            for _seed in MOCK_SEEDS
+        ],
+        MOCK_NUM_BIRDS,
+        MOCK_SETTINGS["x_lim"],
+        MOCK_SETTINGS["y_lim"],
+        MOCK_SETTINGS["num_frames"],
+        MOCK_SETTINGS["bird_x"],
+        MOCK_SETTINGS["bird_y"],
+        MOCK_SETTINGS["bird_size"],
+        MOCK_SETTINGS["timestep"],
+    )
+    while not world.done:
+        world.step_policy(network.jumps)
+
+    scores, end = play_task(MOCK_SEEDS, network, MOCK_SETTINGS)
+
+    assert np.array_equal(scores, world._score)
+    assert end == ("lifetime" if world._frame >= world._num_frames else "extinct")
+
+
+class TestCoordinator:
+    """Unit tests for the Coordinator class."""
+
+    def test_evaluate_without_workers(self, coordinator: Coordinator, network: PopulationNetwork) -> None:
+        """Test batches are played on the coordinator while no workers are connected."""
+        scores, end = coordinator.evaluate(MOCK_SEEDS, network, MOCK_SETTINGS)
+
+        expected_scores, expected_end = play_task(MOCK_SEEDS, network, MOCK_SETTINGS)
+        assert np.array_equal(scores, expected_scores)
+        assert end == expected_end
+
+    def test_evaluate_worker_processes(self, network: PopulationNetwork) -> None:
+        """Test several worker processes on localhost score every Bird as if they were played locally."""
+        coordinator = Coordinator(0, batch_size=MOCK_BATCH_SIZE, timeout=MOCK_TIMEOUT)
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=run_worker, args=("127.0.0.1", coordinator.port)) for _ in range(MOCK_NUM_WORKERS)
+        ]
+        for worker in workers:
+            worker.start()
+
+        assert coordinator.wait_for_workers(MOCK_NUM_WORKERS, timeout=30) == MOCK_NUM_WORKERS
+        scores, end = coordinator.evaluate(MOCK_SEEDS, network, MOCK_SETTINGS)
+        coordinator.close()
+        for worker in workers:
+            worker.join(timeout=10)
+
+        expected_scores, expected_end = play_task(MOCK_SEEDS, network, MOCK_SETTINGS)
+        assert np.array_equal(scores, expected_scores)
+        assert end == expected_end
+        assert all(worker.exitcode == 0 for worker in workers)
+
+    def test_evaluate_lost_worker(self, coordinator: Coordinator, network: PopulationNetwork) -> None:
+        """Test the batch held by a worker that disconnects is played by another worker."""
+        lost_worker = socket.create_connection(("127.0.0.1", coordinator.port))
+        coordinator.wait_for_workers(1, timeout=10)
+        start_worker_thread(coordinator.port)
+        coordinator.wait_for_workers(2, timeout=10)
+
+        def _lose_task() -> None:
+            receive_message(lost_worker)
+            lost_worker.close()
+
+        threading.Thread(target=_lose_task, daemon=True).start()
+        scores, _ = coordinator.evaluate(MOCK_SEEDS, network, MOCK_SETTINGS)
+
+        assert np.array_equal(scores, play_task(MOCK_SEEDS, network, MOCK_SETTINGS)[0])
+        assert coordinator.num_workers == 1
+
+    def test_evaluate_slow_worker(self, coordinator: Coordinator, network: PopulationNetwork) -> None:
+        """Test the batch held by a slow worker is sent to another worker and its late result is ignored."""
+        slow_worker = socket.create_connection(("127.0.0.1", coordinator.port))
+        coordinator.wait_for_workers(1, timeout=10)
+        start_worker_thread(coordinator.port)
+        coordinator.wait_for_workers(2, timeout=10)
+        first_evaluation_done = threading.Event()
+
+        def _answer_late() -> None:
+            _, payload = receive_message(slow_worker)
+            task_id, seeds, batch_network, _ = decode_task(payload)
+            first_evaluation_done.wait()
+            _wrong_scores = np.full((len(seeds), batch_network._weights[0].shape[0]), -1)
+            send_message(slow_worker, RESULT, encode_result(task_id, _wrong_scores, "extinct"))
+            with contextlib.suppress(ConnectionError):
+                while True:
+                    receive_message(slow_worker)
+
+        threading.Thread(target=_answer_late, daemon=True).start()
+        expected_scores, _ = play_task(MOCK_SEEDS, network, MOCK_SETTINGS)
+
+        first_scores, _ = coordinator.evaluate(MOCK_SEEDS, network, MOCK_SETTINGS)
+        first_evaluation_done.set()
+        second_scores, _ = coordinator.evaluate(MOCK_SEEDS, network, MOCK_SETTINGS)
+
+        assert np.array_equal(first_scores, expected_scores)
+        assert np.array_equal(second_scores, expected_scores)
+
+    def test_evaluate_silent_worker(self, coordinator: Coordinator, network: PopulationNetwork) -> None:
+        """Test batches are played on the coordinator once the only connected worker has stopped answering."""
+        silent_worker = socket.create_connection(("127.0.0.1", coordinator.port))
+        coordinator.wait_for_workers(1, timeout=10)
+        expected_scores, _ = play_task(MOCK_SEEDS, network, MOCK_SETTINGS)
+
+        first_scores, _ = coordinator.evaluate(MOCK_SEEDS, network, MOCK_SETTINGS)
+        # The worker is still busy with its first task, so the next evaluation is played on the coordinator too
+        second_scores, _ = coordinator.evaluate(MOCK_SEEDS, network, MOCK_SETTINGS)
+        silent_worker.close()
+
+        assert np.array_equal(first_scores, expected_scores)
+        assert np.array_equal(second_scores, expected_scores)
+
+    @pytest.mark.parametrize("malformed", ["truncated", "wrong_shape"])
+    def test_evaluate_malformed_result(
+        self, coordinator: Coordinator, network: PopulationNetwork, malformed: str
+    ) -> None:
+        """Test a worker that sends a malformed result is disconnected and its batch is played again."""
+        bad_worker = socket.create_connection(("127.0.0.1", coordinator.port))
+        coordinator.wait_for_workers(1, timeout=10)
+
+        def _answer_malformed() -> None:
+            _, payload = receive_message(bad_worker)
+            task_id = decode_task(payload)[0]
+            _result = (
+                b"" if malformed == "truncated" else encode_result(task_id, np.zeros((1, 1), dtype=int), "extinct")
+            )
+            send_message(bad_worker, RESULT, _result)
+            with contextlib.suppress(ConnectionError):
+                while True:
+                    receive_message(bad_worker)
+
+        threading.Thread(target=_answer_malformed, daemon=True).start()
+        scores, _ = coordinator.evaluate(MOCK_SEEDS, network, MOCK_SETTINGS)
+
+        assert np.array_equal(scores, play_task(MOCK_SEEDS, network, MOCK_SETTINGS)[0])
+        assert coordinator.num_workers == 0
+
+    def test_worker_rejects_other_messages(self, coordinator: Coordinator) -> None:
+        """Test workers stop on messages that are not tasks."""
+        errors = []
+
+        def _run() -> None:
+            try:
+                run_worker("127.0.0.1", coordinator.port)
+            except ValueError as error:
+                errors.append(error)
+
+        thread = threading.Thread(target=_run, daemon=True)
+        thread.start()
+        coordinator.wait_for_workers(1, timeout=10)
+        send_message(coordinator._workers[0], RESULT, b"")
+        thread.join(timeout=10)
+
+        assert len(errors) == 1
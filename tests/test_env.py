@@ -0,0 +1,106 @@
+"""Unit tests for the neuroevolution_flappy_bird.env module."""
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.env import VectorEnv
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.objects.world import World
+
+MOCK_SEED = 123
+MOCK_NUM_BIRDS = 4
+MOCK_X_LIM = 500
+MOCK_Y_LIM = 800
+MOCK_FPS = 60
+MOCK_LIFETIME = 10
+MOCK_BIRD_X = 40
+MOCK_BIRD_Y = 250
+MOCK_BIRD_SIZE = 40
+MOCK_TIMESTEP = 3
+MOCK_JUMP_PROBABILITY = 0.1
+
+
+@pytest.fixture
+def env() -> VectorEnv:
+    """Mock VectorEnv instance."""
+    return VectorEnv(
+        MOCK_NUM_BIRDS,
+        MOCK_X_LIM,
+        MOCK_Y_LIM,
+        MOCK_FPS,
+        MOCK_LIFETIME,
+        MOCK_BIRD_X,
+        MOCK_BIRD_Y,
+        MOCK_BIRD_SIZE,
+        MOCK_TIMESTEP,
+    )
+
+
+def random_policy(observations: np.ndarray) -> np.ndarray:
+    """Jump at random, seeded by the observations so the same observations give the same jumps.
+
+    :param np.ndarray observations: Observation of each Bird
+    :return np.ndarray: Whether each Bird jumps
+    """
+    _rng = np.random.default_rng(int(observations.sum() * 1e6) % (2**32))
+    return _rng.random(observations.shape[:-1]) < MOCK_JUMP_PROBABILITY
+
+
+class TestVectorEnv:
+    """Unit tests for the VectorEnv class."""
+
+    def test_reset(self, env: VectorEnv) -> None:
+        """Test reset method starts every Bird at its start position on the seeded Course."""
+        observations, info = env.reset(MOCK_SEED)
+
+        assert observations.shape == (MOCK_NUM_BIRDS, 5)
+        assert np.all(observations[:, 0] == MOCK_BIRD_Y / MOCK_Y_LIM)
+        assert np.all(observations[:, 1] == 0)
+        assert info["course_seed"] == MOCK_SEED
+        assert info["frame"] == 0
+        assert np.all(info["score"] == 0)
+
+    def test_reset_random_course(self, env: VectorEnv) -> None:
+        """Test reset method picks a Course when no seed is given."""
+        _, info = env.reset()
+
+        assert isinstance(info["course_seed"], int)
+
+    def test_step_matches_world(self, env: VectorEnv) -> None:
+        """Test stepping with a policy's actions plays the same game as World.step_policy."""
+        world = World(
+            [Course.generate(MOCK_SEED, MOCK_Y_LIM, MOCK_FPS, MOCK_LIFETIME * MOCK_FPS)],
+            MOCK_NUM_BIRDS,
+            MOCK_X_LIM,
+            MOCK_Y_LIM,
+            MOCK_LIFETIME * MOCK_FPS,
+            MOCK_BIRD_X,
+            MOCK_BIRD_Y,
+            MOCK_BIRD_SIZE,
+            MOCK_TIMESTEP,
+        )
+        while not world.done:
+            world.step_policy(random_policy)
+
+        observations, _ = env.reset(MOCK_SEED)
+        returns = np.zeros(MOCK_NUM_BIRDS)
+        terminated = truncated = np.zeros(MOCK_NUM_BIRDS, dtype=bool)
+        while not np.all(terminated | truncated):
+            observations, rewards, terminated, truncated, info = env.step(random_policy(observations[None])[0])
+            returns += rewards
+
+        assert np.array_equal(returns, world._score[0])
+        assert np.array_equal(info["score"], world._score[0])
+        assert np.array_equal(terminated, ~world._alive[0])
+        assert info["frame"] == world._frame
+
+    def test_step_rewards(self, env: VectorEnv) -> None:
+        """Test step method rewards each alive Bird with the frames survived in the step."""
+        env.reset(MOCK_SEED)
+
+        _, rewards, terminated, truncated, info = env.step(np.zeros(MOCK_NUM_BIRDS, dtype=bool))
+
+        assert np.all(rewards == MOCK_TIMESTEP)
+        assert not terminated.any()
+        assert not truncated.any()
+        assert info["frame"] == MOCK_TIMESTEP
@@ -1,11 +1,23 @@
 """Unit tests for the neuroevolution_flappy_bird.flappy_bird_app module."""
 
+import inspect
+import os
 from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import cast
 from unittest.mock import MagicMock, PropertyMock, patch
 
+import numpy as np
 import pytest
 
-from neuroevolution_flappy_bird.flappy_bird_app import FlappyBirdApp
+from neuroevolution_flappy_bird.flappy_bird_app import FlappyBirdApp, add_ga_kwargs
+from neuroevolution_flappy_bird.ga.fitness_cache import FitnessCache
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.parallel import ChunkedStepper
+from neuroevolution_flappy_bird.replay import Replay, ReplayRecorder
+from neuroevolution_flappy_bird.shared_state import SharedStateReader
+from neuroevolution_flappy_bird.status import TrainingStatus
 
 MOCK_NAME = "Flappy Bird"
 MOCK_WIDTH = 800
@@ -13,6 +25,7 @@ MOCK_HEIGHT = 600
 MOCK_FPS = 60
 MOCK_FONT = "Arial"
 MOCK_FONT_SIZE = 20
+MOCK_FONT_PATH = "/fonts/arial.ttf"
 MOCK_POPULATION_SIZE = 10
 MOCK_MUTATION_RATE = 0.1
 MOCK_LIFETIME = 30
@@ -22,6 +35,36 @@ MOCK_BIRD_SIZE = 20
 MOCK_HIDDEN_LAYER_SIZES = [4, 4]
 MOCK_WEIGHTS_RANGE = (-1.0, 1.0)
 MOCK_BIAS_RANGE = (-1.0, 1.0)
+MOCK_COURSE_SEED = 42
+MOCK_REPLAY_BIRDS = [1, 3]
+MOCK_CHAMPION_FILEPATH = "champion.npz"
+MOCK_NUM_COURSES = 3
+MOCK_ELITE_COUNT = 2
+MOCK_SPEED = 4.0
+MOCK_FRAME_INTERVAL = 2
+MOCK_ES_SIGMA = 0.2
+MOCK_ES_LEARNING_RATE = 0.05
+MOCK_NUM_THREADS = 2
+MOCK_DEAD_BIRDS = [1, 3]
+MOCK_FINISHED_SCORE = 100
+MOCK_SHARED_STATE_NAME = f"flappy_bird_app_test_{os.getpid()}"
+MOCK_SEED_NETWORK_FILEPATH = "seed.npz"
+MOCK_GA_CONFIG = {
+    "population_size": MOCK_POPULATION_SIZE,
+    "mutation_rate": MOCK_MUTATION_RATE,
+    "lifetime": MOCK_LIFETIME,
+    "bird_x": MOCK_BIRD_X,
+    "bird_y": MOCK_BIRD_Y,
+    "bird_size": MOCK_BIRD_SIZE,
+    "hidden_layer_sizes": MOCK_HIDDEN_LAYER_SIZES,
+    "weights_range": MOCK_WEIGHTS_RANGE,
+    "bias_range": MOCK_BIAS_RANGE,
+}
+MOCK_DIVERSITY: dict[str, float | dict[str, float]] = {
+    "pairwise_distance": 1.5,
+    "centroid_distance": 1.0,
+    "layer_variance": {"0": 0.25, "1": 0.5},
+}
 
 
 @pytest.fixture
@@ -44,6 +87,27 @@ def mock_flappy_bird_ga() -> Generator[MagicMock]:
         yield mock
 
 
+@pytest.fixture
+def mock_policy_network() -> Generator[MagicMock]:
+    """Mock PolicyNetwork class."""
+    with patch("neuroevolution_flappy_bird.flappy_bird_app.PolicyNetwork") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_population_diversity() -> Generator[MagicMock]:
+    """Mock population_diversity function."""
+    with patch("neuroevolution_flappy_bird.flappy_bird_app.population_diversity", return_value=MOCK_DIVERSITY) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_closest_pipe() -> Generator[PropertyMock]:
+    """Mock FlappyBirdApp.closest_pipe property."""
+    with patch.object(FlappyBirdApp, "closest_pipe", new_callable=PropertyMock) as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_pipe() -> Generator[MagicMock]:
     """Mock Pipe class."""
@@ -59,19 +123,26 @@ def mock_display_set_mode() -> Generator[MagicMock]:
 
 
 @pytest.fixture
-def mock_sys_font() -> Generator[MagicMock]:
-    """Mock pygame.font.SysFont function."""
-    with patch("pygame.font.SysFont", return_value=MagicMock()) as mock:
+def mock_font() -> Generator[MagicMock]:
+    """Mock pygame.font.Font class."""
+    with patch("pygame.font.Font", return_value=MagicMock()) as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_pygame_init() -> Generator[MagicMock]:
-    """Mock pygame.init function."""
-    with patch("pygame.init") as mock:
+def mock_resolve_font() -> Generator[MagicMock]:
+    """Mock resolve_font function."""
+    with patch("neuroevolution_flappy_bird.pg.app.resolve_font", return_value=MOCK_FONT_PATH) as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_pygame_init() -> Generator[tuple[MagicMock, MagicMock]]:
+    """Mock pygame.display.init and pygame.font.init functions."""
+    with patch("pygame.display.init") as mock_display_init, patch("pygame.font.init") as mock_font_init:
+        yield mock_display_init, mock_font_init
+
+
 @pytest.fixture
 def mock_pygame_draw_rect() -> Generator[MagicMock]:
     """Mock pygame.draw.rect function."""
@@ -81,7 +152,13 @@ def mock_pygame_draw_rect() -> Generator[MagicMock]:
 
 @pytest.fixture
 def configured_app(
-    app: FlappyBirdApp, mock_display_set_mode: MagicMock, mock_sys_font: MagicMock, mock_flappy_bird_ga: MagicMock
+    app: FlappyBirdApp,
+    mock_display_set_mode: MagicMock,
+    mock_font: MagicMock,
+    mock_resolve_font: MagicMock,
+    mock_flappy_bird_ga: MagicMock,
+    mock_policy_network: MagicMock,
+    mock_population_diversity: MagicMock,
 ) -> FlappyBirdApp:
     """Configured FlappyBirdApp with a mock GA."""
     app._configure()
@@ -92,7 +169,8 @@ def configured_app(
     mock_ga_instance._lifetime = MOCK_LIFETIME
     mock_ga_instance._generation = 1
     mock_ga_instance.num_alive = 5
-    mock_ga_instance._population._members = []
+    mock_ga_instance.scores = np.arange(MOCK_POPULATION_SIZE)
+    mock_ga_instance._population._members = [MagicMock() for _ in range(MOCK_POPULATION_SIZE)]
     mock_flappy_bird_ga.create.return_value = mock_ga_instance
 
     app.add_ga(
@@ -105,11 +183,36 @@ def configured_app(
         MOCK_HIDDEN_LAYER_SIZES,
         MOCK_WEIGHTS_RANGE,
         MOCK_BIAS_RANGE,
+        MOCK_COURSE_SEED,
     )
 
     return app
 
 
+@pytest.fixture
+def mock_ga(configured_app: FlappyBirdApp) -> MagicMock:
+    """Mock FlappyBirdGA of the configured app."""
+    return cast(MagicMock, configured_app._ga)
+
+
+def test_add_ga_kwargs() -> None:
+    """Test add_ga_kwargs function gives every add_ga parameter, with add_ga's defaults for missing settings."""
+    kwargs = add_ga_kwargs(MOCK_GA_CONFIG)
+
+    parameters = inspect.signature(FlappyBirdApp.add_ga).parameters
+    assert set(kwargs) == set(parameters) - {"self"}
+    for name, value in kwargs.items():
+        assert value == MOCK_GA_CONFIG.get(name, parameters[name].default)
+
+
+def test_add_ga_kwargs_seed_network(mock_policy_network: MagicMock) -> None:
+    """Test add_ga_kwargs function loads the seed network from its file."""
+    kwargs = add_ga_kwargs({**MOCK_GA_CONFIG, "seed_network": MOCK_SEED_NETWORK_FILEPATH})
+
+    mock_policy_network.load.assert_called_once_with(MOCK_SEED_NETWORK_FILEPATH)
+    assert kwargs["seed_network"] == mock_policy_network.load.return_value
+
+
 class TestFlappyBirdApp:
     """Unit tests for the FlappyBirdApp class."""
 
@@ -124,10 +227,14 @@ class TestFlappyBirdApp:
         assert app._game_counter == 0
         assert app._pipes == []
         assert app._current_pipes == 0
-        assert app._pipe_counter == 0
+        assert app._next_spawn_frame == 0
 
     def test_create_game(
-        self, mock_pygame_init: MagicMock, mock_display_set_mode: MagicMock, mock_sys_font: MagicMock
+        self,
+        mock_pygame_init: tuple[MagicMock, MagicMock],
+        mock_display_set_mode: MagicMock,
+        mock_font: MagicMock,
+        mock_resolve_font: MagicMock,
     ) -> None:
         """Test FlappyBirdApp.create_game class method."""
         app = FlappyBirdApp.create_game(
@@ -139,9 +246,10 @@ class TestFlappyBirdApp:
             font_size=MOCK_FONT_SIZE,
         )
 
-        mock_pygame_init.assert_called_once()
+        for mock_init in mock_pygame_init:
+            mock_init.assert_called_once()
         mock_display_set_mode.assert_called_once_with((MOCK_WIDTH, MOCK_HEIGHT))
-        mock_sys_font.assert_called_once_with(MOCK_FONT, MOCK_FONT_SIZE)
+        mock_font.assert_called_once_with(MOCK_FONT_PATH, MOCK_FONT_SIZE)
 
         assert isinstance(app, FlappyBirdApp)
         assert app._name == MOCK_NAME
@@ -195,6 +303,8 @@ class TestFlappyBirdApp:
     def test_add_ga(self, app: FlappyBirdApp, mock_flappy_bird_ga: MagicMock) -> None:
         """Test add_ga method."""
         mock_ga_instance = MagicMock()
+        mock_ga_instance._lifetime = MOCK_LIFETIME
+        mock_ga_instance._generation = 1
         mock_flappy_bird_ga.create.return_value = mock_ga_instance
 
         app.add_ga(
@@ -207,6 +317,7 @@ class TestFlappyBirdApp:
             MOCK_HIDDEN_LAYER_SIZES,
             MOCK_WEIGHTS_RANGE,
             MOCK_BIAS_RANGE,
+            MOCK_COURSE_SEED,
         )
 
         mock_flappy_bird_ga.create.assert_called_once_with(
@@ -221,22 +332,42 @@ class TestFlappyBirdApp:
             MOCK_HIDDEN_LAYER_SIZES,
             MOCK_WEIGHTS_RANGE,
             MOCK_BIAS_RANGE,
+            "roulette",
+            2,
+            0,
+            1.0,
         )
 
         assert app._ga == mock_ga_instance
         assert app._bird_x == MOCK_BIRD_X
+        assert app._course_seed == MOCK_COURSE_SEED
+        assert app._course.seed == Course.generation_seed(MOCK_COURSE_SEED, 1)
+        assert app._next_spawn_frame == 0
+        assert app._stepper is None
+
+    def test_generate_course(self, configured_app: FlappyBirdApp) -> None:
+        """Test _generate_course method."""
+        first_course = configured_app._course
+        configured_app._generate_course()
+        assert np.array_equal(configured_app._course.top_heights, first_course.top_heights)
+
+        configured_app._ga._generation = 2
+        configured_app._generate_course()
+        assert configured_app._course.seed == Course.generation_seed(MOCK_COURSE_SEED, 2)
+        assert configured_app._course.seed != first_course.seed
 
     def test_add_pipe(self, configured_app: FlappyBirdApp, mock_pipe: MagicMock) -> None:
         """Test _add_pipe method."""
-        mock_speed = 5.0
         mock_pipe_instance = MagicMock()
         mock_pipe.return_value = mock_pipe_instance
+        course = configured_app._course
 
-        configured_app._add_pipe(mock_speed)
+        configured_app._add_pipe()
 
-        mock_pipe.assert_called_once_with(MOCK_WIDTH, MOCK_HEIGHT, mock_speed)
+        mock_pipe.assert_called_once_with(MOCK_WIDTH, MOCK_HEIGHT, course.speeds[0], course.top_heights[0])
         assert mock_pipe_instance in configured_app._pipes
         assert configured_app._current_pipes == 1
+        assert configured_app._next_spawn_frame == course.spawn_frames[1]
 
     def test_write_stats(self, configured_app: FlappyBirdApp) -> None:
         """Test _write_stats method."""
@@ -255,48 +386,53 @@ class TestFlappyBirdApp:
         for i, expected_text in enumerate(expected_calls):
             assert calls[i][0][0] == expected_text
 
-    def test_update_game_reset_max_count(self, configured_app: FlappyBirdApp, mock_pipe: MagicMock) -> None:
+    def test_write_stats_diversity(self, configured_app: FlappyBirdApp) -> None:
+        """Test _write_stats method shows the latest diversity once a generation has been measured."""
+        configured_app.write_text = MagicMock()  # type: ignore[method-assign]
+        configured_app._diversity = [MOCK_DIVERSITY]
+
+        configured_app._write_stats()
+
+        assert configured_app.write_text.call_args_list[-1][0][0] == (
+            f"Diversity: {MOCK_DIVERSITY['pairwise_distance']:.3f}"
+        )
+
+    def test_update_game_reset_max_count(
+        self,
+        configured_app: FlappyBirdApp,
+        mock_ga: MagicMock,
+        mock_pipe: MagicMock,
+        mock_closest_pipe: PropertyMock,
+    ) -> None:
         """Test update method when max_count is reached."""
         configured_app._game_counter = configured_app.max_count
         configured_app._pipes = [MagicMock()]
         configured_app._current_pipes = 1
-        configured_app._pipe_counter = 10
-
-        # Mock methods
-        configured_app._ga._analyse = MagicMock()
-        configured_app._ga._evolve = MagicMock()
-        configured_app._ga.reset = MagicMock()  # type: ignore[method-assign]
-        configured_app._ga._evaluate = MagicMock()
         configured_app._write_stats = MagicMock()  # type: ignore[method-assign]
 
         configured_app.update()
 
         # Verify reset behavior
-        configured_app._ga._analyse.assert_called_once()
-        configured_app._ga._evolve.assert_called_once()
-        configured_app._ga.reset.assert_called_once()
+        mock_ga._analyse.assert_called_once()
+        mock_ga._evolve.assert_called_once()
+        mock_ga.reset.assert_called_once()
         assert configured_app._game_counter == 1  # Incremented after reset
-        assert configured_app._pipes == []
-        assert configured_app._current_pipes == 0
-        assert configured_app._pipe_counter == 1
+        assert configured_app._pipes == [mock_pipe.return_value]  # First Pipe of the new Course
+        assert configured_app._current_pipes == 1
 
-    def test_update_game_reset_no_alive(self, configured_app: FlappyBirdApp, mock_pygame_draw_rect: MagicMock) -> None:
+    def test_update_game_reset_no_alive(
+        self, configured_app: FlappyBirdApp, mock_ga: MagicMock, mock_pygame_draw_rect: MagicMock
+    ) -> None:
         """Test update method when no birds are alive."""
-        configured_app._ga.num_alive = 0  # type: ignore[misc]
-
-        # Mock methods
-        configured_app._ga._analyse = MagicMock()
-        configured_app._ga._evolve = MagicMock()
-        configured_app._ga.reset = MagicMock()  # type: ignore[method-assign]
-        configured_app._ga._evaluate = MagicMock()
+        mock_ga.num_alive = 0
         configured_app._write_stats = MagicMock()  # type: ignore[method-assign]
 
         configured_app.update()
 
         # Verify reset behavior
-        configured_app._ga._analyse.assert_called_once()
-        configured_app._ga._evolve.assert_called_once()
-        configured_app._ga.reset.assert_called_once()
+        mock_ga._analyse.assert_called_once()
+        mock_ga._evolve.assert_called_once()
+        mock_ga.reset.assert_called_once()
 
     def test_update_normal_gameplay(
         self, configured_app: FlappyBirdApp, mock_pipe: MagicMock, mock_pygame_draw_rect: MagicMock
@@ -305,18 +441,15 @@ class TestFlappyBirdApp:
         # Setup normal game state
         start_counter = 50
         configured_app._game_counter = start_counter
+        configured_app._next_spawn_frame = start_counter + 10
         configured_app._ga.num_alive = 5  # type: ignore[misc]
 
-        # Mock pipe spawning
-        mock_pipe.get_spawn_time.return_value = 60
-        mock_pipe.get_speed.return_value = 300
-
         # Mock existing pipes and birds with proper attributes
         mock_existing_pipe = MagicMock()
         configured_app._pipes = [mock_existing_pipe]
 
         mock_bird = MagicMock()
-        configured_app._ga._population._members = [mock_bird]
+        configured_app._ga.alive_birds = [mock_bird]  # type: ignore[misc]
 
         # Mock methods
         configured_app._ga._evaluate = MagicMock()
@@ -333,23 +466,27 @@ class TestFlappyBirdApp:
             mock_existing_pipe.update.assert_called_once()
             mock_existing_pipe.draw.assert_called_once_with(configured_app.screen)
 
-            mock_bird.update.assert_called_once_with(mock_closest_pipe)
+            configured_app._ga.update_birds.assert_called_once_with(  # type: ignore[attr-defined]
+                mock_closest_pipe, 1, configured_app._pipes
+            )
             mock_bird.draw.assert_called_once_with(configured_app.screen)
 
             # Verify game progression
-            configured_app._ga._evaluate.assert_called_once()
+            configured_app._ga._evaluate.assert_not_called()
             configured_app._write_stats.assert_called_once()
             assert configured_app._game_counter == start_counter + 1
-            assert configured_app._pipe_counter == 1
+            assert configured_app._current_pipes == 0
 
-    def test_update_pipe_spawning(self, configured_app: FlappyBirdApp, mock_pipe: MagicMock) -> None:
+    def test_update_pipe_spawning(
+        self, configured_app: FlappyBirdApp, mock_pipe: MagicMock, mock_closest_pipe: PropertyMock
+    ) -> None:
         """Test pipe spawning in update method."""
         # Setup for pipe spawning
-        configured_app._pipe_counter = 0
-        configured_app._current_pipes = 0
+        course = configured_app._course
+        configured_app._game_counter = int(course.spawn_frames[1])
+        configured_app._current_pipes = 1
+        configured_app._next_spawn_frame = int(course.spawn_frames[1])
 
-        mock_pipe.get_spawn_time.return_value = 1  # Spawn every frame
-        mock_pipe.get_speed.return_value = 300
         mock_pipe_instance = MagicMock()
         mock_pipe.return_value = mock_pipe_instance
 
@@ -360,7 +497,965 @@ class TestFlappyBirdApp:
         configured_app.update()
 
         # Verify pipe was spawned
-        mock_pipe.assert_called_once_with(MOCK_WIDTH, MOCK_HEIGHT, 300 / MOCK_FPS)
+        mock_pipe.assert_called_once_with(MOCK_WIDTH, MOCK_HEIGHT, course.speeds[1], course.top_heights[1])
         assert mock_pipe_instance in configured_app._pipes
-        assert configured_app._current_pipes == 1
-        assert configured_app._pipe_counter == 1
+        expected_pipes = 2
+        assert configured_app._current_pipes == expected_pipes
+        assert configured_app._next_spawn_frame == course.spawn_frames[2]
+
+    def test_update_coarse_timestep(self, configured_app: FlappyBirdApp, mock_pipe: MagicMock) -> None:
+        """Test update method simulating several frames per update."""
+        timestep = 4
+        course = configured_app._course
+        spawn_frame = int(course.spawn_frames[1])
+        configured_app._timestep = timestep
+        configured_app._game_counter = spawn_frame - 1
+        configured_app._current_pipes = 1
+        configured_app._next_spawn_frame = spawn_frame
+
+        mock_pipe_instance = MagicMock()
+        mock_pipe_instance._x = MOCK_WIDTH
+        mock_pipe_instance._speed = course.speeds[1]
+        mock_pipe.return_value = mock_pipe_instance
+
+        configured_app._ga._evaluate = MagicMock()
+        configured_app._write_stats = MagicMock()  # type: ignore[method-assign]
+
+        with patch.object(FlappyBirdApp, "closest_pipe", new_callable=PropertyMock) as mock_closest_pipe_property:
+            configured_app.update()
+            configured_app._ga.update_birds.assert_called_once_with(  # type: ignore[attr-defined]
+                mock_closest_pipe_property.return_value, timestep, configured_app._pipes
+            )
+
+        mock_pipe_instance.update.assert_called_once_with(timestep)
+        assert mock_pipe_instance._x == MOCK_WIDTH + course.speeds[1]  # Spawned one frame into the step
+        assert configured_app._game_counter == spawn_frame - 1 + timestep
+
+    def test_update_coarse_timestep_max_count(self, configured_app: FlappyBirdApp, mock_pipe: MagicMock) -> None:
+        """Test update method does not step past max_count."""
+        configured_app._timestep = 4
+        configured_app._game_counter = configured_app.max_count - 1
+        configured_app._next_spawn_frame = -1
+        configured_app._ga._evaluate = MagicMock()
+        configured_app._write_stats = MagicMock()  # type: ignore[method-assign]
+
+        configured_app.update()
+
+        assert configured_app._game_counter == configured_app.max_count
+
+    @pytest.mark.parametrize(
+        ("game_counter", "num_alive", "finished"),
+        [(0, 5, False), (MOCK_LIFETIME * MOCK_FPS, 5, True), (0, 0, True)],
+    )
+    def test_generation_finished(
+        self, configured_app: FlappyBirdApp, mock_ga: MagicMock, game_counter: int, num_alive: int, *, finished: bool
+    ) -> None:
+        """Test generation_finished property at the end of the lifetime or once every Bird is dead."""
+        configured_app._game_counter = game_counter
+        mock_ga.num_alive = num_alive
+        assert configured_app.generation_finished == finished
+
+    @pytest.mark.parametrize(
+        ("cutoff_policy", "num_alive", "expected_end"),
+        [
+            (None, MOCK_ELITE_COUNT, None),
+            (None, 1, None),
+            (None, 0, "extinct"),
+            ("elite", MOCK_ELITE_COUNT + 1, None),
+            ("elite", MOCK_ELITE_COUNT, "elite"),
+            ("ranking", MOCK_ELITE_COUNT, None),
+            ("ranking", 1, "ranking"),
+            ("ranking", 0, "extinct"),
+        ],
+    )
+    def test_generation_end(
+        self, configured_app: FlappyBirdApp, cutoff_policy: str | None, num_alive: int, expected_end: str | None
+    ) -> None:
+        """Test generation_end property ends the generation early according to the cutoff policy."""
+        configured_app._cutoff_policy = cutoff_policy
+        configured_app._elite_count = MOCK_ELITE_COUNT
+        configured_app._ga.num_alive = num_alive  # type: ignore[misc]
+        assert configured_app.generation_end == expected_end
+
+        configured_app._game_counter = configured_app.max_count
+        assert configured_app.generation_end == "lifetime"
+
+    def test_new_generation_records_end(self, configured_app: FlappyBirdApp) -> None:
+        """Test _new_generation method records the reason each generation finished."""
+        configured_app._cutoff_policy = "ranking"
+        configured_app._ga.num_alive = 1  # type: ignore[misc]
+
+        configured_app._new_generation()
+
+        assert configured_app._generation_ends == ["ranking"]
+
+    def test_new_generation(self, configured_app: FlappyBirdApp, mock_ga: MagicMock) -> None:
+        """Test _new_generation method records scores and resets the game."""
+        configured_app._game_counter = configured_app.max_count
+        configured_app._pipes = [MagicMock()]
+        configured_app._current_pipes = 1
+
+        configured_app._new_generation()
+
+        assert configured_app._best_scores == [MOCK_POPULATION_SIZE - 1]
+        assert configured_app._mean_scores == [(MOCK_POPULATION_SIZE - 1) / 2]
+        mock_ga._evaluate.assert_called_once()
+        mock_ga._analyse.assert_called_once()
+        mock_ga._evolve.assert_called_once()
+        mock_ga.reset.assert_called_once()
+        assert configured_app._game_counter == 0
+        assert configured_app._pipes == []
+        assert configured_app._current_pipes == 0
+
+    def test_new_generation_steady_state(self, configured_app: FlappyBirdApp, mock_ga: MagicMock) -> None:
+        """Test _new_generation method records the scores of the Birds replaced during a steady state generation."""
+        configured_app._steady_state = True
+        configured_app._finished_scores = [MOCK_FINISHED_SCORE]
+
+        configured_app._new_generation()
+
+        assert configured_app._best_scores == [MOCK_FINISHED_SCORE]
+        assert configured_app._mean_scores == [np.mean([MOCK_FINISHED_SCORE, *range(MOCK_POPULATION_SIZE)])]
+        assert configured_app._finished_scores == []
+        mock_ga._evolve.assert_called_once()
+
+    def test_step_steady_state(
+        self,
+        configured_app: FlappyBirdApp,
+        mock_ga: MagicMock,
+        mock_closest_pipe: PropertyMock,
+        mock_policy_network: MagicMock,
+    ) -> None:
+        """Test step method replaces the Birds that died with children and keeps the best of them as champion."""
+        configured_app._steady_state = True
+        configured_app._next_spawn_frame = -1
+        mock_ga._dead_indices = MOCK_DEAD_BIRDS
+
+        configured_app.step()
+
+        mock_ga.replace_dead.assert_called_once()
+        assert configured_app._finished_scores == MOCK_DEAD_BIRDS
+        assert configured_app._champion_score == MOCK_DEAD_BIRDS[-1]
+        mock_policy_network.from_member.assert_called_once_with(mock_ga._population._members[MOCK_DEAD_BIRDS[-1]])
+
+    def test_step_steady_state_no_deaths(
+        self, configured_app: FlappyBirdApp, mock_ga: MagicMock, mock_closest_pipe: PropertyMock
+    ) -> None:
+        """Test step method does not breed when no Bird died."""
+        configured_app._steady_state = True
+        configured_app._next_spawn_frame = -1
+        mock_ga._dead_indices = []
+
+        configured_app.step()
+
+        mock_ga.replace_dead.assert_not_called()
+        assert configured_app._finished_scores == []
+
+    def test_new_generation_diversity(
+        self, configured_app: FlappyBirdApp, mock_population_diversity: MagicMock
+    ) -> None:
+        """Test _new_generation method measures the diversity of the evaluated population."""
+        population_network = configured_app._ga.population_network
+
+        configured_app._new_generation()
+
+        mock_population_diversity.assert_called_once_with(population_network, configured_app._diversity_sample_size)
+        assert configured_app._diversity == [MOCK_DIVERSITY]
+
+    def test_new_generation_without_diversity(
+        self, configured_app: FlappyBirdApp, mock_population_diversity: MagicMock
+    ) -> None:
+        """Test _new_generation method skips diversity when its sample size is 0."""
+        configured_app._diversity_sample_size = 0
+
+        configured_app._new_generation()
+
+        mock_population_diversity.assert_not_called()
+        assert configured_app._diversity == []
+
+    def test_step_does_not_draw(
+        self,
+        configured_app: FlappyBirdApp,
+        mock_pipe: MagicMock,
+        mock_pygame_draw_rect: MagicMock,
+        mock_closest_pipe: PropertyMock,
+    ) -> None:
+        """Test step method advances the game without drawing."""
+        mock_bird = MagicMock()
+        configured_app._ga.alive_birds = [mock_bird]  # type: ignore[misc]
+        configured_app._write_stats = MagicMock()  # type: ignore[method-assign]
+
+        configured_app.step()
+
+        configured_app._ga.update_birds.assert_called_once()  # type: ignore[attr-defined]
+        mock_bird.draw.assert_not_called()
+        mock_pipe.return_value.draw.assert_not_called()
+        configured_app._write_stats.assert_not_called()
+        assert configured_app._game_counter == 1
+
+    def test_run_headless(self, configured_app: FlappyBirdApp, mock_ga: MagicMock) -> None:
+        """Test run_headless method trains for a number of generations."""
+        generations = 3
+        mock_ga.num_alive = 0
+
+        configured_app.run_headless(generations)
+
+        assert mock_ga._evolve.call_count == generations
+        assert len(configured_app._best_scores) == generations
+
+    def test_add_replay_recorder(self, configured_app: FlappyBirdApp, tmp_path: Path) -> None:
+        """Test add_replay_recorder method creates the directory and a recorder."""
+        directory = tmp_path / "replays"
+
+        configured_app.add_replay_recorder(str(directory), MOCK_REPLAY_BIRDS)
+
+        assert directory.is_dir()
+        assert configured_app._replay_birds == MOCK_REPLAY_BIRDS
+        assert isinstance(configured_app._replay_recorder, ReplayRecorder)
+
+    def test_add_status_server(self, configured_app: FlappyBirdApp) -> None:
+        """Test add_status_server method serves the training status on a free port."""
+        port = configured_app.add_status_server(0)
+
+        assert configured_app._status_server is not None
+        assert configured_app._status_server.port == port > 0
+        assert configured_app._status is not None
+        assert configured_app._status.metrics["generation"] == configured_app._ga._generation
+        configured_app._status_server.stop()
+
+    def test_publish_status(self, configured_app: FlappyBirdApp) -> None:
+        """Test _publish_status method waits for the status interval unless forced."""
+        configured_app._status = TrainingStatus()
+        configured_app._status_frames = MOCK_FPS
+
+        configured_app._publish_status()
+        assert configured_app._status.metrics == {}
+
+        configured_app._best_scores = [MOCK_LIFETIME]
+        configured_app._publish_status(force=True)
+        assert configured_app._status.metrics["best_score"] == MOCK_LIFETIME
+        assert configured_app._status.metrics["frames_per_second"] > 0
+        assert configured_app._status_frames == 0
+
+    def test_publish_status_diversity(self, configured_app: FlappyBirdApp) -> None:
+        """Test _publish_status method publishes the latest diversity."""
+        configured_app._status = TrainingStatus()
+        configured_app._diversity = [MOCK_DIVERSITY]
+
+        configured_app._publish_status(force=True)
+
+        assert configured_app._status.metrics["diversity_pairwise_distance"] == MOCK_DIVERSITY["pairwise_distance"]
+        assert configured_app._status.metrics["diversity_layer_variance"] == MOCK_DIVERSITY["layer_variance"]
+
+    def test_new_generation_phase_seconds(self, configured_app: FlappyBirdApp) -> None:
+        """Test _new_generation method records the time spent in each phase of the finished generation."""
+        configured_app._game_counter = configured_app.max_count
+        configured_app.step()
+
+        assert set(configured_app._phase_seconds) == {"diversity", "evolve"}
+        assert set(configured_app._phase_timer.totals) == {"pipes", "birds"}
+
+    def test_update_paused(
+        self, configured_app: FlappyBirdApp, mock_ga: MagicMock, mock_pygame_draw_rect: MagicMock
+    ) -> None:
+        """Test update method keeps the game still while training is paused."""
+        configured_app._status = TrainingStatus()
+        configured_app._status.pause()
+
+        configured_app.update()
+
+        assert configured_app._game_counter == 0
+        mock_ga.update_birds.assert_not_called()
+
+    def test_add_frame_recorder(self, configured_app: FlappyBirdApp, mock_ga: MagicMock, tmp_path: Path) -> None:
+        """Test add_frame_recorder method records offscreen frames in headless training."""
+        path = tmp_path / "training.y4m"
+        mock_bird = MagicMock()
+        mock_ga.alive_birds = [mock_bird]
+        configured_app.add_frame_recorder(str(path), frame_interval=MOCK_FRAME_INTERVAL)
+        recorder = configured_app._frame_recorder
+        assert recorder is not None
+
+        for _ in range(MOCK_FRAME_INTERVAL * 2):
+            configured_app._capture_frame()
+        configured_app.close_frame_recorder()
+
+        assert recorder.written == 2  # noqa: PLR2004
+        assert configured_app._frame_recorder is None
+        assert path.read_bytes().startswith(b"YUV4MPEG2")
+        mock_bird.draw.assert_called_with(configured_app._frame_surface)
+
+    def test_update_captures_screen(self, configured_app: FlappyBirdApp, mock_pygame_draw_rect: MagicMock) -> None:
+        """Test update method captures the rendered screen."""
+        configured_app._frame_recorder = MagicMock()
+
+        configured_app.update()
+
+        configured_app._frame_recorder.capture.assert_called_once_with(configured_app.screen)
+
+    def test_add_shared_state(self, configured_app: FlappyBirdApp, mock_closest_pipe: PropertyMock) -> None:
+        """Test add_shared_state method exports the Birds and the Pipes on screen after each step."""
+        for _index, _bird in enumerate(configured_app._ga._population._members):
+            _bird._y = MOCK_BIRD_Y + _index
+            _bird._velocity = -_index
+            _bird._alive = _index % 2 == 0
+            _bird._score = _index
+        mock_offscreen_pipe = MagicMock(offscreen=True)
+        mock_pipe = MagicMock(offscreen=False, _x=MOCK_BIRD_X, _top_height=MOCK_BIRD_Y)
+        configured_app._pipes = [mock_offscreen_pipe, mock_pipe]
+        configured_app._next_spawn_frame = -1
+        configured_app.add_shared_state(MOCK_SHARED_STATE_NAME)
+        reader = SharedStateReader(MOCK_SHARED_STATE_NAME)
+
+        configured_app.step()
+        snapshot = reader.snapshot()
+        reader.close()
+        configured_app.close_shared_state()
+
+        assert snapshot["frame"] == configured_app._game_counter
+        assert np.array_equal(snapshot["y"], MOCK_BIRD_Y + np.arange(MOCK_POPULATION_SIZE))
+        assert np.array_equal(snapshot["alive"], np.arange(MOCK_POPULATION_SIZE) % 2 == 0)
+        assert np.array_equal(snapshot["pipe_x"], [MOCK_BIRD_X])
+        assert np.array_equal(snapshot["pipe_top_height"], [MOCK_BIRD_Y])
+        assert configured_app._shared_state is None
+
+    def test_new_generation_exports_fitness(self, configured_app: FlappyBirdApp) -> None:
+        """Test _new_generation method exports the fitness of the finished generation."""
+        mock_shared_state = MagicMock()
+        configured_app._shared_state = mock_shared_state
+
+        configured_app._new_generation()
+
+        mock_shared_state.write_fitness.assert_called_once_with(
+            configured_app._ga._generation, configured_app._ga.fitness
+        )
+
+    def test_frame_rate(self, configured_app: FlappyBirdApp) -> None:
+        """Test frame_rate property is scaled by the speed multiplier."""
+        assert configured_app.frame_rate == MOCK_FPS
+
+        configured_app._status = TrainingStatus()
+        configured_app._status.speed = MOCK_SPEED
+        assert configured_app.frame_rate == MOCK_FPS * MOCK_SPEED
+
+    def test_step_records_jumps(
+        self, configured_app: FlappyBirdApp, tmp_path: Path, mock_pipe: MagicMock, mock_closest_pipe: PropertyMock
+    ) -> None:
+        """Test step method records the jump decision of every Bird."""
+        mock_birds = [MagicMock(_jumped=_jumped) for _jumped in [True, False, True]]
+        configured_app._ga._population._members = mock_birds
+        configured_app.add_replay_recorder(str(tmp_path))
+
+        configured_app.step()
+
+        assert configured_app._replay_recorder is not None
+        assert len(configured_app._replay_recorder._jumps) == 1
+
+    @pytest.mark.parametrize(
+        ("birds", "expected_birds"),
+        [
+            ("best", [MOCK_POPULATION_SIZE - 1]),
+            ("all", list(range(MOCK_POPULATION_SIZE))),
+            (MOCK_REPLAY_BIRDS, MOCK_REPLAY_BIRDS),
+        ],
+    )
+    def test_new_generation_saves_replay(
+        self, configured_app: FlappyBirdApp, tmp_path: Path, birds: str | list[int], expected_birds: list[int]
+    ) -> None:
+        """Test _new_generation method saves a replay of the selected Birds."""
+        configured_app.add_replay_recorder(str(tmp_path), birds)
+        assert configured_app._replay_recorder is not None
+        configured_app._replay_recorder.record(np.ones(MOCK_POPULATION_SIZE, dtype=bool))
+
+        configured_app._new_generation()
+
+        replay = Replay.load(str(tmp_path / "generation_1.npz"))
+        assert replay.num_steps == 1
+        assert replay.num_birds == len(expected_birds)
+        assert replay._course_seed == Course.generation_seed(MOCK_COURSE_SEED, 1)
+        assert replay._scores.tolist() == expected_birds
+        assert configured_app._replay_recorder._jumps == []
+
+    def test_new_generation_updates_champion(
+        self, configured_app: FlappyBirdApp, mock_policy_network: MagicMock
+    ) -> None:
+        """Test _new_generation method keeps the best Bird's network seen so far."""
+        best_bird = configured_app._ga._population._members[-1]
+
+        configured_app._new_generation()
+
+        mock_policy_network.from_member.assert_called_once_with(best_bird)
+        assert configured_app._champion == mock_policy_network.from_member.return_value
+        assert configured_app._champion_score == MOCK_POPULATION_SIZE - 1
+
+        configured_app._new_generation()
+        mock_policy_network.from_member.assert_called_once()
+
+    def test_export_champion(self, configured_app: FlappyBirdApp, mock_policy_network: MagicMock) -> None:
+        """Test export_champion method saves the best Bird's network."""
+        configured_app.export_champion(MOCK_CHAMPION_FILEPATH)
+
+        mock_policy_network.from_member.return_value.astype.assert_called_once_with("float64")
+        mock_policy_network.from_member.return_value.astype.return_value.save.assert_called_once_with(
+            MOCK_CHAMPION_FILEPATH
+        )
+
+    def test_add_ga_courses(self, app: FlappyBirdApp, mock_flappy_bird_ga: MagicMock) -> None:
+        """Test add_ga method with several Courses per generation."""
+        mock_flappy_bird_ga.create.return_value._lifetime = MOCK_LIFETIME
+        mock_flappy_bird_ga.create.return_value._generation = 1
+
+        app.add_ga(
+            MOCK_POPULATION_SIZE,
+            MOCK_MUTATION_RATE,
+            MOCK_LIFETIME,
+            MOCK_BIRD_X,
+            MOCK_BIRD_Y,
+            MOCK_BIRD_SIZE,
+            MOCK_HIDDEN_LAYER_SIZES,
+            MOCK_WEIGHTS_RANGE,
+            MOCK_BIAS_RANGE,
+            MOCK_COURSE_SEED,
+            num_courses=MOCK_NUM_COURSES,
+            fitness_aggregation="min",
+        )
+
+        assert app._num_courses == MOCK_NUM_COURSES
+        assert app._fitness_aggregation == "min"
+
+    def test_add_ga_threads(self, app: FlappyBirdApp, mock_flappy_bird_ga: MagicMock) -> None:
+        """Test add_ga method creates a thread pool to step chunks of Birds on."""
+        mock_flappy_bird_ga.create.return_value._lifetime = MOCK_LIFETIME
+        mock_flappy_bird_ga.create.return_value._generation = 1
+
+        app.add_ga(
+            MOCK_POPULATION_SIZE,
+            MOCK_MUTATION_RATE,
+            MOCK_LIFETIME,
+            MOCK_BIRD_X,
+            MOCK_BIRD_Y,
+            MOCK_BIRD_SIZE,
+            MOCK_HIDDEN_LAYER_SIZES,
+            MOCK_WEIGHTS_RANGE,
+            MOCK_BIAS_RANGE,
+            MOCK_COURSE_SEED,
+            num_courses=MOCK_NUM_COURSES,
+            num_threads=MOCK_NUM_THREADS,
+        )
+
+        assert app._stepper is not None
+        assert app._stepper.num_threads == MOCK_NUM_THREADS
+        app.close_stepper()
+        assert app._stepper is None
+
+    def test_add_ga_threads_unbatched(self, app: FlappyBirdApp, mock_flappy_bird_ga: MagicMock) -> None:
+        """Test add_ga method does not create an unused thread pool when Birds are played on screen."""
+        with pytest.raises(ValueError, match="Threads only step batched evaluation"):
+            app.add_ga(
+                MOCK_POPULATION_SIZE,
+                MOCK_MUTATION_RATE,
+                MOCK_LIFETIME,
+                MOCK_BIRD_X,
+                MOCK_BIRD_Y,
+                MOCK_BIRD_SIZE,
+                MOCK_HIDDEN_LAYER_SIZES,
+                MOCK_WEIGHTS_RANGE,
+                MOCK_BIAS_RANGE,
+                MOCK_COURSE_SEED,
+                num_threads=MOCK_NUM_THREADS,
+            )
+        mock_flappy_bird_ga.create.assert_not_called()
+
+    def test_add_ga_steady_state(self, app: FlappyBirdApp, mock_flappy_bird_ga: MagicMock, tmp_path: Path) -> None:
+        """Test add_ga method evolves the population in a steady state, played on screen without replays."""
+        mock_flappy_bird_ga.create.return_value._lifetime = MOCK_LIFETIME
+        mock_flappy_bird_ga.create.return_value._generation = 1
+
+        app.add_ga(
+            MOCK_POPULATION_SIZE,
+            MOCK_MUTATION_RATE,
+            MOCK_LIFETIME,
+            MOCK_BIRD_X,
+            MOCK_BIRD_Y,
+            MOCK_BIRD_SIZE,
+            MOCK_HIDDEN_LAYER_SIZES,
+            MOCK_WEIGHTS_RANGE,
+            MOCK_BIAS_RANGE,
+            MOCK_COURSE_SEED,
+            steady_state=True,
+        )
+
+        assert app._steady_state
+        assert app._ga._steady_state
+        assert not app.batched
+        with pytest.raises(ValueError, match="Replays cannot be recorded"):
+            app.add_replay_recorder(str(tmp_path))
+        with pytest.raises(ValueError, match="Workers cannot score Birds"):
+            app.add_coordinator(0)
+        assert app._coordinator is None
+
+    @pytest.mark.parametrize(("num_courses", "num_threads"), [(MOCK_NUM_COURSES, 1), (1, MOCK_NUM_THREADS)])
+    def test_add_ga_steady_state_batched(
+        self, app: FlappyBirdApp, mock_flappy_bird_ga: MagicMock, num_courses: int, num_threads: int
+    ) -> None:
+        """Test add_ga method does not evolve in a steady state when Birds are scored on several Courses or threads."""
+        with pytest.raises(ValueError, match="one Course"):
+            app.add_ga(
+                MOCK_POPULATION_SIZE,
+                MOCK_MUTATION_RATE,
+                MOCK_LIFETIME,
+                MOCK_BIRD_X,
+                MOCK_BIRD_Y,
+                MOCK_BIRD_SIZE,
+                MOCK_HIDDEN_LAYER_SIZES,
+                MOCK_WEIGHTS_RANGE,
+                MOCK_BIAS_RANGE,
+                MOCK_COURSE_SEED,
+                num_courses=num_courses,
+                num_threads=num_threads,
+                steady_state=True,
+            )
+        mock_flappy_bird_ga.create.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("cutoff_policy", "selection", "optimiser", "num_courses", "fitness_aggregation", "expected_match"),
+        [
+            ("ranking", "roulette", "ga", 1, "mean", "tournament selection"),
+            ("elite", "roulette", "openai_es", 1, "mean", "genetic algorithm"),
+            ("elite", "roulette", "sep_cma_es", 1, "mean", "genetic algorithm"),
+            ("elite", "roulette", "ga", MOCK_NUM_COURSES, "mean", "several Courses"),
+            ("ranking", "tournament", "ga", MOCK_NUM_COURSES, "mean", "several Courses"),
+        ],
+    )
+    def test_add_ga_cutoff_policy_invalid(
+        self,
+        app: FlappyBirdApp,
+        mock_flappy_bird_ga: MagicMock,
+        cutoff_policy: str,
+        selection: str,
+        optimiser: str,
+        num_courses: int,
+        fitness_aggregation: str,
+        expected_match: str,
+    ) -> None:
+        """Test add_ga method rejects cutoff policies that could end a generation before selection is decided."""
+        with pytest.raises(ValueError, match=expected_match):
+            app.add_ga(
+                MOCK_POPULATION_SIZE,
+                MOCK_MUTATION_RATE,
+                MOCK_LIFETIME,
+                MOCK_BIRD_X,
+                MOCK_BIRD_Y,
+                MOCK_BIRD_SIZE,
+                MOCK_HIDDEN_LAYER_SIZES,
+                MOCK_WEIGHTS_RANGE,
+                MOCK_BIAS_RANGE,
+                MOCK_COURSE_SEED,
+                num_courses=num_courses,
+                fitness_aggregation=fitness_aggregation,
+                cutoff_policy=cutoff_policy,
+                selection=selection,
+                optimiser=optimiser,
+            )
+        mock_flappy_bird_ga.create.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("cutoff_policy", "selection", "optimiser", "num_courses", "fitness_aggregation"),
+        [
+            ("elite", "roulette", "ga", 1, "mean"),
+            ("ranking", "tournament", "ga", 1, "mean"),
+            ("ranking", "tournament", "ga", MOCK_NUM_COURSES, "min"),
+            ("ranking", "roulette", "openai_es", 1, "mean"),
+        ],
+    )
+    def test_add_ga_cutoff_policy(
+        self,
+        app: FlappyBirdApp,
+        mock_flappy_bird_ga: MagicMock,
+        cutoff_policy: str,
+        selection: str,
+        optimiser: str,
+        num_courses: int,
+        fitness_aggregation: str,
+    ) -> None:
+        """Test add_ga method accepts cutoff policies that end a generation once selection is decided."""
+        mock_flappy_bird_ga.create.return_value._lifetime = MOCK_LIFETIME
+        mock_flappy_bird_ga.create.return_value._generation = 1
+
+        app.add_ga(
+            MOCK_POPULATION_SIZE,
+            MOCK_MUTATION_RATE,
+            MOCK_LIFETIME,
+            MOCK_BIRD_X,
+            MOCK_BIRD_Y,
+            MOCK_BIRD_SIZE,
+            MOCK_HIDDEN_LAYER_SIZES,
+            MOCK_WEIGHTS_RANGE,
+            MOCK_BIAS_RANGE,
+            MOCK_COURSE_SEED,
+            num_courses=num_courses,
+            fitness_aggregation=fitness_aggregation,
+            cutoff_policy=cutoff_policy,
+            selection=selection,
+            optimiser=optimiser,
+        )
+
+        assert app._cutoff_policy == cutoff_policy
+
+    def test_add_ga_pipelined_breeding_courses(self, app: FlappyBirdApp, mock_flappy_bird_ga: MagicMock) -> None:
+        """Test add_ga method does not breed in the background when Birds are scored on several Courses."""
+        with pytest.raises(ValueError, match="single Course"):
+            app.add_ga(
+                MOCK_POPULATION_SIZE,
+                MOCK_MUTATION_RATE,
+                MOCK_LIFETIME,
+                MOCK_BIRD_X,
+                MOCK_BIRD_Y,
+                MOCK_BIRD_SIZE,
+                MOCK_HIDDEN_LAYER_SIZES,
+                MOCK_WEIGHTS_RANGE,
+                MOCK_BIAS_RANGE,
+                MOCK_COURSE_SEED,
+                num_courses=MOCK_NUM_COURSES,
+                elite_count=MOCK_ELITE_COUNT,
+                pipelined_breeding=True,
+            )
+        mock_flappy_bird_ga.create.assert_not_called()
+
+    def test_add_ga_fitness_cache_course(self, app: FlappyBirdApp, mock_flappy_bird_ga: MagicMock) -> None:
+        """Test add_ga method does not cache scores when every generation plays new Courses."""
+        with pytest.raises(ValueError, match="fixed Course"):
+            app.add_ga(
+                MOCK_POPULATION_SIZE,
+                MOCK_MUTATION_RATE,
+                MOCK_LIFETIME,
+                MOCK_BIRD_X,
+                MOCK_BIRD_Y,
+                MOCK_BIRD_SIZE,
+                MOCK_HIDDEN_LAYER_SIZES,
+                MOCK_WEIGHTS_RANGE,
+                MOCK_BIAS_RANGE,
+                MOCK_COURSE_SEED,
+                fitness_cache_size=MOCK_POPULATION_SIZE,
+            )
+        mock_flappy_bird_ga.create.assert_not_called()
+
+    def test_add_ga_strategy(self, app: FlappyBirdApp, mock_flappy_bird_ga: MagicMock) -> None:
+        """Test add_ga method evolves the population with an evolution strategy instead of pipelined breeding."""
+        mock_flappy_bird_ga.create.return_value._lifetime = MOCK_LIFETIME
+        mock_flappy_bird_ga.create.return_value._generation = 1
+
+        app.add_ga(
+            MOCK_POPULATION_SIZE,
+            MOCK_MUTATION_RATE,
+            MOCK_LIFETIME,
+            MOCK_BIRD_X,
+            MOCK_BIRD_Y,
+            MOCK_BIRD_SIZE,
+            MOCK_HIDDEN_LAYER_SIZES,
+            MOCK_WEIGHTS_RANGE,
+            MOCK_BIAS_RANGE,
+            MOCK_COURSE_SEED,
+            optimiser="sep_cma_es",
+            es_sigma=MOCK_ES_SIGMA,
+            es_learning_rate=MOCK_ES_LEARNING_RATE,
+            pipelined_breeding=True,
+        )
+
+        mock_flappy_bird_ga.create.return_value.use_strategy.assert_called_once_with(
+            "sep_cma_es", MOCK_ES_SIGMA, MOCK_ES_LEARNING_RATE
+        )
+        assert app._breeding_executor is None
+
+    def test_evaluate_courses(self, configured_app: FlappyBirdApp, mock_ga: MagicMock, tmp_path: Path) -> None:
+        """Test _evaluate_courses method plays every Bird on every Course and records the first Course."""
+        configured_app._num_courses = MOCK_NUM_COURSES
+        mock_ga.population_network.astype.return_value.jumps.side_effect = lambda observations: np.zeros(
+            observations.shape[:-1], dtype=bool
+        )
+        configured_app.add_replay_recorder(str(tmp_path))
+
+        course_scores, end = configured_app._evaluate_courses()
+
+        # Birds that never jump fall to the bottom of the screen at the same frame on every Course
+        assert end == "extinct"
+        assert course_scores.shape == (MOCK_NUM_COURSES, MOCK_POPULATION_SIZE)
+        assert np.all(course_scores == course_scores[0, 0])
+        assert configured_app._replay_recorder is not None
+        assert len(configured_app._replay_recorder._jumps) > 0
+        # Every frame the World played counts towards the status frame rate
+        assert configured_app._status_frames == len(configured_app._replay_recorder._jumps) * configured_app._timestep
+
+    def test_evaluate_courses_threads(self, configured_app: FlappyBirdApp, mock_ga: MagicMock) -> None:
+        """Test _evaluate_courses method steps chunks of Birds on the thread pool when it is set."""
+        configured_app._num_courses = MOCK_NUM_COURSES
+        mock_network = mock_ga.population_network.astype.return_value
+        mock_network.select.return_value.jumps.side_effect = lambda observations: np.zeros(
+            observations.shape[:-1], dtype=bool
+        )
+        configured_app._stepper = ChunkedStepper(MOCK_NUM_THREADS)
+
+        course_scores, end = configured_app._evaluate_courses()
+        configured_app._stepper.shutdown()
+
+        assert end == "extinct"
+        assert np.all(course_scores == course_scores[0, 0])
+        assert mock_network.select.call_count == MOCK_NUM_THREADS
+        mock_network.jumps.assert_not_called()
+
+    def test_evaluate_courses_exports_frames(self, configured_app: FlappyBirdApp, mock_ga: MagicMock) -> None:
+        """Test _evaluate_courses method exports the Birds on the first Course after each step."""
+        configured_app._num_courses = MOCK_NUM_COURSES
+        mock_ga.population_network.astype.return_value.jumps.side_effect = lambda observations: np.zeros(
+            observations.shape[:-1], dtype=bool
+        )
+        mock_shared_state = MagicMock()
+        configured_app._shared_state = mock_shared_state
+
+        configured_app._evaluate_courses()
+
+        _, frame, y, _, alive, *_ = mock_shared_state.write_frame.call_args[0]
+        assert frame > 0
+        assert y.shape == alive.shape == (MOCK_POPULATION_SIZE,)
+        assert not alive.any()
+
+    def test_new_generation_courses(self, configured_app: FlappyBirdApp, mock_ga: MagicMock) -> None:
+        """Test _new_generation method scores Birds on every Course before evolving."""
+        configured_app._num_courses = MOCK_NUM_COURSES
+        configured_app._fitness_aggregation = "min"
+        course_scores = np.ones((MOCK_NUM_COURSES, MOCK_POPULATION_SIZE))
+        configured_app._evaluate_courses = MagicMock(  # type: ignore[method-assign]
+            return_value=(course_scores, "ranking")
+        )
+
+        configured_app._new_generation()
+
+        mock_ga.set_scores.assert_called_once_with(course_scores, "min")
+        mock_ga._evolve.assert_called_once()
+        assert configured_app._generation_ends == ["ranking"]
+
+    def test_run_headless_courses(self, configured_app: FlappyBirdApp) -> None:
+        """Test run_headless method does not play the on screen Course with several Courses."""
+        generations = 2
+        configured_app._num_courses = MOCK_NUM_COURSES
+        configured_app._evaluate_courses = MagicMock(  # type: ignore[method-assign]
+            return_value=(np.zeros((MOCK_NUM_COURSES, MOCK_POPULATION_SIZE)), "lifetime")
+        )
+        configured_app.step = MagicMock()  # type: ignore[method-assign]
+
+        configured_app.run_headless(generations)
+
+        configured_app.step.assert_not_called()
+        assert configured_app._evaluate_courses.call_count == generations
+
+    def test_evaluate_courses_cutoff(self, configured_app: FlappyBirdApp, mock_ga: MagicMock) -> None:
+        """Test _evaluate_courses method stops once the cutoff policy is met on every Course."""
+        configured_app._num_courses = MOCK_NUM_COURSES
+        configured_app._cutoff_policy = "elite"
+        configured_app._elite_count = MOCK_POPULATION_SIZE
+        mock_ga.population_network.astype.return_value.jumps.side_effect = lambda observations: np.zeros(
+            observations.shape[:-1], dtype=bool
+        )
+
+        course_scores, end = configured_app._evaluate_courses()
+
+        assert end == "elite"
+        assert np.all(course_scores == 0)
+
+    @pytest.mark.parametrize(
+        ("num_alive", "expected_breeding"), [(MOCK_ELITE_COUNT + 1, False), (MOCK_ELITE_COUNT, True)]
+    )
+    def test_start_breeding(
+        self, configured_app: FlappyBirdApp, mock_ga: MagicMock, num_alive: int, *, expected_breeding: bool
+    ) -> None:
+        """Test _start_breeding method breeds in the background once only the elite is alive."""
+        configured_app._elite_count = MOCK_ELITE_COUNT
+        configured_app._breeding_executor = ThreadPoolExecutor(max_workers=1)
+        mock_ga.num_alive = num_alive
+
+        configured_app._start_breeding()
+
+        assert (configured_app._breeding is not None) == expected_breeding
+        if configured_app._breeding:
+            assert configured_app._breeding.result() == mock_ga.breed.return_value
+            mock_ga.breed.assert_called_once_with(mock_ga.fitness)
+
+    def test_start_breeding_batched(self, configured_app: FlappyBirdApp, mock_ga: MagicMock) -> None:
+        """Test _start_breeding method does not breed from the Birds on screen when training is batched."""
+        configured_app._elite_count = MOCK_ELITE_COUNT
+        configured_app._breeding_executor = ThreadPoolExecutor(max_workers=1)
+        configured_app._fitness_cache = FitnessCache(MOCK_POPULATION_SIZE)
+        mock_ga.num_alive = MOCK_ELITE_COUNT
+
+        configured_app._start_breeding()
+
+        assert configured_app._breeding is None
+        mock_ga.breed.assert_not_called()
+
+    def test_new_generation_pipelined(self, configured_app: FlappyBirdApp, mock_ga: MagicMock) -> None:
+        """Test _new_generation method uses the children bred in the background instead of evolving."""
+        children = np.arange(MOCK_ELITE_COUNT)
+        configured_app._breeding = Future()
+        configured_app._breeding.set_result(children)
+
+        configured_app._new_generation()
+
+        mock_ga.replace_chromosomes.assert_called_once_with(children)
+        mock_ga._evolve.assert_not_called()
+        assert configured_app._breeding is None
+
+    def test_course_generation(self, configured_app: FlappyBirdApp) -> None:
+        """Test course_generation property is always 1 with a fixed Course."""
+        configured_app._ga._generation = 3
+        assert configured_app.course_generation == configured_app._ga._generation
+
+        configured_app._fixed_course = True
+        assert configured_app.course_generation == 1
+
+    def test_batched(self, configured_app: FlappyBirdApp) -> None:
+        """Test batched property with several Courses or a fitness cache."""
+        assert not configured_app.batched
+
+        configured_app._fitness_cache = FitnessCache(MOCK_POPULATION_SIZE)
+        assert configured_app.batched
+
+    def test_batched_coordinator(self, configured_app: FlappyBirdApp) -> None:
+        """Test batched property with a coordinator."""
+        configured_app.add_coordinator(0)
+        assert configured_app.batched
+        assert configured_app.wait_for_workers(0) == 0
+        configured_app.close_coordinator()
+
+    def test_close_coordinator(self, configured_app: FlappyBirdApp) -> None:
+        """Test close_coordinator method stops batching and waiting for workers."""
+        configured_app.add_coordinator(0)
+        configured_app.close_coordinator()
+
+        assert not configured_app.batched
+        assert configured_app.wait_for_workers(1) == 0
+
+    def test_update_coordinator(
+        self, configured_app: FlappyBirdApp, mock_ga: MagicMock, mock_pygame_draw_rect: MagicMock
+    ) -> None:
+        """Test update method trains each generation on the coordinator's workers instead of playing it on screen."""
+        generations = 3
+        mock_coordinator = MagicMock()
+        mock_coordinator.evaluate.return_value = (np.ones((1, MOCK_POPULATION_SIZE), dtype=int), "extinct")
+        configured_app._coordinator = mock_coordinator
+
+        for _ in range(generations):
+            configured_app.update()
+
+        assert mock_coordinator.evaluate.call_count == generations
+        mock_ga.update_birds.assert_not_called()
+        assert mock_ga._evolve.call_count == generations
+        assert configured_app._game_counter == 0
+
+    def test_evaluate_courses_coordinator(self, configured_app: FlappyBirdApp, mock_ga: MagicMock) -> None:
+        """Test _evaluate_courses method plays the Birds on the coordinator's workers with the app's game settings."""
+        course_scores = np.ones((1, MOCK_POPULATION_SIZE), dtype=int)
+        mock_coordinator = MagicMock()
+        mock_coordinator.evaluate.return_value = (course_scores, "extinct")
+        configured_app._coordinator = mock_coordinator
+
+        assert configured_app._evaluate_courses() == (course_scores, "extinct")
+
+        seeds, network, settings = mock_coordinator.evaluate.call_args[0]
+        assert seeds == [Course.generation_seed(MOCK_COURSE_SEED, 1, 0)]
+        assert network == mock_ga.population_network.astype.return_value
+        assert settings == configured_app.game_settings
+        assert settings["num_frames"] == configured_app.max_count
+
+    def test_evaluate_courses_coordinator_recording(
+        self, configured_app: FlappyBirdApp, mock_ga: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test _evaluate_courses method plays the Birds locally when the first Course is recorded."""
+        mock_ga.population_network.astype.return_value.jumps.side_effect = lambda observations: np.zeros(
+            observations.shape[:-1], dtype=bool
+        )
+        mock_coordinator = MagicMock()
+        configured_app._coordinator = mock_coordinator
+        configured_app.add_replay_recorder(str(tmp_path))
+
+        configured_app._evaluate_courses()
+
+        mock_coordinator.evaluate.assert_not_called()
+
+    def test_evaluate_courses_cached(self, configured_app: FlappyBirdApp) -> None:
+        """Test _evaluate_courses method only plays the Birds whose scores are not cached."""
+        configured_app._fitness_cache = FitnessCache(MOCK_POPULATION_SIZE)
+        played_scores = np.full((1, 1), MOCK_LIFETIME)
+
+        with (
+            patch("neuroevolution_flappy_bird.flappy_bird_app.PopulationNetwork"),
+            patch.object(
+                configured_app, "_play_courses", return_value=(played_scores, "lifetime")
+            ) as mock_play_courses,
+        ):
+            # Every Bird has the same mocked network, so one Bird is played and all of them are cached
+            first_scores, first_end = configured_app._evaluate_courses()
+            cached_scores, cached_end = configured_app._evaluate_courses()
+
+        mock_play_courses.assert_called_once()
+        assert mock_play_courses.call_args[0][2] == 1
+        assert first_end == "lifetime"
+        assert np.all(first_scores == MOCK_LIFETIME)
+        assert cached_end == "cached"
+        assert np.array_equal(cached_scores, first_scores)
+
+    def test_step_cached(self, configured_app: FlappyBirdApp, mock_ga: MagicMock) -> None:
+        """Test step method trains a whole generation from the fitness cache instead of playing the Course on screen."""
+        generations = 3
+        configured_app._fitness_cache = FitnessCache(MOCK_POPULATION_SIZE)
+        configured_app._fixed_course = True
+
+        with (
+            patch("neuroevolution_flappy_bird.flappy_bird_app.PopulationNetwork"),
+            patch.object(
+                configured_app, "_play_courses", return_value=(np.full((1, 1), MOCK_LIFETIME), "lifetime")
+            ) as mock_play_courses,
+        ):
+            for _ in range(generations):
+                configured_app.step()
+
+        # Every Bird has the same mocked network on the same Course, so only the first generation is played
+        mock_play_courses.assert_called_once()
+        mock_ga.update_birds.assert_not_called()
+        assert mock_ga._evolve.call_count == generations
+        assert configured_app._generation_ends == ["lifetime", "cached", "cached"]
+        assert configured_app._game_counter == 0
+
+    def test_evaluate_courses_duplicates(self, configured_app: FlappyBirdApp) -> None:
+        """Test _evaluate_courses method plays Birds sharing a genome once and gives them the same scores."""
+        configured_app._fitness_cache = FitnessCache(MOCK_POPULATION_SIZE)
+        played_scores = np.array([[3, 7]])
+
+        with (
+            patch("neuroevolution_flappy_bird.flappy_bird_app.PopulationNetwork"),
+            patch.object(
+                FitnessCache, "key", side_effect=[bytes([_bird % 2]) for _bird in range(MOCK_POPULATION_SIZE)]
+            ),
+            patch.object(configured_app, "_play_courses", return_value=(played_scores, "extinct")) as mock_play_courses,
+        ):
+            course_scores, end = configured_app._evaluate_courses()
+
+        _, _, num_birds, _, cached_scores, copies = mock_play_courses.call_args[0]
+        assert num_birds == played_scores.size
+        assert cached_scores.shape == (1, 0)
+        assert copies.tolist() == [MOCK_POPULATION_SIZE // 2, MOCK_POPULATION_SIZE // 2]
+        assert end == "extinct"
+        assert course_scores.tolist() == [[3, 7] * (MOCK_POPULATION_SIZE // 2)]
+
+    @pytest.mark.parametrize(("copies", "expected_end"), [(np.array([1, 1]), "elite"), (np.array([3, 1]), None)])
+    def test_world_end_copies(
+        self, configured_app: FlappyBirdApp, copies: np.ndarray, expected_end: str | None
+    ) -> None:
+        """Test _world_end method counts every Bird sharing the genome of an alive Bird as alive."""
+        configured_app._cutoff_policy = "elite"
+        configured_app._elite_count = MOCK_ELITE_COUNT
+        world = MagicMock()
+        world._frame = 1
+        world._num_frames = MOCK_LIFETIME
+        world._alive = np.array([[True, False]])
+
+        assert configured_app._world_end(world, np.zeros((1, 0)), copies) == expected_end
@@ -0,0 +1,43 @@
+"""Unit tests for the neuroevolution_flappy_bird.main module."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from neuroevolution_flappy_bird.main import run
+
+MOCK_HOST = "127.0.0.1"
+MOCK_PORT = 9000
+HEADLESS_MODULES = [
+    "neuroevolution_flappy_bird.main",
+    "neuroevolution_flappy_bird.sweep",
+    "neuroevolution_flappy_bird.distributed",
+]
+
+
+def test_headless_modules_import_without_pygame() -> None:
+    """Test the training, sweep and worker entry points import without loading pygame."""
+    _code = "import sys; sys.modules['pygame'] = None; " + "; ".join(f"import {_name}" for _name in HEADLESS_MODULES)
+    result = subprocess.run([sys.executable, "-c", _code], capture_output=True, text=True, check=False)  # noqa: S603
+    assert result.returncode == 0, result.stderr
+
+
+def test_worker_without_config(tmp_path: Path) -> None:
+    """Test the worker subcommand runs without a configuration file, as the coordinator sends every setting."""
+    argv = [
+        "flappy-bird",
+        "--config",
+        str(tmp_path / "missing.json"),
+        "worker",
+        "--connect",
+        f"{MOCK_HOST}:{MOCK_PORT}",
+    ]
+
+    with (
+        patch.object(sys, "argv", argv),
+        patch("neuroevolution_flappy_bird.distributed.run_worker", return_value=0) as mock_run_worker,
+    ):
+        run()
+
+    mock_run_worker.assert_called_once_with(MOCK_HOST, MOCK_PORT)
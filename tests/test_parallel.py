@@ -0,0 +1,133 @@
+"""Unit tests for the neuroevolution_flappy_bird.parallel module."""
+
+import itertools
+import sys
+from collections.abc import Generator
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.inference.network import PolicyNetwork, PopulationNetwork
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.objects.world import World
+from neuroevolution_flappy_bird.parallel import (
+    GIL_THREADS,
+    ChunkedStepper,
+    chunk_slices,
+    default_threads,
+    free_threaded,
+)
+
+MOCK_SEED = 123
+MOCK_NUM_COURSES = 2
+MOCK_NUM_BIRDS = 7
+MOCK_NUM_THREADS = 3
+MOCK_X_LIM = 500
+MOCK_Y_LIM = 800
+MOCK_FPS = 60
+MOCK_NUM_FRAMES = 600
+MOCK_BIRD_X = 40
+MOCK_BIRD_Y = 250
+MOCK_BIRD_SIZE = 40
+MOCK_TIMESTEP = 2
+MOCK_LAYER_SIZES = [5, 4, 2]
+MOCK_CPUS = 8
+
+
+def create_world() -> World:
+    """Create a mock World."""
+    return World(
+        [
+            Course.generate(Course.generation_seed(MOCK_SEED, 1, _index), MOCK_Y_LIM, MOCK_FPS, MOCK_NUM_FRAMES)
+            for _index in range(MOCK_NUM_COURSES)
+        ],
+        MOCK_NUM_BIRDS,
+        MOCK_X_LIM,
+        MOCK_Y_LIM,
+        MOCK_NUM_FRAMES,
+        MOCK_BIRD_X,
+        MOCK_BIRD_Y,
+        MOCK_BIRD_SIZE,
+        MOCK_TIMESTEP,
+    )
+
+
+@pytest.fixture
+def network() -> PopulationNetwork:
+    """Mock PopulationNetwork with random networks."""
+    _rng = np.random.default_rng(MOCK_SEED)
+    return PopulationNetwork.from_networks(
+        [
+            PolicyNetwork(
+                [_rng.uniform(-1, 1, size=(_out, _in)) for _in, _out in itertools.pairwise(MOCK_LAYER_SIZES)],
+                [_rng.uniform(-1, 1, size=_out) for _out in MOCK_LAYER_SIZES[1:]],
+                ["relu", "linear"],
+            )
+            for _ in range(MOCK_NUM_BIRDS)
+        ]
+    )
+
+
+@pytest.fixture
+def stepper() -> Generator[ChunkedStepper]:
+    """Mock ChunkedStepper instance."""
+    _stepper = ChunkedStepper(MOCK_NUM_THREADS)
+    yield _stepper
+    _stepper.shutdown()
+
+
+def test_chunk_slices() -> None:
+    """Test the chunks cover every Bird once with nearly equal sizes."""
+    chunks = chunk_slices(MOCK_NUM_BIRDS, MOCK_NUM_THREADS)
+
+    assert chunks == [slice(0, 2), slice(2, 4), slice(4, 7)]
+
+
+def test_chunk_slices_few_birds() -> None:
+    """Test there are no empty chunks when there are fewer Birds than chunks."""
+    assert chunk_slices(2, MOCK_NUM_THREADS) == [slice(0, 1), slice(1, 2)]
+
+
+@pytest.mark.parametrize(("gil_enabled", "expected_threads"), [(True, GIL_THREADS), (False, MOCK_CPUS)])
+def test_default_threads(monkeypatch: pytest.MonkeyPatch, *, gil_enabled: bool, expected_threads: int) -> None:
+    """Test every CPU is used only when the GIL is disabled."""
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: gil_enabled, raising=False)
+    monkeypatch.setattr("os.cpu_count", lambda: MOCK_CPUS)
+
+    assert free_threaded() is not gil_enabled
+    assert default_threads() == expected_threads
+
+
+def test_free_threaded_old_python(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test Python versions without the free-threaded build count as having the GIL."""
+    monkeypatch.delattr(sys, "_is_gil_enabled", raising=False)
+
+    assert not free_threaded()
+
+
+class TestChunkedStepper:
+    """Unit tests for the ChunkedStepper class."""
+
+    def test_num_threads_default(self) -> None:
+        """Test 0 threads picks the default number of threads."""
+        stepper = ChunkedStepper(0)
+        assert stepper.num_threads == default_threads()
+        stepper.shutdown()
+
+    def test_step_matches_world(self, stepper: ChunkedStepper, network: PopulationNetwork) -> None:
+        """Test stepping in chunks plays the same game as World.step_policy."""
+        serial_world = create_world()
+        chunked_world = create_world()
+        chunks = chunk_slices(MOCK_NUM_BIRDS, stepper.num_threads)
+        networks = [network.select(_birds) for _birds in chunks]
+
+        while not serial_world.done:
+            serial_jumps = serial_world.step_policy(network.jumps)
+            chunked_jumps = stepper.step(chunked_world, networks, chunks)
+            assert np.array_equal(chunked_jumps, serial_jumps)
+
+        assert chunked_world.done
+        assert chunked_world._frame == serial_world._frame
+        assert np.array_equal(chunked_world._y, serial_world._y)
+        assert np.array_equal(chunked_world._alive, serial_world._alive)
+        assert np.array_equal(chunked_world._score, serial_world._score)
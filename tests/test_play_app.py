@@ -0,0 +1,106 @@
+"""Unit tests for the neuroevolution_flappy_bird.play_app module."""
+
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.play_app import PlayApp, play_game
+
+MOCK_NAME = "Flappy Bird"
+MOCK_WIDTH = 500
+MOCK_HEIGHT = 800
+MOCK_FPS = 60
+MOCK_FONT = "Arial"
+MOCK_FONT_SIZE = 20
+MOCK_FONT_PATH = "/fonts/arial.ttf"
+MOCK_LIFETIME = 10
+MOCK_BIRD_X = 40
+MOCK_BIRD_Y = 250
+MOCK_BIRD_SIZE = 40
+MOCK_COURSE_SEED = 42
+MOCK_SECOND_GAME = 2
+
+
+@pytest.fixture
+def mock_network() -> MagicMock:
+    """Mock PolicyNetwork which never jumps."""
+    network = MagicMock()
+    network.precision = "float64"
+    network.jumps.side_effect = lambda observations: np.zeros(observations.shape[:-1], dtype=bool)
+    return network
+
+
+@pytest.fixture
+def app(mock_network: MagicMock) -> PlayApp:
+    """Mock PlayApp instance with a network."""
+    app = PlayApp(
+        name=MOCK_NAME,
+        width=MOCK_WIDTH,
+        height=MOCK_HEIGHT,
+        fps=MOCK_FPS,
+        font=MOCK_FONT,
+        font_size=MOCK_FONT_SIZE,
+    )
+    app.add_network(mock_network, MOCK_LIFETIME, MOCK_BIRD_X, MOCK_BIRD_Y, MOCK_BIRD_SIZE, MOCK_COURSE_SEED)
+    return app
+
+
+@pytest.fixture
+def mock_pygame_draw_rect() -> Generator[MagicMock]:
+    """Mock pygame.draw.rect function."""
+    with patch("pygame.draw.rect") as mock:
+        yield mock
+
+
+def test_play_game(app: PlayApp, mock_network: MagicMock) -> None:
+    """Test play_game plays until the Bird falls off the screen."""
+    world = app.create_world(1)
+    score = play_game(mock_network, world)
+    assert world.done
+    assert score == world._score[0, 0] > 0
+
+
+class TestPlayApp:
+    """Unit tests for the PlayApp class."""
+
+    def test_add_network(self, app: PlayApp, mock_network: MagicMock) -> None:
+        """Test add_network method starts the first game."""
+        assert app._network == mock_network
+        assert app._course_seed == MOCK_COURSE_SEED
+        assert app._game == 1
+        assert app._world._num_frames == MOCK_LIFETIME * MOCK_FPS
+
+    def test_create_world(self, app: PlayApp) -> None:
+        """Test create_world method uses a new Course for each game."""
+        world = app.create_world(MOCK_SECOND_GAME)
+        course = Course.generate(
+            Course.generation_seed(MOCK_COURSE_SEED, MOCK_SECOND_GAME), MOCK_HEIGHT, MOCK_FPS, MOCK_LIFETIME * MOCK_FPS
+        )
+        assert world._y.size == 1
+        assert np.array_equal(world._top_heights[0], course.top_heights)
+
+    def test_update(self, app: PlayApp, mock_pygame_draw_rect: MagicMock) -> None:
+        """Test update method steps the World and draws the Pipes and Bird."""
+        app._display_surf = MagicMock()
+        app.write_text = MagicMock()  # type: ignore[method-assign]
+
+        app.update()
+
+        assert app._world._frame == 1
+        assert mock_pygame_draw_rect.call_count == 2 * app._world.pipe_xs.size + 1
+        app.write_text.assert_called()
+
+    def test_update_new_game(self, app: PlayApp, mock_pygame_draw_rect: MagicMock) -> None:
+        """Test update method starts a new game when the Bird dies."""
+        app._display_surf = MagicMock()
+        app.write_text = MagicMock()  # type: ignore[method-assign]
+        app._world._alive[:] = False
+        app._world._score[:] = MOCK_FPS
+
+        app.update()
+
+        assert app._game == MOCK_SECOND_GAME
+        assert app._best_score == MOCK_FPS
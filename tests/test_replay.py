@@ -0,0 +1,133 @@
+"""Unit tests for the neuroevolution_flappy_bird.replay module."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.objects.course import Course
+from neuroevolution_flappy_bird.replay import Replay, ReplayRecorder
+
+MOCK_SEED = 123
+MOCK_NUM_STEPS = 300
+MOCK_NUM_BIRDS = 12
+MOCK_X_LIM = 500
+MOCK_Y_LIM = 800
+MOCK_FPS = 60
+MOCK_NUM_FRAMES = 600
+MOCK_TIMESTEP = 2
+MOCK_BIRD_X = 40
+MOCK_BIRD_Y = 250
+MOCK_BIRD_SIZE = 40
+MOCK_GENERATION = 5
+MOCK_BIRDS = [2, 7]
+MOCK_JUMP_PROBABILITY = 0.1
+
+
+@pytest.fixture
+def jumps() -> np.ndarray:
+    """Mock jump decisions for every Bird on every step."""
+    return np.random.default_rng(MOCK_SEED).random((MOCK_NUM_STEPS, MOCK_NUM_BIRDS)) < MOCK_JUMP_PROBABILITY
+
+
+@pytest.fixture
+def replay(jumps: np.ndarray) -> Replay:
+    """Mock Replay instance."""
+    return Replay(
+        jumps,
+        MOCK_SEED,
+        MOCK_X_LIM,
+        MOCK_Y_LIM,
+        MOCK_FPS,
+        MOCK_NUM_FRAMES,
+        MOCK_TIMESTEP,
+        MOCK_BIRD_X,
+        MOCK_BIRD_Y,
+        MOCK_BIRD_SIZE,
+        np.arange(MOCK_NUM_BIRDS),
+        MOCK_GENERATION,
+    )
+
+
+class TestReplay:
+    """Unit tests for the Replay class."""
+
+    def test_properties(self, replay: Replay) -> None:
+        """Test num_steps and num_birds properties."""
+        assert replay.num_steps == MOCK_NUM_STEPS
+        assert replay.num_birds == MOCK_NUM_BIRDS
+
+    def test_save_and_load(self, replay: Replay, tmp_path: Path) -> None:
+        """Test a saved Replay loads with the same contents."""
+        filepath = str(tmp_path / "replay.npz")
+        replay.save(filepath)
+        loaded = Replay.load(filepath)
+
+        assert np.array_equal(loaded._jumps, replay._jumps)
+        assert np.array_equal(loaded._scores, replay._scores)
+        assert loaded._course_seed == MOCK_SEED
+        assert loaded._num_frames == MOCK_NUM_FRAMES
+        assert loaded._timestep == MOCK_TIMESTEP
+        assert loaded._generation == MOCK_GENERATION
+
+    def test_save_is_compact(self, replay: Replay, tmp_path: Path) -> None:
+        """Test a saved Replay stores the jump decisions as packed bits."""
+        filepath = str(tmp_path / "replay.npz")
+        replay.save(filepath)
+        with np.load(filepath) as replay_file:
+            assert replay_file["jumps"].nbytes == -(-MOCK_NUM_STEPS * MOCK_NUM_BIRDS // 8)
+
+    def test_create_world(self, replay: Replay) -> None:
+        """Test create_world method uses the recorded Course."""
+        world = replay.create_world()
+        course = Course.generate(MOCK_SEED, MOCK_Y_LIM, MOCK_FPS, MOCK_NUM_FRAMES)
+        assert np.array_equal(world._top_heights[0], course.top_heights)
+        assert world._y.size == MOCK_NUM_BIRDS
+        assert world._timestep == MOCK_TIMESTEP
+
+    def test_simulate(self, replay: Replay, jumps: np.ndarray) -> None:
+        """Test simulate method matches stepping a World with the recorded jumps."""
+        ys, alive, scores = replay.simulate()
+
+        world = replay.create_world()
+        for step in range(MOCK_NUM_STEPS):
+            world.step(jumps[step, None])
+            assert np.array_equal(ys[step], world._y[0])
+            assert np.array_equal(alive[step], world._alive[0])
+        assert np.array_equal(scores, world._score[0])
+
+
+class TestReplayRecorder:
+    """Unit tests for the ReplayRecorder class."""
+
+    def test_record_and_create_replay(self, jumps: np.ndarray) -> None:
+        """Test create_replay method keeps the recorded jumps of the selected Birds."""
+        recorder = ReplayRecorder()
+        for step_jumps in jumps:
+            recorder.record(step_jumps)
+
+        replay = recorder.create_replay(
+            np.array(MOCK_BIRDS),
+            Course.generate(MOCK_SEED, MOCK_Y_LIM, MOCK_FPS, MOCK_NUM_FRAMES),
+            MOCK_X_LIM,
+            MOCK_Y_LIM,
+            MOCK_FPS,
+            MOCK_NUM_FRAMES,
+            MOCK_TIMESTEP,
+            MOCK_BIRD_X,
+            MOCK_BIRD_Y,
+            MOCK_BIRD_SIZE,
+            np.arange(MOCK_NUM_BIRDS),
+            MOCK_GENERATION,
+        )
+
+        assert np.array_equal(replay._jumps, jumps[:, MOCK_BIRDS])
+        assert replay._scores.tolist() == MOCK_BIRDS
+        assert replay._course_seed == MOCK_SEED
+
+    def test_reset(self) -> None:
+        """Test reset method clears the recorded steps."""
+        recorder = ReplayRecorder()
+        recorder.record(np.ones(MOCK_NUM_BIRDS, dtype=bool))
+        recorder.reset()
+        assert recorder._jumps == []
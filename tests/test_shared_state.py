@@ -0,0 +1,127 @@
+"""Unit tests for the neuroevolution_flappy_bird.shared_state module."""
+
+import os
+from collections.abc import Generator
+from multiprocessing.shared_memory import SharedMemory
+from typing import cast
+
+import numpy as np
+import pytest
+
+from neuroevolution_flappy_bird.shared_state import SharedStateReader, SharedStateWriter, segment_size
+
+MOCK_NAME = f"flappy_bird_test_{os.getpid()}"
+MOCK_POPULATION_SIZE = 6
+MOCK_MAX_PIPES = 2
+MOCK_GENERATION = 3
+MOCK_FRAME = 42
+MOCK_Y = np.arange(MOCK_POPULATION_SIZE, dtype=float) * 10
+MOCK_VELOCITY = -np.arange(MOCK_POPULATION_SIZE, dtype=float)
+MOCK_ALIVE = np.arange(MOCK_POPULATION_SIZE) % 2 == 0
+MOCK_SCORE = np.arange(MOCK_POPULATION_SIZE) * 5
+MOCK_PIPE_X = np.array([100.0, 300.0, 500.0])
+MOCK_PIPE_TOP_HEIGHT = np.array([250.0, 350.0, 450.0])
+MOCK_FITNESS = np.linspace(0, 1, MOCK_POPULATION_SIZE)
+
+
+@pytest.fixture
+def writer() -> Generator[SharedStateWriter]:
+    """Mock SharedStateWriter instance."""
+    _writer = SharedStateWriter(MOCK_NAME, MOCK_POPULATION_SIZE, MOCK_MAX_PIPES)
+    yield _writer
+    _writer.close()
+
+
+@pytest.fixture
+def reader(writer: SharedStateWriter) -> Generator[SharedStateReader]:
+    """Mock SharedStateReader attached to the mock writer's segment."""
+    _reader = SharedStateReader(writer.name)
+    yield _reader
+    _reader.close()
+
+
+def write_mock_frame(writer: SharedStateWriter) -> None:
+    """Write the mock frame.
+
+    :param SharedStateWriter writer: Writer to write the frame with
+    """
+    writer.write_frame(
+        MOCK_GENERATION, MOCK_FRAME, MOCK_Y, MOCK_VELOCITY, MOCK_ALIVE, MOCK_SCORE, MOCK_PIPE_X, MOCK_PIPE_TOP_HEIGHT
+    )
+
+
+class TestSharedState:
+    """Unit tests for the SharedStateWriter and SharedStateReader classes."""
+
+    def test_write_frame(self, writer: SharedStateWriter, reader: SharedStateReader) -> None:
+        """Test frames written to the segment are read back, keeping the Pipes that fit."""
+        write_mock_frame(writer)
+
+        snapshot = reader.snapshot()
+
+        assert snapshot["generation"] == MOCK_GENERATION
+        assert snapshot["frame"] == MOCK_FRAME
+        assert snapshot["num_pipes"] == MOCK_MAX_PIPES
+        assert np.array_equal(snapshot["y"], MOCK_Y)
+        assert np.array_equal(snapshot["velocity"], MOCK_VELOCITY)
+        assert np.array_equal(snapshot["alive"], MOCK_ALIVE)
+        assert np.array_equal(snapshot["score"], MOCK_SCORE)
+        assert np.array_equal(snapshot["pipe_x"], MOCK_PIPE_X[:MOCK_MAX_PIPES])
+        assert np.array_equal(snapshot["pipe_top_height"], MOCK_PIPE_TOP_HEIGHT[:MOCK_MAX_PIPES])
+
+    def test_write_frame_fewer_birds(self, writer: SharedStateWriter, reader: SharedStateReader) -> None:
+        """Test frames with fewer Birds than the population are trimmed to the Birds written."""
+        writer.write_frame(
+            MOCK_GENERATION,
+            MOCK_FRAME,
+            MOCK_Y[:2],
+            MOCK_VELOCITY[:2],
+            MOCK_ALIVE[:2],
+            MOCK_SCORE[:2],
+            MOCK_PIPE_X[:0],
+            MOCK_PIPE_TOP_HEIGHT[:0],
+        )
+
+        snapshot = reader.snapshot()
+
+        assert np.array_equal(snapshot["y"], MOCK_Y[:2])
+        assert cast(np.ndarray, snapshot["pipe_x"]).size == 0
+
+    def test_write_fitness(self, writer: SharedStateWriter, reader: SharedStateReader) -> None:
+        """Test the fitness of a finished generation is read back and each update advances the sequence by 2."""
+        write_mock_frame(writer)
+        writer.write_fitness(MOCK_GENERATION, MOCK_FITNESS)
+
+        snapshot = reader.snapshot()
+
+        assert snapshot["fitness_generation"] == MOCK_GENERATION
+        assert np.array_equal(snapshot["fitness"], MOCK_FITNESS)
+        assert reader.sequence == writer.sequence == 2 * 2
+
+    def test_reader_is_read_only(self, reader: SharedStateReader) -> None:
+        """Test the reader's views of the segment cannot be written to."""
+        with pytest.raises(ValueError, match="read-only"):
+            reader._arrays["y"][0] = 1
+
+    def test_snapshot_waits_for_writer(self, writer: SharedStateWriter, reader: SharedStateReader) -> None:
+        """Test snapshot method does not return a state while an update is being written."""
+        write_mock_frame(writer)
+        writer._begin()
+        sequences = iter([writer.sequence, writer.sequence + 1, writer.sequence + 1])
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(SharedStateReader, "sequence", property(lambda _: next(sequences)))
+            writer._end()
+
+            snapshot = reader.snapshot()
+
+        assert snapshot["frame"] == MOCK_FRAME
+
+    def test_reader_rejects_other_segments(self) -> None:
+        """Test the reader does not attach to a segment it did not write."""
+        memory = SharedMemory(f"{MOCK_NAME}_other", create=True, size=segment_size(MOCK_POPULATION_SIZE, 0))
+        try:
+            with pytest.raises(ValueError, match="SharedStateWriter"):
+                SharedStateReader(memory.name)
+        finally:
+            memory.close()
+            memory.unlink()
@@ -0,0 +1,171 @@
+"""Unit tests for the neuroevolution_flappy_bird.status module."""
+
+import json
+from collections.abc import Generator
+from http import HTTPStatus
+from unittest.mock import patch
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from neuroevolution_flappy_bird.status import PhaseTimer, StatusServer, TrainingStatus, peak_memory
+
+MOCK_GENERATION = 7
+MOCK_ALIVE = 12
+MOCK_MAXRSS = 4096
+MOCK_PHASE_SECONDS = {"birds": 0.5, "evolve": 0.25}
+MOCK_LAYER_VARIANCE = {"0": 0.125}
+MOCK_METRICS = {
+    "generation": MOCK_GENERATION,
+    "alive": MOCK_ALIVE,
+    "phase_seconds": MOCK_PHASE_SECONDS,
+    "diversity_layer_variance": MOCK_LAYER_VARIANCE,
+}
+MOCK_SPEED = 4.0
+MOCK_TIMEOUT = 5
+
+
+@pytest.fixture
+def status() -> TrainingStatus:
+    """Mock TrainingStatus instance with published metrics."""
+    _status = TrainingStatus()
+    _status.publish(MOCK_METRICS)
+    return _status
+
+
+@pytest.fixture
+def server(status: TrainingStatus) -> Generator[StatusServer]:
+    """Running StatusServer on a free port."""
+    _server = StatusServer(status, 0)
+    _server.start()
+    yield _server
+    _server.stop()
+
+
+def request(server: StatusServer, path: str, method: str = "GET") -> tuple[int, str]:
+    """Send a request to the status server.
+
+    :param StatusServer server: Server to send the request to
+    :param str path: Request path
+    :param str method: HTTP method
+    :return tuple[int, str]: Status code and response body
+    """
+    _request = Request(f"http://127.0.0.1:{server.port}{path}", method=method)
+    try:
+        with urlopen(_request, timeout=MOCK_TIMEOUT) as response:  # noqa: S310
+            return response.status, response.read().decode()
+    except HTTPError as error:
+        return error.code, error.read().decode()
+
+
+def test_peak_memory() -> None:
+    """Test peak_memory function reports a positive number of bytes."""
+    assert peak_memory() > 0
+
+
+@pytest.mark.parametrize(("platform", "expected_bytes"), [("linux", MOCK_MAXRSS * 1024), ("darwin", MOCK_MAXRSS)])
+def test_peak_memory_units(platform: str, expected_bytes: int) -> None:
+    """Test peak_memory function converts kilobytes to bytes everywhere but macOS, which reports bytes."""
+    with (
+        patch("neuroevolution_flappy_bird.status.sys.platform", platform),
+        patch("neuroevolution_flappy_bird.status.resource.getrusage") as mock_getrusage,
+    ):
+        mock_getrusage.return_value.ru_maxrss = MOCK_MAXRSS
+        assert peak_memory() == expected_bytes
+
+
+class TestPhaseTimer:
+    """Unit tests for the PhaseTimer class."""
+
+    def test_phase(self) -> None:
+        """Test phase method adds up the time of every block in a phase."""
+        timer = PhaseTimer()
+        with timer.phase("birds"):
+            pass
+        first = timer.totals["birds"]
+        with timer.phase("birds"):
+            pass
+
+        assert timer.totals["birds"] >= first > 0
+        timer.reset()
+        assert timer.totals == {}
+
+
+class TestTrainingStatus:
+    """Unit tests for the TrainingStatus class."""
+
+    def test_pause(self, status: TrainingStatus) -> None:
+        """Test pause method."""
+        status.pause()
+        assert status.paused
+
+    def test_resume(self, status: TrainingStatus) -> None:
+        """Test resume method lets a paused run continue."""
+        status.pause()
+        status.resume()
+        assert not status.paused
+        status.wait_until_resumed()
+
+    def test_to_prometheus(self, status: TrainingStatus) -> None:
+        """Test to_prometheus method writes a sample for every metric and phase."""
+        lines = status.to_prometheus().splitlines()
+
+        assert f"flappy_bird_generation {MOCK_GENERATION}" in lines
+        assert f"flappy_bird_alive {MOCK_ALIVE}" in lines
+        assert 'flappy_bird_phase_seconds{phase="birds"} 0.5' in lines
+        assert 'flappy_bird_diversity_layer_variance{layer="0"} 0.125' in lines
+        assert "flappy_bird_paused 0" in lines
+        assert "# TYPE flappy_bird_generation gauge" in lines
+
+
+class TestStatusServer:
+    """Unit tests for the StatusServer class."""
+
+    def test_status(self, server: StatusServer) -> None:
+        """Test the status endpoint returns the published metrics as JSON."""
+        code, body = request(server, "/status")
+
+        assert code == HTTPStatus.OK
+        assert json.loads(body) == {**MOCK_METRICS, "paused": False, "speed": 1.0}
+
+    def test_metrics(self, server: StatusServer) -> None:
+        """Test the metrics endpoint returns the Prometheus text format."""
+        code, body = request(server, "/metrics")
+
+        assert code == HTTPStatus.OK
+        assert body == server.status.to_prometheus()
+
+    def test_pause_control(self, server: StatusServer) -> None:
+        """Test the pause endpoint pauses training."""
+        request(server, "/pause", "POST")
+        assert server.status.paused
+
+    def test_resume_control(self, server: StatusServer) -> None:
+        """Test the resume endpoint resumes paused training."""
+        server.status.pause()
+        request(server, "/resume", "POST")
+        assert not server.status.paused
+
+    def test_speed_control(self, server: StatusServer) -> None:
+        """Test the speed endpoint sets the speed multiplier."""
+        code, body = request(server, f"/speed?multiplier={MOCK_SPEED}", "POST")
+        assert code == HTTPStatus.OK
+        assert json.loads(body)["speed"] == server.status.speed == MOCK_SPEED
+
+    @pytest.mark.parametrize(
+        ("path", "method", "expected_code"),
+        [
+            ("/unknown", "GET", HTTPStatus.NOT_FOUND),
+            ("/unknown", "POST", HTTPStatus.NOT_FOUND),
+            ("/speed", "POST", HTTPStatus.BAD_REQUEST),
+            ("/speed?multiplier=fast", "POST", HTTPStatus.BAD_REQUEST),
+            ("/speed?multiplier=0", "POST", HTTPStatus.BAD_REQUEST),
+        ],
+    )
+    def test_invalid_requests(self, server: StatusServer, path: str, method: str, expected_code: HTTPStatus) -> None:
+        """Test invalid requests are rejected without changing the speed."""
+        code, _ = request(server, path, method)
+
+        assert code == expected_code
+        assert server.status.speed == 1.0
@@ -0,0 +1,175 @@
+"""Unit tests for the neuroevolution_flappy_bird.sweep module."""
+
+import csv
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from neuroevolution_flappy_bird.sweep import (
+    SUMMARY_FIELDS,
+    format_summary,
+    grid_search,
+    random_search,
+    run_sweep,
+    train_run,
+    write_summary,
+)
+
+MOCK_APP_CONFIG = {
+    "name": "Flappy Bird",
+    "width": 500,
+    "height": 800,
+    "fps": 60,
+    "font": "freesansbold.ttf",
+    "font_size": 24,
+}
+MOCK_GA_CONFIG = {
+    "population_size": 10,
+    "mutation_rate": 0.03,
+    "lifetime": 10,
+    "bird_x": 40,
+    "bird_y": 250,
+    "bird_size": 40,
+    "hidden_layer_sizes": [8],
+    "weights_range": [-1, 1],
+    "bias_range": [-0.3, 0.3],
+    "course_seed": 1,
+}
+MOCK_PARAMETERS: dict[str, list[Any]] = {
+    "population_size": [10, 20],
+    "mutation_rate": [0.01, 0.1],
+    "hidden_layer_sizes": [[4], [4, 4]],
+    "weights_range": [[-1, 1]],
+    "bias_range": [[-0.3, 0.3]],
+    "optimiser": ["ga"],
+}
+MOCK_MUTATION_RATE_RANGE: dict[str, float] = {"low": 0.01, "high": 0.1}
+MOCK_POPULATION_SIZE_RANGE: dict[str, float] = {"low": 10, "high": 12}
+MOCK_GENERATIONS = 2
+MOCK_BEST_SCORES = [10, 30]
+MOCK_MEAN_SCORES = [5.0, 12.5]
+
+
+@pytest.fixture
+def mock_flappy_bird_app() -> Generator[MagicMock]:
+    """Mock FlappyBirdApp class."""
+    with patch("neuroevolution_flappy_bird.sweep.FlappyBirdApp") as mock:
+        mock.return_value._best_scores = MOCK_BEST_SCORES
+        mock.return_value._mean_scores = MOCK_MEAN_SCORES
+        yield mock
+
+
+@pytest.fixture
+def results() -> list[dict[str, Any]]:
+    """Mock sweep results."""
+    return [
+        {
+            **{_name: _values[0] for _name, _values in MOCK_PARAMETERS.items()},
+            "best_score": 30,
+            "best_generation": 2,
+            "final_best_score": 30,
+            "final_mean_score": 12.5,
+            "seconds": 1.5,
+        }
+    ]
+
+
+class TestSearch:
+    """Unit tests for the search functions."""
+
+    def test_grid_search(self) -> None:
+        """Test grid_search function."""
+        runs = grid_search(MOCK_PARAMETERS)
+        expected_num_runs = 8
+        assert len(runs) == expected_num_runs
+        assert len({str(run) for run in runs}) == expected_num_runs
+        for run in runs:
+            for name, value in run.items():
+                assert value in MOCK_PARAMETERS[name]
+
+    def test_random_search(self) -> None:
+        """Test random_search function."""
+        num_samples = 5
+        parameters: dict[str, list[Any] | dict[str, float]] = {
+            **MOCK_PARAMETERS,
+            "mutation_rate": MOCK_MUTATION_RATE_RANGE,
+        }
+
+        runs = random_search(parameters, num_samples, seed=1)
+
+        assert len(runs) == num_samples
+        assert runs == random_search(parameters, num_samples, seed=1)
+        for run in runs:
+            assert MOCK_MUTATION_RATE_RANGE["low"] <= run["mutation_rate"] <= MOCK_MUTATION_RATE_RANGE["high"]
+            assert run["population_size"] in MOCK_PARAMETERS["population_size"]
+
+    def test_random_search_integer_range(self) -> None:
+        """Test random_search function draws integers from a range with integer bounds."""
+        num_samples = 20
+        parameters: dict[str, list[Any] | dict[str, float]] = {"population_size": MOCK_POPULATION_SIZE_RANGE}
+
+        runs = random_search(parameters, num_samples, seed=1)
+
+        assert all(isinstance(run["population_size"], int) for run in runs)
+        assert {run["population_size"] for run in runs} == {10, 11, 12}
+
+
+class TestSweep:
+    """Unit tests for running sweeps."""
+
+    def test_train_run(self, mock_flappy_bird_app: MagicMock) -> None:
+        """Test train_run function."""
+        parameters = {"population_size": 20, "mutation_rate": 0.1}
+
+        result = train_run(MOCK_APP_CONFIG, MOCK_GA_CONFIG, parameters, MOCK_GENERATIONS)
+
+        mock_flappy_bird_app.return_value.run_headless.assert_called_once_with(MOCK_GENERATIONS)
+        add_ga_kwargs = mock_flappy_bird_app.return_value.add_ga.call_args.kwargs
+        assert add_ga_kwargs["population_size"] == parameters["population_size"]
+        assert add_ga_kwargs["mutation_rate"] == parameters["mutation_rate"]
+        assert add_ga_kwargs["lifetime"] == MOCK_GA_CONFIG["lifetime"]
+        assert result["best_score"] == max(MOCK_BEST_SCORES)
+        assert result["best_generation"] == len(MOCK_BEST_SCORES)
+        assert result["optimiser"] is None
+        assert result["final_best_score"] == MOCK_BEST_SCORES[-1]
+        assert result["final_mean_score"] == MOCK_MEAN_SCORES[-1]
+
+    def test_run_sweep(self) -> None:
+        """Test run_sweep function sorts results by best score."""
+        runs = [{"population_size": 10}, {"population_size": 20}]
+
+        def mock_train_run(
+            app_config: dict[str, Any], ga_config: dict[str, Any], parameters: dict[str, Any], generations: int
+        ) -> dict[str, Any]:
+            return {**parameters, "best_score": parameters["population_size"] * generations}
+
+        with (
+            patch("neuroevolution_flappy_bird.sweep.ProcessPoolExecutor", ThreadPoolExecutor),
+            patch("neuroevolution_flappy_bird.sweep.train_run", mock_train_run),
+        ):
+            results = run_sweep(MOCK_APP_CONFIG, MOCK_GA_CONFIG, runs, MOCK_GENERATIONS, workers=2)
+
+        assert [result["population_size"] for result in results] == [20, 10]
+
+    def test_write_summary(self, results: list[dict[str, Any]], tmp_path: Path) -> None:
+        """Test write_summary function."""
+        filepath = tmp_path / "sweep.csv"
+        write_summary(results, str(filepath))
+
+        with open(filepath) as summary_file:
+            rows = list(csv.DictReader(summary_file))
+
+        assert len(rows) == len(results)
+        assert list(rows[0]) == SUMMARY_FIELDS
+        assert rows[0]["best_score"] == str(results[0]["best_score"])
+
+    def test_format_summary(self, results: list[dict[str, Any]]) -> None:
+        """Test format_summary function."""
+        lines = format_summary(results).splitlines()
+        assert len(lines) == len(results) + 1
+        assert lines[0].split() == SUMMARY_FIELDS
+        assert "1.5" in lines[1]